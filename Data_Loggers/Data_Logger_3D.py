@@ -31,7 +31,14 @@ import csv
 import io
 import math
 import json
+import threading
+import zlib
+import gzip
+import glob
+import shutil
+import base64
 import mathutils
+import numpy as np
 from bpy.app.handlers import persistent
 
 
@@ -53,9 +60,10 @@ TRANSLATIONS = {
         "uv_tracking": "UV tracking", "uv_pending": "UV pending",
         "uv_changed": "UV hash changed", "active_object": "Active object",
         "mode": "Mode", "warnings": "Latest warnings:",
+        "metrics_cache": "Metrics cache", "metrics_job": "Metrics pending",
         "help_title": "Data Logger 3D — Detailed Help",
         "help_intro": "Records supported Blender workflow events and embeds the log in the .blend file.",
-        "help_save": "Ctrl+S: before saving, temporarily combines all geometry except cameras and lights, calculates one set of mesh metrics, restores the scene unchanged, and embeds the result as data_logger_mesh_metrics.csv.",
+        "help_save": "Ctrl+S: before saving, calculates mesh metrics for the evaluated geometry of every object except cameras and lights, merges them into one scene-level set without modifying the scene, and embeds the result as data_logger_mesh_metrics.csv.",
         "help_metrics": "Metrics: UV area, UV islands, UV stretch, relative UV density that updates when UV islands are scaled, inverted normals, transforms, origin position, non-quads, duplicate vertices, face count, connected components, faces per component, and mean face angle. Similarity is not calculated.",
         "help_privacy": "Pressing Start Logger records consent directly without a popup. UserID can be regenerated and exports can omit it.",
         "help_manual_start": "Recording starts only when Start Logger is pressed. No consent dialog is shown.",
@@ -75,9 +83,10 @@ TRANSLATIONS = {
         "uv_tracking": "Seguimiento UV", "uv_pending": "UV pendiente",
         "uv_changed": "Hash UV modificado", "active_object": "Objeto activo",
         "mode": "Modo", "warnings": "Últimos avisos:",
+        "metrics_cache": "Caché de métricas", "metrics_job": "Métricas pendientes",
         "help_title": "Data Logger 3D — Ayuda detallada",
         "help_intro": "Registra eventos compatibles del flujo de trabajo de Blender e incrusta el registro en el archivo .blend.",
-        "help_save": "Ctrl+S: antes de guardar, combina temporalmente toda la geometría excepto cámaras y luces, calcula un único conjunto de métricas, restaura la escena sin cambios e incrusta el resultado como data_logger_mesh_metrics.csv.",
+        "help_save": "Ctrl+S: antes de guardar, calcula las métricas de la geometría evaluada de cada objeto excepto cámaras y luces, las combina en un único conjunto para la escena sin modificarla e incrusta el resultado como data_logger_mesh_metrics.csv.",
         "help_metrics": "Métricas: área UV, islas UV, estiramiento UV, densidad UV relativa que se actualiza al escalar las islas UV, normales invertidas, transformaciones, posición en el origen, no-quads, vértices duplicados, caras, componentes conectados, caras por componente y ángulo medio entre caras. No se calcula similitud.",
         "help_privacy": "Pulsar Start Logger registra el consentimiento directamente sin mostrar un popup. El UserID puede regenerarse y las exportaciones pueden omitirlo.",
         "help_manual_start": "La grabación solo comienza al pulsar Start Logger. No se muestra ningún diálogo de consentimiento.",
@@ -108,6 +117,36 @@ DATA_TEXTBLOCK = "data_log_internal.csv"
 WARNINGS_TEXTBLOCK = "data_logger_warnings.txt"
 LEGACY_MESH_METRICS_JSON_TEXTBLOCK = "data_logger_mesh_metrics.json"
 MESH_METRICS_CSV_TEXTBLOCK = "data_logger_mesh_metrics.csv"
+BASELINE_TEXTBLOCK = "data_logger_baseline.json"
+BASELINE_FORMAT_VERSION = 1
+MESH_METRICS_CACHE_TEXTBLOCK = "data_logger_mesh_metrics_cache.json"
+MESH_METRICS_HISTORY_TEXTBLOCK = "data_logger_mesh_metrics_history.json"
+MESH_METRICS_HISTORY_FORMAT = 1
+# Rows kept as plain CSV before they are sealed into a compressed chunk.
+MESH_METRICS_HISTORY_CHUNK_ROWS = 64
+# Size at which the shared temporary history CSV is sealed into a gzip file.
+MESH_METRICS_HISTORY_TEMP_MAX_BYTES = 4 * 1024 * 1024
+# Bump whenever mesh_metric_partials() changes what it measures, so partials
+# cached by an older implementation are not merged into new results.
+MESH_METRICS_CACHE_VERSION = 8
+
+# Internal developer switch. This is intentionally not exposed in Blender UI.
+# True: save_pre only snapshots the evaluated mesh buffers; the metrics are
+# computed in a worker thread and embedded by a timer, or at the next save.
+# The .blend written by a save then holds the metrics of the previous one.
+# False: compute and embed the metrics inside save_pre, before the write.
+ASYNC_MESH_METRICS = False
+MESH_METRICS_POLL_INTERVAL = 0.25
+
+# Internal developer switch. Seconds one save may spend on its mesh metrics,
+# from reading the evaluated meshes to the last stage. None: always exact.
+# Extraction and digests are charged first; the remaining stages are then
+# skipped or sampled to fit what is left. Scenes below SAMPLING_MIN_FACES
+# uncached faces are always measured exactly.
+MESH_METRICS_TIME_BUDGET = None
+SAMPLING_MIN_FACES = 200_000
+# Smallest face sample of UV stretch and Angle when the budget is exhausted.
+SAMPLING_MIN_FRACTION = 1.0 / 64.0
 
 SCHEMA_VERSION = "2"
 LOGGER_VERSION = ".".join(str(v) for v in bl_info.get("version", (1, 1, 0)))
@@ -185,13 +224,17 @@ def clear_consent():
 
 
 def clear_logged_data():
-    if DATA_TEXTBLOCK in bpy.data.texts:
-        bpy.data.texts.remove(bpy.data.texts[DATA_TEXTBLOCK])
-    if os.path.exists(TEMP_CSV_PATH):
-        try:
-            os.remove(TEMP_CSV_PATH)
-        except Exception as exc:
-            log_warning("Could not delete the temporary CSV", exc)
+    for name in (DATA_TEXTBLOCK, BASELINE_TEXTBLOCK, MESH_METRICS_HISTORY_TEXTBLOCK):
+        if name in bpy.data.texts:
+            bpy.data.texts.remove(bpy.data.texts[name])
+    root, extension = os.path.splitext(TEMP_MESH_METRICS_HISTORY_CSV_PATH)
+    sealed_history = sorted(glob.glob(f"{glob.escape(root)}.*{extension}.gz"))
+    for path in (TEMP_CSV_PATH, TEMP_MESH_METRICS_HISTORY_CSV_PATH, *sealed_history):
+        if os.path.exists(path):
+            try:
+                os.remove(path)
+            except Exception as exc:
+                log_warning(f"Could not delete the temporary CSV {os.path.basename(path)}", exc)
 
 
 
@@ -210,7 +253,11 @@ _last_timestamp = -1.0
 _force_log_pending = False
 _last_lightweight_signature = None
 _last_idle_full_check = 0.0
-_last_operator_index = 0
+# Identities of the most recent operator history entries already processed.
+# wm.operators is a bounded queue, so its length alone cannot reveal new
+# entries once the history is full.
+_last_operator_tail = ()
+OPERATOR_TAIL_LENGTH = 8
 
 prev_vert_count = 0
 prev_ngon_count = 0
@@ -225,6 +272,14 @@ prev_uv_hash = ""
 prev_snapshot_signature = None
 prev_active_object_name = None
 prev_object_state = (0.0, 0.0, 0.0, 0.0)
+prev_scene_radius = 0.0
+prev_object_records = {}
+
+# Baseline embedded in the .blend by handle_save and validated on load.
+_persisted_object_records = {}
+_persisted_scene_state = None
+# Names of objects and meshes updated since the current baseline was taken.
+_dirty_baseline_ids = set()
 
 operator_flags = {
     "ctrl_v": 0,
@@ -248,6 +303,8 @@ DEBUG_LAST_REBASE_REASON = ""
 DEBUG_UV_HASH_CHANGED = 0
 DEBUG_UV_PENDING = 0
 DEBUG_LAST_FLAGS = "CtrlV=0 ShiftD=0 AltD=0 Merge=0"
+DEBUG_METRICS_CACHE = "hits=0 misses=0"
+DEBUG_METRIC_TIMINGS = {}
 _uv_transform_pending = False
 
 
@@ -255,6 +312,9 @@ _uv_transform_pending = False
 
 TEMP_CSV_PATH = os.path.join(tempfile.gettempdir(), "blender_data_log.csv")
 TEMP_MESH_METRICS_CSV_PATH = os.path.join(tempfile.gettempdir(), "blender_mesh_metrics.csv")
+TEMP_MESH_METRICS_HISTORY_CSV_PATH = os.path.join(
+    tempfile.gettempdir(), "blender_mesh_metrics_history.csv"
+)
 
 CSV_HEADER_V1 = [
     "USER_ID", "TimeStamp", "Minute", "Second",
@@ -915,77 +975,87 @@ def get_realtime_mesh_stats_safe(obj):
         return (0, 0, 0, 0)
 
 
-def get_realtime_geometry_hash_safe():
-    """Stable hash for the live logger without bmesh.from_edit_mesh()."""
-    chunks = []
-    for obj in sorted((o for o in bpy.context.scene.objects if o.type == "MESH"), key=lambda o: o.name):
-        try:
-            mesh = obj.data
-            vertices = tuple((v.index, round(float(v.co.x), 5), round(float(v.co.y), 5), round(float(v.co.z), 5)) for v in mesh.vertices)
-            edges = tuple(tuple(e.vertices) for e in mesh.edges)
-            faces = tuple(tuple(p.vertices) for p in mesh.polygons)
-            chunks.append((obj.name, vertices, edges, faces))
-        except Exception as exc:
-            log_warning(f"Could not calculate safe geometry hash for {getattr(obj, 'name', '?')}", exc)
-            chunks.append((getattr(obj, "name", "?"), "ERROR"))
-    return hashlib.sha256(repr(chunks).encode("utf-8")).hexdigest()
+def _object_geometry_digest(obj):
+    """Digest one object's mesh datablock without bmesh.from_edit_mesh()."""
+    try:
+        mesh = obj.data
+        vertices = tuple((v.index, round(float(v.co.x), 5), round(float(v.co.y), 5), round(float(v.co.z), 5)) for v in mesh.vertices)
+        edges = tuple(tuple(e.vertices) for e in mesh.edges)
+        faces = tuple(tuple(p.vertices) for p in mesh.polygons)
+        return hashlib.sha256(repr((vertices, edges, faces)).encode("utf-8")).hexdigest()
+    except Exception as exc:
+        log_warning(f"Could not calculate safe geometry hash for {getattr(obj, 'name', '?')}", exc)
+        return "ERROR"
 
 
-def get_realtime_uv_coordinate_hash_safe():
-    """Return a cheap UV-coordinate fingerprint for the timer.
+def _object_uv_coordinate_digest(obj):
+    """Return a cheap UV-coordinate fingerprint for one object.
 
     In Edit Mode this intentionally avoids reading every live UV coordinate,
     because large UV selections can make Blender unstable if the timer scans the
     edit BMesh while a transform is finishing. UV transforms are still detected
     through Blender's operator history and logged as UV actions.
     """
+    try:
+        layer = obj.data.uv_layers.active
+        if layer is None:
+            return "NO_UV"
+
+        if safe_mode_of_object(obj) == "EDIT":
+            # Do not scan live UV coordinates from the timer. Keep only a
+            # structural fingerprint; the explicit UV operator flag records
+            # the completed UV edit.
+            return f"EDIT|{layer.name}|{len(layer.data)}"
+
+        hasher = hashlib.sha256()
+        hasher.update(f"OBJECT|{layer.name}|{len(layer.data)}|".encode("utf-8"))
+        for item in layer.data:
+            uv = item.uv
+            hasher.update(f"{float(uv.x):.6f}:{float(uv.y):.6f};".encode("utf-8"))
+        return hasher.hexdigest()
+    except Exception as exc:
+        log_warning(f"Could not calculate safe UV coordinate hash for {getattr(obj, 'name', '?')}", exc)
+        return "ERROR"
+
+
+def _object_uv_topology_digest(obj):
+    try:
+        mesh = obj.data
+        layer = mesh.uv_layers.active
+        edges = tuple((tuple(e.vertices), int(bool(e.use_seam))) for e in mesh.edges)
+        faces = tuple(tuple(sorted(p.vertices)) for p in mesh.polygons)
+        chunk = (len(mesh.vertices), len(mesh.edges), len(mesh.polygons), int(layer is not None), edges, faces)
+        return hashlib.sha256(repr(chunk).encode("utf-8")).hexdigest()
+    except Exception as exc:
+        log_warning(f"Could not calculate safe UV topology hash for {getattr(obj, 'name', '?')}", exc)
+        return "ERROR"
+
+
+def _combine_object_digests(named_digests):
+    """Fold ``(object name, digest)`` pairs into one scene-level hash."""
     hasher = hashlib.sha256()
+    for name, digest in named_digests:
+        hasher.update(f"{name}|{digest};".encode("utf-8"))
+    return hasher.hexdigest()
 
-    for obj in sorted((o for o in bpy.context.scene.objects if o.type == "MESH"), key=lambda o: o.name):
-        try:
-            layer = obj.data.uv_layers.active
-            mode = safe_mode_of_object(obj)
 
-            if layer is None:
-                hasher.update(f"{obj.name}|NO_UV;".encode("utf-8"))
-                continue
+def _scene_mesh_objects():
+    return sorted((o for o in bpy.context.scene.objects if o.type == "MESH"), key=lambda o: o.name)
 
-            if mode == "EDIT":
-                # Do not scan live UV coordinates from the timer. Keep only a
-                # structural fingerprint; the explicit UV operator flag records
-                # the completed UV edit.
-                hasher.update(
-                    f"{obj.name}|EDIT|{layer.name}|{len(layer.data)};".encode("utf-8")
-                )
-                continue
 
-            hasher.update(f"{obj.name}|OBJECT|{layer.name}|{len(layer.data)}|".encode("utf-8"))
-            for item in layer.data:
-                uv = item.uv
-                hasher.update(f"{float(uv.x):.6f}:{float(uv.y):.6f};".encode("utf-8"))
+def get_realtime_geometry_hash_safe():
+    """Stable hash for the live logger without bmesh.from_edit_mesh()."""
+    return _combine_object_digests((obj.name, _object_geometry_digest(obj)) for obj in _scene_mesh_objects())
 
-        except Exception as exc:
-            log_warning(f"Could not calculate safe UV coordinate hash for {getattr(obj, 'name', '?')}", exc)
-            hasher.update(f"{getattr(obj, 'name', '?')}|ERROR;".encode("utf-8"))
 
-    return hasher.hexdigest()
+def get_realtime_uv_coordinate_hash_safe():
+    return _combine_object_digests((obj.name, _object_uv_coordinate_digest(obj)) for obj in _scene_mesh_objects())
 
 
 def get_realtime_uv_hash_safe():
     if not ENABLE_UV_CHANGE_TRACKING:
         return "UV_TRACKING_DISABLED"
-    chunks = []
-    for obj in sorted((o for o in bpy.context.scene.objects if o.type == "MESH"), key=lambda o: o.name):
-        try:
-            mesh = obj.data
-            layer = mesh.uv_layers.active
-            edges = tuple((tuple(e.vertices), int(bool(e.use_seam))) for e in mesh.edges)
-            faces = tuple(tuple(sorted(p.vertices)) for p in mesh.polygons)
-            chunks.append((obj.name, len(mesh.vertices), len(mesh.edges), len(mesh.polygons), int(layer is not None), edges, faces))
-        except Exception as exc:
-            log_warning(f"Could not calculate safe UV topology hash for {getattr(obj, 'name', '?')}", exc)
-            chunks.append((getattr(obj, "name", "?"), "ERROR"))
-    return hashlib.sha256(repr(chunks).encode("utf-8")).hexdigest()
+    return _combine_object_digests((obj.name, _object_uv_topology_digest(obj)) for obj in _scene_mesh_objects())
 
 
 def get_occlusion_state():
@@ -1009,80 +1079,617 @@ def get_occlusion_state():
 
 # MESH METRICS ON SAVE
 
-def _almost_equal_2d(v1, v2, tol=1e-4):
-    return abs(v1.x - v2.x) <= tol and abs(v1.y - v2.y) <= tol
+# Two loops of the same vertex belong to the same UV island when their
+# coordinates agree within this distance (Blender's default UV weld limit).
+UV_ISLAND_TOLERANCE = 1e-4
+# Distance used by Merge by Distance; vertices closer than this are duplicates.
+VERTEX_MERGE_DISTANCE = 1e-4
+# Sampled metrics draw their faces from blocks of this many consecutive face
+# indices, which Blender keeps roughly spatially coherent.
+SAMPLING_STRATUM_FACES = 4096
+# Two-sided 95% normal quantile for the *_ci half-widths.
+SAMPLING_Z = 1.96
+
+# Vertex pairs compared at once when duplicate groups need an exact check.
+_DUPLICATE_PAIR_CHUNK = 1 << 20
+# Half of the 26-cell neighbourhood: every pair of adjacent grid cells is
+# visited exactly once when only these forward offsets are probed.
+_FORWARD_CELL_OFFSETS = np.array(
+    [(0, 0, 0)] + [
+        (dx, dy, dz)
+        for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+        if (dx, dy, dz) > (0, 0, 0)
+    ],
+    dtype=np.int64,
+)
+
+
+def _union_find_labels(count, first, second):
+    """Return ``(labels, components)`` for ``count`` nodes joined by edge pairs.
+
+    Vectorized union-find: every edge hooks the larger of its two roots onto
+    the smaller one, then pointer jumping flattens the forest. Rounds repeat
+    until both ends of every edge share a root, so the Python loop runs a
+    logarithmic number of times instead of once per node.
+    """
+    parent = np.arange(count, dtype=np.int64)
+    first = np.asarray(first, dtype=np.int64)
+    second = np.asarray(second, dtype=np.int64)
+    while first.size:
+        root_a = parent[first]
+        root_b = parent[second]
+        pending = root_a != root_b
+        if not pending.any():
+            break
+        root_a = root_a[pending]
+        root_b = root_b[pending]
+        low = np.minimum(root_a, root_b)
+        np.minimum.at(parent, np.maximum(root_a, root_b), low)
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+        first = first[pending]
+        second = second[pending]
 
+    roots, labels = np.unique(parent, return_inverse=True)
+    return labels.reshape(-1), int(roots.size)
 
-def _uv_polygon_area(uvs):
-    if len(uvs) < 3:
-        return 0.0
-    area = 0.0
-    for i in range(1, len(uvs) - 1):
-        area += abs((uvs[i] - uvs[0]).cross(uvs[i + 1] - uvs[0])) * 0.5
-    return area
 
+def uv_island_labels(loop_faces, loop_verts, loop_uvs, face_count, tol=UV_ISLAND_TOLERANCE):
+    """Label faces by UV island from flat per-loop arrays.
 
-def _count_uv_islands(bm, uv_layer):
-    if uv_layer is None:
-        return 0
-    visited = set()
-    islands = 0
-    for face in bm.faces:
-        if face.index in visited:
+    Two loops of the same vertex are connected when their UVs differ by at
+    most ``tol`` on each axis, like Blender's UV vertex map. Loops are
+    grouped by ``(vertex, floor(u / tol), floor(v / tol))``: loops of one
+    group are always connected, and groups of the same vertex in adjacent
+    bins are checked loop by loop, so UVs on both sides of a bin boundary
+    still join. Returns ``(labels, island_count)`` so per-face values can
+    be aggregated per island with ``np.bincount``.
+    """
+    if face_count == 0:
+        return np.zeros(0, dtype=np.int64), 0
+
+    uvs = np.asarray(loop_uvs, dtype=np.float64).reshape(-1, 2)
+    cells = np.column_stack([np.asarray(loop_verts, dtype=np.int64), np.floor(uvs / tol).astype(np.int64)])
+    order = np.lexsort((cells[:, 2], cells[:, 1], cells[:, 0]))
+    cells = cells[order]
+    sorted_uvs = uvs[order]
+    sorted_faces = np.asarray(loop_faces, dtype=np.int64)[order]
+    shared = (cells[1:] == cells[:-1]).all(axis=1)
+    starts = np.flatnonzero(np.r_[True, ~shared])
+    sizes = np.diff(np.r_[starts, len(cells)])
+
+    group_a, group_b = _adjacent_cell_pairs(cells[starts])
+    # Only bins of the same vertex; the vertex axis of the offsets is ignored.
+    same_vertex = cells[starts[group_a], 0] == cells[starts[group_b], 0]
+    group_a, group_b = group_a[same_vertex], group_b[same_vertex]
+    touching = _groups_touch(
+        sorted_uvs, starts[group_a], sizes[group_a], starts[group_b], sizes[group_b], tol, chebyshev=True,
+    )
+    first = np.concatenate([sorted_faces[:-1][shared], sorted_faces[starts[group_a[touching]]]])
+    second = np.concatenate([sorted_faces[1:][shared], sorted_faces[starts[group_b[touching]]]])
+    return _union_find_labels(face_count, first, second)
+
+
+def _cell_hash(cells):
+    """Fold integer grid cells into one int64 key (wrapping overflow is fine)."""
+    with np.errstate(over="ignore"):
+        return (
+            cells[:, 0] * np.int64(73856093)
+            ^ cells[:, 1] * np.int64(19349663)
+            ^ cells[:, 2] * np.int64(83492791)
+        )
+
+
+def _adjacent_cell_pairs(cells):
+    """Index pairs ``(i, j)`` of entries in the same or in adjacent grid cells.
+
+    Same-cell pairs are returned once (``j > i``); every pair of adjacent
+    cells is visited once through ``_FORWARD_CELL_OFFSETS``.
+    """
+    count = len(cells)
+    keys = _cell_hash(cells)
+    order = np.argsort(keys, kind="stable")
+    bucket_keys, bucket_starts, bucket_sizes = np.unique(
+        keys[order], return_index=True, return_counts=True
+    )
+
+    first_parts = []
+    second_parts = []
+    indices = np.arange(count)
+    for offset in _FORWARD_CELL_OFFSETS:
+        probe = _cell_hash(cells + offset)
+        # Searching sorted probes is several times faster than random lookups.
+        probe_order = np.argsort(probe)
+        slot = np.empty(count, dtype=np.int64)
+        slot[probe_order] = np.searchsorted(bucket_keys, probe[probe_order])
+        np.minimum(slot, len(bucket_keys) - 1, out=slot)
+        hit = bucket_keys[slot] == probe
+        if not hit.any():
             continue
-        stack = [face]
-        while stack:
-            current = stack.pop()
-            if current.index in visited:
-                continue
-            visited.add(current.index)
-            for edge in current.edges:
-                for linked in edge.link_faces:
-                    if linked.index in visited:
-                        continue
-                    connected = any(
-                        _almost_equal_2d(loop_a[uv_layer].uv, loop_b[uv_layer].uv)
-                        for loop_a in current.loops
-                        for loop_b in linked.loops
-                    )
-                    if connected:
-                        stack.append(linked)
-        islands += 1
-    return islands
+        sizes = bucket_sizes[slot[hit]]
+        first = np.repeat(indices[hit], sizes)
+        within = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        second = order[np.repeat(bucket_starts[slot[hit]], sizes) + within]
+        # Hash collisions are discarded by comparing the real cells.
+        keep = np.all(cells[second] == cells[first] + offset, axis=1)
+        keep &= second > first if not offset.any() else second != first
+        first_parts.append(first[keep])
+        second_parts.append(second[keep])
+    if not first_parts:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(first_parts), np.concatenate(second_parts)
+
+
+def _groups_touch(points, starts_a, sizes_a, starts_b, sizes_b, dist, chebyshev=False):
+    """For each group pair, whether some vertex of ``a`` is within ``dist`` of one of ``b``.
+
+    Groups are ``points[start:start + size]``. Vertex pairs are evaluated in
+    batches of about ``_DUPLICATE_PAIR_CHUNK`` so memory stays bounded however
+    many vertices the groups hold. ``chebyshev`` compares every axis with
+    ``dist`` instead of the Euclidean distance.
+    """
+    def close(difference):
+        if chebyshev:
+            return (np.abs(difference) <= dist).all(axis=-1)
+        return (difference ** 2).sum(axis=-1) <= dist * dist
+
+    touching = np.zeros(len(starts_a), dtype=bool)
+    products = sizes_a * sizes_b
+    bounds = np.r_[0, np.cumsum(products)]
+    begin = 0
+    while begin < len(starts_a):
+        end = max(begin + 1, int(np.searchsorted(bounds, bounds[begin] + _DUPLICATE_PAIR_CHUNK, "right")) - 1)
+        if products[begin] > _DUPLICATE_PAIR_CHUNK:
+            # One oversized pair: scan it in slices with an early exit.
+            first = points[starts_a[begin]:starts_a[begin] + sizes_a[begin]]
+            second = points[starts_b[begin]:starts_b[begin] + sizes_b[begin]]
+            step = max(1, _DUPLICATE_PAIR_CHUNK // len(second))
+            touching[begin] = any(
+                close(first[row:row + step, None, :] - second[None, :, :]).any()
+                for row in range(0, len(first), step)
+            )
+            begin += 1
+            continue
+        counts = products[begin:end]
+        offsets = np.cumsum(counts) - counts
+        pair = np.repeat(np.arange(end - begin), counts)
+        local = np.arange(counts.sum()) - offsets[pair]
+        width = sizes_b[begin:end][pair]
+        first = points[starts_a[begin:end][pair] + local // width]
+        second = points[starts_b[begin:end][pair] + local % width]
+        touching[begin:end] = np.add.reduceat(close(first - second), offsets) > 0
+        begin = end
+    return touching
+
+
+def count_duplicate_vertices(coords, dist=VERTEX_MERGE_DISTANCE, return_clusters=False):
+    """Count vertices that Merge by Distance would remove, without copying the mesh.
+
+    Vertices are first grouped by sub-cells of side ``dist / 2``: their
+    diagonal is below ``dist``, so each group is already one cluster and
+    coincident or collapsed geometry costs one entry instead of ``k²``
+    pairs. The sub-cells nest in a grid of ``dist``-sized cells, so any two
+    vertices within ``dist`` belong to groups in the same or in adjacent
+    cells, with at most eight groups per cell. Candidate group pairs are
+    decided by the distance bounds of their bounding boxes; only pairs of
+    multi-vertex groups the bounds cannot settle compare their vertices.
+    Groups are joined with union-find and every cluster of ``n`` vertices
+    contributes ``n - 1`` duplicates. With ``return_clusters`` the vertex
+    index arrays of the clusters are returned as well.
+    """
+    points = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    count = len(points)
+    if count < 2:
+        return (0, []) if return_clusters else 0
+
+    sub_cells = np.floor(points / (dist / 2.0)).astype(np.int64)
+    order = np.argsort(_cell_hash(sub_cells), kind="stable")
+    ordered = sub_cells[order]
+    # Colliding hashes only split a sub-cell into several groups, which the
+    # box bounds below join again.
+    starts = np.flatnonzero(np.r_[True, np.any(ordered[1:] != ordered[:-1], axis=1)])
+    sizes = np.diff(np.r_[starts, count])
+    ordered_points = points[order]
+    lower = np.minimum.reduceat(ordered_points, starts)
+    upper = np.maximum.reduceat(ordered_points, starts)
+
+    group_a, group_b = _adjacent_cell_pairs(ordered[starts] // 2)
+    gap = np.maximum(lower[group_b] - upper[group_a], 0.0) + np.maximum(lower[group_a] - upper[group_b], 0.0)
+    span = np.maximum(np.abs(upper[group_b] - lower[group_a]), np.abs(upper[group_a] - lower[group_b]))
+    near = (gap ** 2).sum(axis=1) <= dist * dist
+    joined = near & ((span ** 2).sum(axis=1) <= dist * dist)
+    edges_a, edges_b = group_a[joined], group_b[joined]
+    groups = len(starts)
+    labels, components = _union_find_labels(groups, edges_a, edges_b)
+
+    # Undecided pairs are checked in rounds; pairs whose groups are already
+    # connected through other edges are skipped.
+    pending = np.flatnonzero(near & ~joined)
+    while pending.size:
+        pending = pending[labels[group_a[pending]] != labels[group_b[pending]]]
+        if not pending.size:
+            break
+        work = np.cumsum(sizes[group_a[pending]] * sizes[group_b[pending]])
+        batch, pending = np.split(pending, [max(1, int(np.searchsorted(work, _DUPLICATE_PAIR_CHUNK, "right")))])
+        touching = _groups_touch(
+            ordered_points, starts[group_a[batch]], sizes[group_a[batch]],
+            starts[group_b[batch]], sizes[group_b[batch]], dist,
+        )
+        edges_a = np.concatenate([edges_a, group_a[batch[touching]]])
+        edges_b = np.concatenate([edges_b, group_b[batch[touching]]])
+        labels, components = _union_find_labels(groups, edges_a, edges_b)
+
+    duplicates = count - components
+    if not return_clusters:
+        return duplicates
+
+    point_labels = np.empty(count, dtype=np.int64)
+    point_labels[order] = np.repeat(labels, sizes)
+    labels = point_labels
+    sizes = np.bincount(labels, minlength=components)
+    grouped = np.argsort(labels, kind="stable")
+    clusters = [
+        cluster for cluster in np.split(grouped, np.cumsum(sizes)[:-1])
+        if len(cluster) > 1
+    ]
+    return duplicates, clusters
 
 
-def _normal_percentage(obj, bm):
-    if not bm.faces:
-        return 0.0
-    check_bm = bm.copy()
-    try:
-        check_bm.normal_update()
-        check_bm.faces.ensure_lookup_table()
-        original = [face.normal.copy() for face in check_bm.faces]
-        bmesh.ops.recalc_face_normals(check_bm, faces=list(check_bm.faces))
-        check_bm.normal_update()
-        flipped = sum(
-            1 for old, face in zip(original, check_bm.faces)
-            if old.dot(face.normal) < 0.0
+def _polygon_corners(loop_start, loop_total):
+    """Return ``(face, loop, next loop, first loop)`` for every polygon corner."""
+    loop_start = np.asarray(loop_start, dtype=np.int64)
+    loop_total = np.asarray(loop_total, dtype=np.int64)
+    faces = np.repeat(np.arange(loop_total.size), loop_total)
+    offsets = np.arange(faces.size) - np.repeat(np.cumsum(loop_total) - loop_total, loop_total)
+    first = loop_start[faces]
+    return faces, first + offsets, first + (offsets + 1) % loop_total[faces], first
+
+
+class MeshArrays:
+    """Flat mesh buffers plus the intermediates shared by every metric kernel.
+
+    Holds the arrays of a ``bpy.types.Mesh`` (vertex coordinates, loop vertex
+    indices and UVs, polygon ``loop_start``/``loop_total``). Polygon corners,
+    Newell face normals, face areas and centres are derived once here; the
+    edge-face adjacency is built on first use by ``edge_adjacency()``.
+    """
+
+    def __init__(self, coords, loop_verts, loop_start, loop_total, loop_uvs=None):
+        self.coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+        self.loop_verts = np.asarray(loop_verts, dtype=np.int64)
+        self.loop_start = np.asarray(loop_start, dtype=np.int64)
+        self.loop_total = np.asarray(loop_total, dtype=np.int64)
+        self.loop_uvs = (
+            None if loop_uvs is None
+            else np.asarray(loop_uvs, dtype=np.float64).reshape(-1, 2)
+        )
+        self.face_count = int(self.loop_total.size)
+        self.faces, self.corner, self.following, self.first = _polygon_corners(
+            self.loop_start, self.loop_total
         )
-        return round(100.0 * flipped / len(check_bm.faces), 2)
-    finally:
-        check_bm.free()
 
+        corner_points = self.coords[self.loop_verts[self.corner]]
+        next_points = self.coords[self.loop_verts[self.following]]
+        origin = self.coords[self.loop_verts[self.first]]
+        self.edge_vectors = next_points - corner_points
+        self.normals = self.per_face(np.cross(corner_points - origin, next_points - origin))
+        self.areas = np.linalg.norm(self.normals, axis=1) * 0.5
+        self.centres = self.per_face(corner_points) / np.maximum(self.loop_total, 1)[:, None]
+        self._adjacency = None
+        self._components = None
+
+    def per_face(self, corner_values):
+        """Sum per-corner values (1D or ``(n, k)``) into per-face totals."""
+        if corner_values.ndim == 1:
+            return np.bincount(self.faces, weights=corner_values, minlength=self.face_count)
+        return np.column_stack([
+            np.bincount(self.faces, weights=corner_values[:, axis], minlength=self.face_count)
+            for axis in range(corner_values.shape[1])
+        ])
+
+    def edge_adjacency(self):
+        """Return ``(linked_a, linked_b, manifold_a, manifold_b, inconsistent)``.
+
+        Corners are grouped by undirected edge. ``linked_*`` join consecutive
+        faces of every group, enough to connect all faces sharing any edge.
+        ``manifold_*`` are the face pairs of edges used by exactly two
+        corners; ``inconsistent`` marks pairs that walk the edge the same way.
+        """
+        if self._adjacency is None:
+            start_vert = self.loop_verts[self.corner]
+            end_vert = self.loop_verts[self.following]
+            low = np.minimum(start_vert, end_vert)
+            high = np.maximum(start_vert, end_vert)
+            order = np.lexsort((high, low))
+            low = low[order]
+            high = high[order]
+            same_edge = (low[1:] == low[:-1]) & (high[1:] == high[:-1])
+            boundaries = np.flatnonzero(np.concatenate(([True], ~same_edge, [True])))
+            group_starts = boundaries[:-1][np.diff(boundaries) == 2]
+            first = order[group_starts]
+            second = order[group_starts + 1]
+            self._adjacency = (
+                self.faces[order[:-1][same_edge]],
+                self.faces[order[1:][same_edge]],
+                self.faces[first],
+                self.faces[second],
+                start_vert[first] == start_vert[second],
+            )
+        return self._adjacency
 
-def _mean_face_angle(bm):
-    angles = []
-    bm.normal_update()
-    for edge in bm.edges:
-        if edge.is_valid and len(edge.link_faces) == 2:
-            try:
-                angle = abs(math.degrees(edge.calc_face_angle()))
-            except ValueError:
-                continue
-            if angle > 90.0:
-                angle = 180.0 - angle
-            angles.append(angle)
-    return round(sum(angles) / len(angles), 2) if angles else 0.0
+    def face_components(self):
+        """Return ``(labels, face_counts)`` of the edge-connected face components.
+
+        Faces sharing any edge are joined by union-find over the edge-face
+        adjacency; faces touching only at a vertex stay separate, as in the
+        N_meshes definition. ``face_counts[label]`` is the size of each part.
+        """
+        if self._components is None:
+            linked_a, linked_b, _, _, _ = self.edge_adjacency()
+            labels, count = _union_find_labels(self.face_count, linked_a, linked_b)
+            self._components = (labels, np.bincount(labels, minlength=count))
+        return self._components
+
+
+def _stratified_face_sample(face_count, fraction, seed):
+    """Pick about ``fraction`` of the faces in every block of consecutive faces.
+
+    Returns ``(selected, stratum, stratum_sizes)``. Blocks of
+    SAMPLING_STRATUM_FACES neighbouring indices are the strata, so every
+    region of the mesh is represented; at least two faces per stratum are
+    kept so its variance can be estimated.
+    """
+    stratum = np.arange(face_count) // SAMPLING_STRATUM_FACES
+    sizes = np.bincount(stratum)
+    wanted = np.minimum(sizes, np.maximum(2, np.ceil(sizes * fraction).astype(np.int64)))
+    # One row of random keys per stratum; the tail row is padded with keys
+    # that are never picked. A face is kept when its key is among the
+    # ``wanted`` smallest of its row.
+    keys = np.full(sizes.size * SAMPLING_STRATUM_FACES, np.inf)
+    keys[:face_count] = np.random.default_rng(seed).random(face_count)
+    keys = keys.reshape(sizes.size, SAMPLING_STRATUM_FACES)
+    thresholds = np.sort(keys, axis=1)[np.arange(sizes.size), wanted - 1]
+    selected = (keys <= thresholds[:, None]).ravel()[:face_count]
+    return selected, stratum, sizes
+
+
+def _ratio_estimate(y, x, sample):
+    """Return ``(total_y, total_x, var_yy, var_xx, var_xy)`` for per-face values.
+
+    ``y`` and ``x`` hold the values of the measured faces. Without a sample
+    they are exact totals with zero variance terms. With a stratified
+    sample the totals are expanded per stratum and the variance terms are
+    ``sum_h N_h^2 (1 - n_h/N_h) s_h^2 / n_h``; they add up across objects,
+    so finalize_mesh_metrics() can linearize the variance of ``Y / X``.
+    """
+    if sample is None:
+        return float(y.sum()), float(x.sum()), 0.0, 0.0, 0.0
+
+    selected, stratum, sizes = sample
+    strata = stratum[selected]
+    count = sizes.size
+    n = np.bincount(strata, minlength=count).astype(np.float64)
+    sums = [
+        np.bincount(strata, weights=values, minlength=count)
+        for values in (y, x, y * y, x * x, y * x)
+    ]
+    sum_y, sum_x, sum_yy, sum_xx, sum_xy = sums
+    expand = sizes / n
+    dof = np.maximum(n - 1.0, 1.0)
+    factor = sizes ** 2 * (1.0 - n / sizes) / n
+    return (
+        float((expand * sum_y).sum()),
+        float((expand * sum_x).sum()),
+        float((factor * (sum_yy - sum_y * sum_y / n) / dof).sum()),
+        float((factor * (sum_xx - sum_x * sum_x / n) / dof).sum()),
+        float((factor * (sum_xy - sum_y * sum_x / n) / dof).sum()),
+    )
+
+
+def _uv_surface_totals(mesh, sample=None):
+    if mesh.face_count == 0 or mesh.loop_uvs is None:
+        return {
+            "uv_area": 0.0, "uv_mapped_area": 0.0, "surface_mapped_area": 0.0,
+            "uv_stretch_sum": 0.0, "uv_stretch_faces": 0,
+            "uv_stretch_var_yy": 0.0, "uv_stretch_var_xx": 0.0, "uv_stretch_var_xy": 0.0,
+        }
+
+    faces, corner, following, first = mesh.faces, mesh.corner, mesh.following, mesh.first
+    uvs = mesh.loop_uvs
+    fan = (corner != first) & (following != first)
+    uv_a = uvs[corner[fan]] - uvs[first[fan]]
+    uv_b = uvs[following[fan]] - uvs[first[fan]]
+    triangle_areas = np.abs(uv_a[:, 0] * uv_b[:, 1] - uv_a[:, 1] * uv_b[:, 0]) * 0.5
+    face_uv_area = np.bincount(faces[fan], weights=triangle_areas, minlength=mesh.face_count)
+    face_area = mesh.areas
+    mapped = (face_area > 1e-12) & (face_uv_area > 0.0)
+
+    # Stretch is the per-edge part of the kernel, so it is the one sampled.
+    measured_faces = np.arange(mesh.face_count) if sample is None else np.flatnonzero(sample[0])
+    local, corner, following, _ = _polygon_corners(
+        mesh.loop_start[measured_faces], mesh.loop_total[measured_faces]
+    )
+    sub_uv_area = face_uv_area[measured_faces]
+    sub_area = face_area[measured_faces]
+    scale = np.ones(measured_faces.size)
+    scalable = sub_uv_area > 1e-8
+    scale[scalable] = np.sqrt(sub_area[scalable]) / np.sqrt(sub_uv_area[scalable])
+
+    corner_points = mesh.coords[mesh.loop_verts[corner]]
+    next_points = mesh.coords[mesh.loop_verts[following]]
+    edge_length = np.linalg.norm(next_points - corner_points, axis=1)
+    measured = edge_length > 1e-5
+    uv_length = np.linalg.norm(uvs[following] - uvs[corner], axis=1)
+    stretch = np.abs(
+        uv_length[measured] * scale[local[measured]] / edge_length[measured] - 1.0
+    )
+    edge_counts = np.bincount(local[measured], minlength=measured_faces.size)
+    stretch_sums = np.bincount(local[measured], weights=stretch, minlength=measured_faces.size)
+    stretched = edge_counts > 0
+    face_stretch = np.zeros(measured_faces.size)
+    face_stretch[stretched] = stretch_sums[stretched] / edge_counts[stretched]
+
+    total_y, total_x, var_yy, var_xx, var_xy = _ratio_estimate(
+        face_stretch, stretched.astype(np.float64), sample
+    )
+    return {
+        "uv_area": float(face_uv_area.sum()),
+        "uv_mapped_area": float(face_uv_area[mapped].sum()),
+        "surface_mapped_area": float(face_area[mapped].sum()),
+        "uv_stretch_sum": total_y,
+        "uv_stretch_faces": total_x if sample is not None else int(total_x),
+        "uv_stretch_var_yy": var_yy,
+        "uv_stretch_var_xx": var_xx,
+        "uv_stretch_var_xy": var_xy,
+    }
+
+
+def uv_surface_totals(loop_verts, loop_uvs, coords, loop_start, loop_total):
+    """Vectorized UV area, texel-density and stretch totals for flat mesh arrays.
+
+    Per face: UV area is the fan triangulation from the first corner, 3D area
+    is the Newell polygon area, and stretch is the mean over edges longer than
+    1e-5 of ``|uv_length * sqrt(area3d / area_uv) / length3d - 1|``.
+    """
+    totals = _uv_surface_totals(MeshArrays(coords, loop_verts, loop_start, loop_total, loop_uvs))
+    return {key: value for key, value in totals.items() if "_var_" not in key}
+
+
+def _uv_island_count(mesh):
+    if mesh.face_count == 0 or mesh.loop_uvs is None:
+        return 0
+    return uv_island_labels(
+        mesh.faces,
+        mesh.loop_verts[mesh.corner],
+        mesh.loop_uvs[mesh.corner],
+        mesh.face_count,
+    )[1]
+
+
+def _flipped_faces(mesh):
+    face_count = mesh.face_count
+    if face_count == 0:
+        return 0
+
+    # Orientation only propagates across manifold edges, so components are
+    # taken over those edges rather than over every shared edge.
+    _, _, face_a, face_b, inconsistent = mesh.edge_adjacency()
+    components, component_count = _union_find_labels(face_count, face_a, face_b)
+    shift = inconsistent.astype(np.int64)
+    oriented, _ = _union_find_labels(
+        2 * face_count,
+        np.concatenate((2 * face_a, 2 * face_a + 1)),
+        np.concatenate((2 * face_b + shift, 2 * face_b + 1 - shift)),
+    )
+    representative = np.full(component_count, face_count, dtype=np.int64)
+    np.minimum.at(representative, components, np.arange(face_count))
+    parity = oriented[2 * np.arange(face_count)] != oriented[2 * representative[components]]
+
+    areas = mesh.areas
+    weights = np.bincount(components, weights=areas, minlength=component_count)
+    counts = np.bincount(components, minlength=component_count)
+    component_centres = np.column_stack([
+        np.where(
+            weights > 1e-12,
+            np.bincount(components, weights=mesh.centres[:, axis] * areas, minlength=component_count)
+            / np.maximum(weights, 1e-12),
+            np.bincount(components, weights=mesh.centres[:, axis], minlength=component_count) / counts,
+        )
+        for axis in range(3)
+    ])
+
+    outward = mesh.centres - component_centres[components]
+    distance = (outward ** 2).sum(axis=1)
+    ranking = np.lexsort((distance, components))
+    farthest = ranking[np.cumsum(counts) - 1]
+    facing_in = (mesh.normals[farthest] * outward[farthest]).sum(axis=1) < 0.0
+    correct_parity = parity[farthest] ^ facing_in
+    return int((parity != correct_parity[components]).sum())
+
+
+def flipped_face_count(coords, loop_verts, loop_start, loop_total):
+    """Count faces that Recalculate Outside would flip, without copying the mesh.
+
+    Windings are compared across manifold edges on a doubled face graph:
+    node ``2f`` is face ``f`` as stored and ``2f + 1`` the same face flipped,
+    so one union-find pass assigns every face a parity relative to the first
+    face of its edge-connected component. As in ``recalc_face_normals``, each
+    component is oriented so the face farthest from its area-weighted centre
+    points away from it; faces of the other parity are the flipped ones.
+    """
+    return _flipped_faces(MeshArrays(coords, loop_verts, loop_start, loop_total))
+
+
+# Folded dihedral angles lie in [0, 90] degrees; 5-degree histogram bins.
+ANGLE_HISTOGRAM_BINS = 18
+
+
+def _folded_dihedral_angles(normals, face_a, face_b):
+    """Return ``(angles, face_a)`` for edges whose two faces have a normal."""
+    normals = np.asarray(normals, dtype=np.float64).reshape(-1, 3)
+    face_a = np.asarray(face_a, dtype=np.int64)
+    face_b = np.asarray(face_b, dtype=np.int64)
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = (lengths[face_a] > 0.0) & (lengths[face_b] > 0.0)
+    face_a = face_a[valid]
+    face_b = face_b[valid]
+
+    cosines = (normals[face_a] * normals[face_b]).sum(axis=1) / (lengths[face_a] * lengths[face_b])
+    angles = np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0)))
+    return np.where(angles > 90.0, 180.0 - angles, angles), face_a
+
+
+def dihedral_angle_statistics(normals, face_a, face_b, bins=ANGLE_HISTOGRAM_BINS):
+    """Return count, sum, mean, median and histogram of folded dihedral angles.
+
+    Matches ``BMEdge.calc_face_angle()`` in degrees over the manifold edge
+    table ``(face_a, face_b)``, folded to ``[0, 90]``. Edges next to a
+    degenerate (zero-normal) face are skipped. core/mesh_kernels.py holds the
+    Blender-agnostic copy used outside the add-on.
+    """
+    angles, _ = _folded_dihedral_angles(normals, face_a, face_b)
+    histogram, _ = np.histogram(angles, bins=bins, range=(0.0, 90.0))
+    return {
+        "count": int(angles.size),
+        "sum": float(angles.sum()),
+        "mean": float(angles.mean()) if angles.size else 0.0,
+        "median": float(np.median(angles)) if angles.size else 0.0,
+        "histogram": histogram.tolist(),
+    }
+
+
+def _face_angle_totals(mesh, sample=None):
+    """Return the folded dihedral angle totals over manifold edges.
+
+    Each edge belongs to its first face. With a sample, only edges of the
+    sampled faces are measured and the totals are stratified estimates.
+    """
+    _, _, face_a, face_b, _ = mesh.edge_adjacency()
+    if sample is not None:
+        owned = sample[0][face_a]
+        face_a = face_a[owned]
+        face_b = face_b[owned]
+    angles, owners = _folded_dihedral_angles(mesh.normals, face_a, face_b)
+    if sample is None:
+        return {
+            "angle_sum": float(angles.sum()), "angle_count": int(angles.size),
+            "angle_var_yy": 0.0, "angle_var_xx": 0.0, "angle_var_xy": 0.0,
+        }
+
+    measured_faces = np.flatnonzero(sample[0])
+    local = np.searchsorted(measured_faces, owners)
+    total_y, total_x, var_yy, var_xx, var_xy = _ratio_estimate(
+        np.bincount(local, weights=angles, minlength=measured_faces.size),
+        np.bincount(local, minlength=measured_faces.size).astype(np.float64),
+        sample,
+    )
+    return {
+        "angle_sum": total_y, "angle_count": total_x,
+        "angle_var_yy": var_yy, "angle_var_xx": var_xx, "angle_var_xy": var_xy,
+    }
 
 
 def _flush_edit_mesh_uv_data(obj):
@@ -1117,15 +1724,201 @@ def _flush_edit_mesh_uv_data(obj):
         )
 
 
-def _mesh_bmesh_copy(obj):
-    bm = bmesh.new()
-    if safe_mode_of_object(obj) == "EDIT":
-        _flush_edit_mesh_uv_data(obj)
-        edit_bm = bmesh.from_edit_mesh(obj.data)
-        bm.free()
-        return edit_bm.copy()
-    bm.from_mesh(obj.data)
-    return bm
+# Additive totals produced per object. Scene-level metrics are reduced from
+# the sum of these partials, so no combined mesh is ever built.
+MESH_METRIC_PARTIAL_KEYS = (
+    "faces", "verts", "non_quad_faces", "duplicate_verts", "components",
+    "uv_area", "uv_islands", "uv_mapped_area", "surface_mapped_area",
+    "uv_stretch_sum", "uv_stretch_faces", "flipped_faces",
+    "angle_sum", "angle_count",
+    # Sampling: faces measured for the sampled metrics (equal to "faces" when
+    # exact) and additive variance terms of the UV_stretch and Angle ratios.
+    "sampled_faces",
+    "uv_stretch_var_yy", "uv_stretch_var_xx", "uv_stretch_var_xy",
+    "angle_var_yy", "angle_var_xx", "angle_var_xy",
+)
+
+MESH_METRIC_OBJECT_TYPES = {
+    'MESH', 'CURVE', 'SURFACE', 'META', 'FONT',
+    'CURVES', 'POINTCLOUD', 'VOLUME', 'GREASEPENCIL',
+}
+
+# Stages reported in the per-metric timing breakdown, in execution order.
+MESH_METRIC_STAGES = (
+    "extract", "adjacency", "components", "duplicates",
+    "uv_islands", "uv_surface", "normals", "angles",
+)
+# Stages a time budget may skip, first to last. Their totals are left at
+# zero, the partial lists them in "skipped_stages" and the exported metrics
+# that depend on them are blank. UV area, face, vertex and non-quad counts
+# are never skipped.
+MESH_METRIC_SKIPPABLE_STAGES = ("duplicates", "uv_islands", "normals", "components", "angles")
+# Stages estimated from the face sample; their cost scales with sampled faces.
+MESH_METRIC_SAMPLED_STAGES = ("uv_surface", "angles")
+# Exported metrics left blank when their stage is skipped.
+_SKIPPED_STAGE_METRICS = {
+    "duplicates": ("Vertex_duplicate", "Vertex_duplicate_percentage"),
+    "uv_islands": ("UV_islands",),
+    "normals": ("Normal_percentage",),
+    "components": ("N_meshes", "Face_by_mesh"),
+    "angles": ("Angle", "Angle_ci"),
+}
+
+
+def mesh_metric_partials(mesh, timings=None, sample_fraction=1.0, seed=0, skip=()):
+    """Calculate every mergeable metric total for one ``MeshArrays``.
+
+    All kernels read the buffers and shared intermediates of ``mesh``; no
+    BMesh or mesh copy is created. When ``timings`` is a dict, the seconds
+    spent in each stage are added to it. A ``sample_fraction`` below 1
+    estimates UV stretch and Angle from a stratified face sample; stages in
+    ``skip`` (see MESH_METRIC_SKIPPABLE_STAGES) are not run at all. Every
+    other total stays exact.
+    """
+    skip = {stage for stage in skip if stage in MESH_METRIC_SKIPPABLE_STAGES}
+    clock = [time.perf_counter()]
+
+    def lap(stage):
+        now = time.perf_counter()
+        if timings is not None:
+            timings[stage] = timings.get(stage, 0.0) + now - clock[0]
+        clock[0] = now
+
+    # The adjacency is only needed by the graph stages.
+    if not {"components", "normals", "angles"} <= skip:
+        mesh.edge_adjacency()
+        lap("adjacency")
+    components = 0
+    if "components" not in skip:
+        components = len(mesh.face_components()[1])
+        lap("components")
+    duplicate_count = 0
+    if "duplicates" not in skip:
+        duplicate_count = count_duplicate_vertices(mesh.coords)
+        lap("duplicates")
+    uv_islands = 0
+    if "uv_islands" not in skip:
+        uv_islands = _uv_island_count(mesh)
+        lap("uv_islands")
+    sample = None
+    if sample_fraction < 1.0 and mesh.face_count:
+        sample = _stratified_face_sample(mesh.face_count, sample_fraction, seed)
+    uv_totals = _uv_surface_totals(mesh, sample)
+    lap("uv_surface")
+    flipped = 0
+    if "normals" not in skip:
+        flipped = _flipped_faces(mesh)
+        lap("normals")
+    angle_totals = {
+        "angle_sum": 0.0, "angle_count": 0,
+        "angle_var_yy": 0.0, "angle_var_xx": 0.0, "angle_var_xy": 0.0,
+    }
+    if "angles" not in skip:
+        angle_totals = _face_angle_totals(mesh, sample)
+        lap("angles")
+
+    return {
+        "faces": mesh.face_count,
+        "verts": int(len(mesh.coords)),
+        "non_quad_faces": int((mesh.loop_total != 4).sum()),
+        "duplicate_verts": int(duplicate_count),
+        "components": int(components),
+        "uv_islands": int(uv_islands),
+        **uv_totals,
+        "flipped_faces": flipped,
+        **angle_totals,
+        "sampled_faces": mesh.face_count if sample is None else int(sample[0].sum()),
+        "skipped_stages": sorted(skip),
+    }
+
+
+def merge_mesh_metric_partials(partials):
+    """Sum per-object partials into one set of scene totals.
+
+    A stage skipped for any object is skipped for the scene: its summed
+    total would be incomplete.
+    """
+    total = {key: 0 for key in MESH_METRIC_PARTIAL_KEYS}
+    skipped = set()
+    for partial in partials:
+        for key in MESH_METRIC_PARTIAL_KEYS:
+            total[key] += partial.get(key, 0)
+        skipped.update(partial.get("skipped_stages", ()))
+    total["skipped_stages"] = sorted(skipped)
+    return total
+
+
+def _ratio_half_width(total, prefix, numerator, denominator):
+    """Return the 95% half-width of ``total[numerator] / total[denominator]``."""
+    if total[denominator] <= 0:
+        return 0.0
+    ratio = total[numerator] / total[denominator]
+    variance = (
+        total[f"{prefix}_var_yy"]
+        - 2.0 * ratio * total[f"{prefix}_var_xy"]
+        + ratio * ratio * total[f"{prefix}_var_xx"]
+    ) / total[denominator] ** 2
+    return SAMPLING_Z * math.sqrt(max(variance, 0.0))
+
+
+def finalize_mesh_metrics(total, transforms_applied=True, at_origin=True):
+    """Turn merged partial totals into the exported metric values."""
+    total_faces = int(total["faces"])
+    total_verts = int(total["verts"])
+    parts = int(total["components"])
+    duplicate_count = int(total["duplicate_verts"])
+
+    metrics = {
+        "UV_area": round(total["uv_area"], 4),
+        "UV_islands": int(total["uv_islands"]),
+        "UV_stretch": (
+            round(total["uv_stretch_sum"] / total["uv_stretch_faces"], 4)
+            if total["uv_stretch_faces"] else 0.0
+        ),
+        "UV_textel_density": (
+            round(math.sqrt(total["uv_mapped_area"] / total["surface_mapped_area"]), 4)
+            if total["uv_mapped_area"] > 0.0 and total["surface_mapped_area"] > 1e-12 else 0.0
+        ),
+        "Normal_percentage": (
+            round(100.0 * total["flipped_faces"] / total_faces, 2) if total_faces else 0.0
+        ),
+        "Transformations": bool(transforms_applied),
+        "Position": bool(at_origin),
+        "Non_quads_percentage": (
+            round(100.0 * total["non_quad_faces"] / total_faces, 2) if total_faces else 0.0
+        ),
+        "Vertex_duplicate": duplicate_count,
+        "Vertex_duplicate_percentage": (
+            round(100.0 * duplicate_count / total_verts, 2) if total_verts else 0.0
+        ),
+        "N_faces": total_faces,
+        "N_meshes": parts,
+        "Face_by_mesh": round(total_faces / parts, 2) if parts else 0.0,
+        "Angle": (
+            round(total["angle_sum"] / total["angle_count"], 2) if total["angle_count"] else 0.0
+        ),
+        "Sampled": 0 < total["sampled_faces"] < total_faces,
+        "UV_stretch_ci": round(
+            _ratio_half_width(total, "uv_stretch", "uv_stretch_sum", "uv_stretch_faces"), 4
+        ),
+        "Angle_ci": round(_ratio_half_width(total, "angle", "angle_sum", "angle_count"), 2),
+    }
+    skipped = total.get("skipped_stages", ())
+    for stage in skipped:
+        for field in _SKIPPED_STAGE_METRICS.get(stage, ()):
+            metrics[field] = None
+    metrics["Skipped_stages"] = ";".join(skipped)
+    return metrics
+
+
+def _object_transform_state(obj):
+    """Return ``(transforms_applied, at_origin)`` for one object."""
+    transforms_applied = (
+        all(abs(value - 1.0) <= 1e-5 for value in obj.scale)
+        and all(abs(value) <= 1e-5 for value in obj.rotation_euler)
+    )
+    at_origin = all(abs(value) <= 1e-5 for value in obj.location)
+    return transforms_applied, at_origin
 
 
 def calculate_mesh_metrics(obj):
@@ -1133,252 +1926,390 @@ def calculate_mesh_metrics(obj):
     if obj is None or obj.type != "MESH":
         return {}
 
-    bm = _mesh_bmesh_copy(obj)
-    try:
-        bm.verts.ensure_lookup_table()
-        bm.edges.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-        bm.normal_update()
-
-        total_faces = len(bm.faces)
-        total_verts = len(bm.verts)
-        non_quads = round(
-            100.0 * sum(1 for face in bm.faces if len(face.verts) != 4) / total_faces,
-            2,
-        ) if total_faces else 0.0
-
-        merged = bm.copy()
-        try:
-            bmesh.ops.remove_doubles(merged, verts=list(merged.verts), dist=0.0001)
-            duplicate_count = max(total_verts - len(merged.verts), 0)
-        finally:
-            merged.free()
-        duplicate_percentage = round(
-            100.0 * duplicate_count / total_verts, 2
-        ) if total_verts else 0.0
-
-        visited = set()
-        parts = 0
-        for face in bm.faces:
-            if face.index in visited:
-                continue
-            stack = [face]
-            while stack:
-                current = stack.pop()
-                if current.index in visited:
-                    continue
-                visited.add(current.index)
-                for edge in current.edges:
-                    stack.extend(
-                        linked for linked in edge.link_faces
-                        if linked.index not in visited
-                    )
-            parts += 1
-
-        uv_layer = bm.loops.layers.uv.active
-        uv_area = 0.0
-        uv_islands = 0
-        uv_stretch_values = []
-        total_uv_area = 0.0
-        total_3d_area = 0.0
-
-        if uv_layer is not None:
-            uv_islands = _count_uv_islands(bm, uv_layer)
-            for face in bm.faces:
-                verts = [loop.vert for loop in face.loops]
-                uvs = [loop[uv_layer].uv.copy() for loop in face.loops]
-                face_uv_area = _uv_polygon_area(uvs)
-                face_3d_area = face.calc_area()
-                uv_area += face_uv_area
-
-                if face_3d_area > 1e-12 and face_uv_area > 0.0:
-                    total_uv_area += face_uv_area
-                    total_3d_area += face_3d_area
-
-                scale_factor = (
-                    math.sqrt(face_3d_area) / math.sqrt(face_uv_area)
-                    if face_uv_area > 1e-8 else 1.0
-                )
-                edge_stretches = []
-                for i, vert in enumerate(verts):
-                    next_vert = verts[(i + 1) % len(verts)]
-                    length_3d = (vert.co - next_vert.co).length
-                    if length_3d <= 1e-5:
-                        continue
-                    uv_a = uvs[i] * scale_factor
-                    uv_b = uvs[(i + 1) % len(uvs)] * scale_factor
-                    edge_stretches.append(abs((uv_a - uv_b).length / length_3d - 1.0))
-                if edge_stretches:
-                    uv_stretch_values.append(sum(edge_stretches) / len(edge_stretches))
-
-        uv_stretch = (
-            round(sum(uv_stretch_values) / len(uv_stretch_values), 4)
-            if uv_stretch_values else 0.0
-        )
-        uv_textel_density = (
-            round(math.sqrt(total_uv_area / total_3d_area), 4)
-            if total_uv_area > 0.0 and total_3d_area > 1e-12 else 0.0
-        )
+    _flush_edit_mesh_uv_data(obj)
+    buffers = read_mesh_buffers(obj.data)
+    partials = mesh_metric_partials(mesh_arrays_from_buffers(buffers))
+    total = merge_mesh_metric_partials([partials])
+    transforms_applied, at_origin = _object_transform_state(obj)
+    return finalize_mesh_metrics(total, transforms_applied, at_origin)
+
+
+def read_mesh_buffers(mesh):
+    """Copy the buffers every metric needs from a Mesh with foreach_get()."""
+    def fetch(collection, attribute, dtype, width=1):
+        values = np.empty(len(collection) * width, dtype=dtype)
+        collection.foreach_get(attribute, values)
+        return values
+
+    layer = mesh.uv_layers.active
+    return {
+        "coords": fetch(mesh.vertices, "co", np.float32, 3),
+        "loop_verts": fetch(mesh.loops, "vertex_index", np.int32),
+        "loop_start": fetch(mesh.polygons, "loop_start", np.int32),
+        "loop_total": fetch(mesh.polygons, "loop_total", np.int32),
+        "loop_uvs": None if layer is None else fetch(layer.data, "uv", np.float32, 2),
+        "uv_layer": None if layer is None else layer.name,
+    }
 
-        transforms_applied = (
-            all(abs(value - 1.0) <= 1e-5 for value in obj.scale)
-            and all(abs(value) <= 1e-5 for value in obj.rotation_euler)
-        )
-        at_origin = all(abs(value) <= 1e-5 for value in obj.location)
 
-        return {
-            "UV_area": round(uv_area, 4),
-            "UV_islands": int(uv_islands),
-            "UV_stretch": uv_stretch,
-            "UV_textel_density": uv_textel_density,
-            "Normal_percentage": _normal_percentage(obj, bm),
-            "Transformations": bool(transforms_applied),
-            "Position": bool(at_origin),
-            "Non_quads_percentage": non_quads,
-            "Vertex_duplicate": int(duplicate_count),
-            "Vertex_duplicate_percentage": duplicate_percentage,
-            "N_faces": int(total_faces),
-            "N_meshes": int(parts),
-            "Face_by_mesh": round(total_faces / parts, 2) if parts else 0.0,
-            "Angle": _mean_face_angle(bm),
-        }
-    finally:
-        bm.free()
+def _mesh_buffers_digest(buffers, matrix_world):
+    """Digest the buffers mesh_metric_partials() reads from an evaluated mesh.
 
+    The mesh is the modifier-evaluated result of to_mesh(), so a change in any
+    modifier shows up here even when the source datablock is untouched.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(f"v{MESH_METRICS_CACHE_VERSION}|".encode("utf-8"))
+    hasher.update(np.asarray(matrix_world, dtype=np.float64).tobytes())
+    for key in ("coords", "loop_verts", "loop_start", "loop_total", "loop_uvs"):
+        values = buffers[key]
+        if values is None:
+            hasher.update(f"{key}:none|".encode("utf-8"))
+            continue
+        hasher.update(f"{key}:{values.size}|".encode("utf-8"))
+        hasher.update(values.tobytes())
+    hasher.update(f"uv:{buffers['uv_layer']}".encode("utf-8"))
+    return hasher.hexdigest()
 
-def _create_combined_scene_mesh_object():
-    """Create one temporary world-space mesh from all convertible scene objects.
 
-    Cameras and lights are excluded. Source objects are never selected, joined,
-    converted, modified, or deleted. The temporary result is removed immediately
-    after the metrics have been calculated, which is safer than invoking Undo from
-    a save_pre handler and leaves the user's scene exactly as it was.
-    """
-    scene = bpy.context.scene
-    depsgraph = bpy.context.evaluated_depsgraph_get()
-    combined_bm = bmesh.new()
-    source_names = []
+def mesh_arrays_from_buffers(buffers, matrix_world=None):
+    """Build ``MeshArrays`` from read_mesh_buffers(), optionally in world space."""
+    coords = buffers["coords"].reshape(-1, 3).astype(np.float64)
+    if matrix_world is not None:
+        matrix = np.asarray(matrix_world, dtype=np.float64)
+        coords = coords @ matrix[:3, :3].T + matrix[:3, 3]
+    return MeshArrays(
+        coords,
+        buffers["loop_verts"],
+        buffers["loop_start"],
+        buffers["loop_total"],
+        buffers["loop_uvs"],
+    )
 
-    try:
-        for obj in sorted(scene.objects, key=lambda item: item.name):
-            if obj.type in {'CAMERA', 'LIGHT'}:
-                continue
 
-            # Objects without renderable/convertible geometry (empties, speakers,
-            # light probes, etc.) are ignored naturally.
-            if obj.type not in {
-                'MESH', 'CURVE', 'SURFACE', 'META', 'FONT',
-                'CURVES', 'POINTCLOUD', 'VOLUME', 'GREASEPENCIL'
-            }:
-                continue
+def _evaluated_object_buffers(obj, depsgraph):
+    """Copy the metric buffers of one evaluated scene object, or return None.
 
-            temp_mesh = None
-            evaluated_obj = None
+    Only one temporary mesh exists at a time and it is released as soon as
+    its buffers are copied. Source objects are never selected, joined,
+    converted, modified, or deleted.
+    """
+    temp_mesh = None
+    evaluated_obj = None
+    try:
+        if obj.type == 'MESH' and safe_mode_of_object(obj) == 'EDIT':
+            # Synchronize current UV loop coordinates as well as geometry.
+            # update_from_editmode() alone can leave UV Editor transforms
+            # unavailable to the evaluated mesh during save_pre.
+            _flush_edit_mesh_uv_data(obj)
+            depsgraph.update()
+
+        evaluated_obj = obj.evaluated_get(depsgraph)
+        temp_mesh = evaluated_obj.to_mesh(
+            preserve_all_data_layers=True,
+            depsgraph=depsgraph,
+        )
+        if temp_mesh is None or len(temp_mesh.vertices) == 0:
+            return None
+        return read_mesh_buffers(temp_mesh)
+    finally:
+        if evaluated_obj is not None and temp_mesh is not None:
             try:
-                if obj.type == 'MESH' and safe_mode_of_object(obj) == 'EDIT':
-                    # Synchronize current UV loop coordinates as well as geometry.
-                    # update_from_editmode() alone can leave UV Editor transforms
-                    # unavailable to the evaluated mesh during save_pre.
-                    _flush_edit_mesh_uv_data(obj)
-                    depsgraph.update()
-
-                evaluated_obj = obj.evaluated_get(depsgraph)
-                temp_mesh = evaluated_obj.to_mesh(
-                    preserve_all_data_layers=True,
-                    depsgraph=depsgraph,
-                )
-                if temp_mesh is None or len(temp_mesh.vertices) == 0:
-                    continue
-
-                before = len(combined_bm.verts)
-                combined_bm.from_mesh(temp_mesh)
-                combined_bm.verts.ensure_lookup_table()
-                new_verts = list(combined_bm.verts[before:])
-                if new_verts:
-                    bmesh.ops.transform(
-                        combined_bm,
-                        matrix=obj.matrix_world,
-                        verts=new_verts,
-                    )
-                source_names.append(obj.name)
+                evaluated_obj.to_mesh_clear()
             except Exception as exc:
-                log_warning(f"Could not add {getattr(obj, 'name', '?')} to combined mesh", exc)
-            finally:
-                if evaluated_obj is not None and temp_mesh is not None:
-                    try:
-                        evaluated_obj.to_mesh_clear()
-                    except Exception as exc:
-                        log_warning(f"Could not clear temporary mesh for {getattr(obj, 'name', '?')}", exc)
-
-        if not combined_bm.verts:
-            combined_bm.free()
-            return None, None, []
-
-        combined_bm.verts.ensure_lookup_table()
-        combined_bm.edges.ensure_lookup_table()
-        combined_bm.faces.ensure_lookup_table()
-        combined_bm.normal_update()
-
-        combined_mesh = bpy.data.meshes.new("DataLogger_CombinedMesh_TEMP")
-        combined_bm.to_mesh(combined_mesh)
-        combined_bm.free()
-        combined_bm = None
-        combined_mesh.update()
-
-        combined_obj = bpy.data.objects.new("DataLogger_CombinedScene_TEMP", combined_mesh)
-        # Do not link it to a collection: calculations can use the datablock directly,
-        # and an unlinked temporary object cannot affect the visible scene or selection.
-        return combined_obj, combined_mesh, source_names
-    except Exception:
-        if combined_bm is not None:
-            combined_bm.free()
-        raise
+                log_warning(f"Could not clear temporary mesh for {getattr(obj, 'name', '?')}", exc)
 
 
-def _remove_combined_scene_mesh_object(combined_obj, combined_mesh):
-    """Delete the temporary calculation datablocks without touching scene objects."""
+def load_mesh_metrics_cache():
+    """Return the ``digest -> partials`` cache embedded in the current file."""
+    if MESH_METRICS_CACHE_TEXTBLOCK not in bpy.data.texts:
+        return {}
     try:
-        if combined_obj is not None:
-            bpy.data.objects.remove(combined_obj, do_unlink=True)
-    except Exception as exc:
-        log_warning("Could not remove temporary combined object", exc)
+        payload = json.loads(bpy.data.texts[MESH_METRICS_CACHE_TEXTBLOCK].as_string())
+    except ValueError as exc:
+        log_warning("Could not read the embedded mesh metrics cache", exc)
+        return {}
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format") != MESH_METRICS_CACHE_VERSION
+        or not isinstance(payload.get("entries"), dict)
+    ):
+        return {}
+
+    return {
+        digest: partial
+        for digest, partial in payload["entries"].items()
+        if isinstance(partial, dict) and all(key in partial for key in MESH_METRIC_PARTIAL_KEYS)
+    }
+
+
+def store_mesh_metrics_cache(entries):
+    """Embed ``entries`` as the cache; digests not used by this save are dropped."""
+    payload = {
+        "format": MESH_METRICS_CACHE_VERSION,
+        "logger_version": LOGGER_VERSION,
+        "entries": entries,
+    }
     try:
-        if combined_mesh is not None and combined_mesh.name in bpy.data.meshes:
-            bpy.data.meshes.remove(combined_mesh, do_unlink=True)
+        txt = get_or_create_textblock(MESH_METRICS_CACHE_TEXTBLOCK)
+        txt.clear()
+        txt.write(json.dumps(payload, separators=(",", ":")))
     except Exception as exc:
-        log_warning("Could not remove temporary combined mesh", exc)
+        log_warning("Could not embed the mesh metrics cache", exc)
+        return False
+    return True
 
 
-def save_scene_mesh_metrics():
-    """Calculate one metric set from all scene geometry except cameras and lights."""
-    objects = {}
-    combined_obj = None
-    combined_mesh = None
-    source_names = []
+def snapshot_scene_mesh_metrics(timings=None):
+    """Read everything the save-time metrics need, on the main thread.
 
-    try:
-        combined_obj, combined_mesh, source_names = _create_combined_scene_mesh_object()
-        if combined_obj is None:
-            objects["CombinedSceneMesh"] = {
-                "error": "No convertible geometry found after excluding cameras and lights"
-            }
+    Returns a plain snapshot: per object its name, evaluated-mesh digest and
+    either the cached exact partials or a copy of its buffers and world
+    matrix plus any cached estimates of the same mesh. ``seconds`` is the
+    time spent here, charged to MESH_METRICS_TIME_BUDGET. The snapshot holds
+    no Blender data, so compute_scene_mesh_metrics() can run on it from a
+    worker thread.
+    """
+    started = time.perf_counter()
+    scene = bpy.context.scene
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    cache = load_mesh_metrics_cache()
+    entries = []
+    transforms_applied = True
+    at_origin = True
+
+    for obj in sorted(scene.objects, key=lambda item: item.name):
+        if obj.type in {'CAMERA', 'LIGHT'} or obj.type not in MESH_METRIC_OBJECT_TYPES:
+            continue
+        try:
+            buffers = _evaluated_object_buffers(obj, depsgraph)
+        except Exception as exc:
+            log_warning(f"Could not calculate mesh metrics for {getattr(obj, 'name', '?')}", exc)
+            continue
+        if buffers is None:
+            continue
+
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        digest = None
+        try:
+            digest = _mesh_buffers_digest(buffers, matrix)
+        except Exception as exc:
+            log_warning(f"Could not digest evaluated mesh for {getattr(obj, 'name', '?')}", exc)
+        cached = cache.get(digest) if digest is not None else None
+        estimates = {}
+        if cached is None and digest is not None:
+            estimates = {key: partial for key, partial in cache.items() if key.startswith(f"{digest}|")}
+        entries.append({
+            "name": obj.name,
+            "digest": digest,
+            "partial": cached,
+            "estimates": estimates,
+            "buffers": None if cached is not None else buffers,
+            "matrix": matrix,
+        })
+        applied, origin = _object_transform_state(obj)
+        transforms_applied = transforms_applied and applied
+        at_origin = at_origin and origin
+
+    seconds = time.perf_counter() - started
+    if timings is not None:
+        timings["extract"] = timings.get("extract", 0.0) + seconds
+    return {
+        "objects": entries,
+        "transforms_applied": transforms_applied,
+        "at_origin": at_origin,
+        "seconds": seconds,
+    }
+
+
+# Seconds per face of every stage (per sampled face for the sampled stages),
+# refreshed after every measured mesh large enough to time; the first
+# estimates are conservative figures for a 1M-face mesh.
+_stage_face_seconds = {
+    "extract": 0.8e-6,
+    "adjacency": 0.6e-6,
+    "components": 0.2e-6,
+    "duplicates": 3.0e-6,
+    "uv_islands": 2.5e-6,
+    "uv_surface": 1.2e-6,
+    "normals": 1.0e-6,
+    "angles": 0.3e-6,
+}
+
+
+def plan_mesh_metrics(face_count, budget=None, spent=0.0):
+    """Return ``(sample_fraction, skipped_stages)`` for ``face_count`` uncached faces.
+
+    ``spent`` seconds of the budget are already used (reading and digesting
+    the meshes). Skippable stages are dropped in MESH_METRIC_SKIPPABLE_STAGES
+    order until the rest fits with at least SAMPLING_MIN_FRACTION sampled;
+    the fraction is then the largest power of two that fits, so repeated
+    saves under the same budget draw the same sample and reuse its cache
+    entry. ``(1.0, ())`` means exact. ``budget`` defaults to
+    MESH_METRICS_TIME_BUDGET.
+    """
+    budget = MESH_METRICS_TIME_BUDGET if budget is None else budget
+    if budget is None or face_count < SAMPLING_MIN_FACES:
+        return 1.0, ()
+    available = max(budget - spent, 0.0) / face_count
+    cost = _stage_face_seconds
+    skipped = []
+
+    def costs():
+        running = [stage for stage in MESH_METRIC_STAGES if stage not in skipped]
+        if not {"components", "normals", "angles"} & set(running):
+            running.remove("adjacency")
+        fixed = sum(cost[stage] for stage in running if stage not in MESH_METRIC_SAMPLED_STAGES)
+        return fixed, sum(cost[stage] for stage in running if stage in MESH_METRIC_SAMPLED_STAGES)
+
+    fixed, sampled = costs()
+    for stage in MESH_METRIC_SKIPPABLE_STAGES:
+        if fixed + sampled * SAMPLING_MIN_FRACTION <= available:
+            break
+        skipped.append(stage)
+        fixed, sampled = costs()
+
+    fraction = (available - fixed) / sampled if sampled > 0.0 else 1.0
+    if fraction >= 1.0:
+        return 1.0, tuple(skipped)
+    fraction = max(fraction, SAMPLING_MIN_FRACTION)
+    return 2.0 ** math.floor(math.log2(fraction)), tuple(skipped)
+
+
+def _mesh_metrics_cache_key(digest, fraction, skipped):
+    """Exact partials are cached under the digest; estimates also under their plan."""
+    if fraction >= 1.0 and not skipped:
+        return digest
+    return f"{digest}|{fraction!r}|{','.join(skipped)}"
+
+
+def _measure_mesh_partial(entry, fraction, skipped, timings):
+    stages = {}
+    started = time.perf_counter()
+    mesh = mesh_arrays_from_buffers(entry["buffers"], entry["matrix"])
+    stages["extract"] = time.perf_counter() - started
+    seed = int(entry["digest"][:8], 16) if entry["digest"] else 0
+    partial = mesh_metric_partials(mesh, stages, sample_fraction=fraction, seed=seed, skip=skipped)
+    # Small meshes are dominated by per-call overhead and would inflate the estimates.
+    if mesh.face_count >= SAMPLING_STRATUM_FACES:
+        for stage, seconds in stages.items():
+            faces = partial["sampled_faces"] if stage in MESH_METRIC_SAMPLED_STAGES else mesh.face_count
+            if faces:
+                _stage_face_seconds[stage] = max(seconds / faces, 1e-9)
+    if timings is not None:
+        for stage, seconds in stages.items():
+            timings[stage] = timings.get(stage, 0.0) + seconds
+    return partial
+
+
+def compute_scene_mesh_metrics(snapshot, timings=None):
+    """Reduce a snapshot to scene metrics without touching Blender data.
+
+    Returns ``{"metrics", "cache_entries", "cache_hits", "cache_misses"}``;
+    ``metrics`` is None when the snapshot has no geometry. When
+    MESH_METRICS_TIME_BUDGET is set, large scenes skip or sample stages as
+    planned by plan_mesh_metrics(); the metrics report the stages skipped
+    and ``Metrics_seconds``, the time actually spent on the snapshot and
+    here (not the time waiting for a worker thread).
+    """
+    started = time.perf_counter()
+    fraction, skipped = plan_mesh_metrics(
+        sum(
+            len(entry["buffers"]["loop_total"])
+            for entry in snapshot["objects"]
+            if entry["partial"] is None
+        ),
+        spent=snapshot.get("seconds", 0.0),
+    )
+    partials = []
+    source_names = []
+    cache_entries = {}
+    cache_hits = 0
+    cache_misses = 0
+
+    for entry in snapshot["objects"]:
+        partial = entry["partial"]
+        key = entry["digest"]
+        if partial is None and key is not None:
+            key = _mesh_metrics_cache_key(key, fraction, skipped)
+            partial = entry["estimates"].get(key)
+        if partial is None:
+            partial = _measure_mesh_partial(entry, fraction, skipped, timings)
+            cache_misses += 1
         else:
-            metrics = calculate_mesh_metrics(combined_obj)
-            metrics["Source_object_count"] = len(source_names)
-            metrics["Source_objects"] = source_names
-            objects["CombinedSceneMesh"] = metrics
-    except Exception as exc:
-        log_warning("Could not calculate combined scene mesh metrics", exc)
-        objects["CombinedSceneMesh"] = {"error": f"{type(exc).__name__}: {exc}"}
-    finally:
-        _remove_combined_scene_mesh_object(combined_obj, combined_mesh)
+            cache_hits += 1
+        if key is not None:
+            cache_entries[key] = partial
+        partials.append(partial)
+        source_names.append(entry["name"])
+
+    metrics = None
+    if partials:
+        # The scene row describes the merged world-space mesh, which has no
+        # transform of its own, so Transformations/Position keep their
+        # historical constant True; the per-object state has its own columns.
+        metrics = finalize_mesh_metrics(merge_mesh_metric_partials(partials))
+        metrics["All_transforms_applied"] = bool(snapshot["transforms_applied"])
+        metrics["All_at_origin"] = bool(snapshot["at_origin"])
+        metrics["Source_object_count"] = len(source_names)
+        metrics["Source_objects"] = source_names
+        metrics["Cache_hits"] = cache_hits
+        metrics["Cache_misses"] = cache_misses
+        metrics["Metrics_seconds"] = round(
+            snapshot.get("seconds", 0.0) + time.perf_counter() - started, 3
+        )
+    return {
+        "metrics": metrics,
+        "cache_entries": cache_entries,
+        "cache_hits": cache_hits,
+        "cache_misses": cache_misses,
+    }
+
+
+def _commit_cache_result(result, timings):
+    global DEBUG_METRICS_CACHE, DEBUG_METRIC_TIMINGS
+    store_mesh_metrics_cache(result["cache_entries"])
+    DEBUG_METRICS_CACHE = f"hits={result['cache_hits']} misses={result['cache_misses']}"
+    DEBUG_METRIC_TIMINGS = timings
+
+
+def calculate_scene_mesh_metrics():
+    """Calculate one metric set from all scene geometry except cameras and lights.
+
+    Each evaluated object contributes additive partial totals; the scene-level
+    values are reduced from their sum. Objects without renderable/convertible
+    geometry (empties, speakers, light probes, etc.) are ignored naturally.
+    Partials are reused from the embedded cache for every object whose
+    evaluated mesh is unchanged since the previous save.
+    """
+    timings = {}
+    result = compute_scene_mesh_metrics(snapshot_scene_mesh_metrics(timings), timings)
+    _commit_cache_result(result, timings)
+    return result["metrics"]
+
+
+MESH_METRIC_FIELDS = [
+    "SavedAtUnix", "SaveID", "ObjectName", "UV_area", "UV_islands",
+    "UV_stretch", "UV_textel_density", "Normal_percentage",
+    "Transformations", "Position", "Non_quads_percentage",
+    "Vertex_duplicate", "Vertex_duplicate_percentage", "N_faces",
+    "N_meshes", "Face_by_mesh", "Angle", "Source_object_count",
+    "Source_objects", "Cache_hits", "Cache_misses", "Sampled",
+    "UV_stretch_ci", "Angle_ci", "Skipped_stages", "Metrics_seconds",
+    "All_transforms_applied", "All_at_origin", "Error",
+]
 
+
+def write_mesh_metrics_csv(objects, saved_at, save_id):
+    """Embed the metric rows of one save and mirror them to the temporary CSV."""
     payload = {
         "schema_version": 2,
         "logger_version": LOGGER_VERSION,
-        "saved_at_unix": round(time.time(), 3),
+        "saved_at_unix": saved_at,
+        "save_id": save_id,
         "blend_file": bpy.data.filepath,
-        "calculation_mode": "combined_scene_geometry",
+        "calculation_mode": "per_object_merged",
         "excluded_object_types": ["CAMERA", "LIGHT"],
         "scene_restored": True,
         "objects": objects,
@@ -1388,20 +2319,24 @@ def save_scene_mesh_metrics():
     if LEGACY_MESH_METRICS_JSON_TEXTBLOCK in bpy.data.texts:
         bpy.data.texts.remove(bpy.data.texts[LEGACY_MESH_METRICS_JSON_TEXTBLOCK])
 
-    metric_fields = [
-        "SavedAtUnix", "ObjectName", "UV_area", "UV_islands",
-        "UV_stretch", "UV_textel_density", "Normal_percentage",
-        "Transformations", "Position", "Non_quads_percentage",
-        "Vertex_duplicate", "Vertex_duplicate_percentage", "N_faces",
-        "N_meshes", "Face_by_mesh", "Angle", "Source_object_count",
-        "Source_objects", "Error",
-    ]
-    csv_buffer = io.StringIO()
-    writer = csv.DictWriter(csv_buffer, fieldnames=metric_fields, lineterminator="\n")
-    writer.writeheader()
+    rows = _mesh_metrics_rows(objects, saved_at, save_id)
+    csv_content = _csv_text(MESH_METRIC_FIELDS, rows)
+    with open(TEMP_MESH_METRICS_CSV_PATH, "w", encoding="utf-8", newline="") as handle:
+        handle.write(csv_content)
+    metrics_csv_txt = get_or_create_textblock(MESH_METRICS_CSV_TEXTBLOCK)
+    metrics_csv_txt.clear()
+    metrics_csv_txt.write(csv_content)
+    append_mesh_metrics_history(rows)
+    return payload
+
+
+def _mesh_metrics_rows(objects, saved_at, save_id):
+    metric_fields = MESH_METRIC_FIELDS
+    rows = []
     for object_name, metrics in objects.items():
         row = {field: "" for field in metric_fields}
-        row["SavedAtUnix"] = payload["saved_at_unix"]
+        row["SavedAtUnix"] = saved_at
+        row["SaveID"] = save_id
         row["ObjectName"] = object_name
         if isinstance(metrics, dict):
             for field in metric_fields:
@@ -1411,15 +2346,289 @@ def save_scene_mesh_metrics():
                         value = json.dumps(value, ensure_ascii=False)
                     row[field] = value
             row["Error"] = metrics.get("error", "")
-        writer.writerow(row)
+        rows.append(row)
+    return rows
 
-    csv_content = csv_buffer.getvalue()
-    with open(TEMP_MESH_METRICS_CSV_PATH, "w", encoding="utf-8", newline="") as handle:
-        handle.write(csv_content)
-    metrics_csv_txt = get_or_create_textblock(MESH_METRICS_CSV_TEXTBLOCK)
-    metrics_csv_txt.clear()
-    metrics_csv_txt.write(csv_content)
-    return payload
+
+MESH_METRICS_HISTORY_FIELDS = ["SessionID", "BlendFile"] + MESH_METRIC_FIELDS
+
+
+def _csv_text(fieldnames, rows, header=True):
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=fieldnames, extrasaction="ignore", lineterminator="\n")
+    if header:
+        writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue()
+
+
+def _seal_history_chunk(text):
+    """Compress one CSV text (header included) into a textblock-safe string."""
+    return base64.b64encode(zlib.compress(text.encode("utf-8"), 9)).decode("ascii")
+
+
+_BLEND_TAG_SALTS = {}
+
+
+def _blend_tag_salt():
+    """Random salt kept next to the temporary history; it never leaves this machine."""
+    path = os.path.splitext(TEMP_MESH_METRICS_HISTORY_CSV_PATH)[0] + ".salt"
+    salt = _BLEND_TAG_SALTS.get(path)
+    if salt is None:
+        try:
+            try:
+                with open(path, "xb") as handle:
+                    handle.write(os.urandom(16))
+            except FileExistsError:
+                pass
+            with open(path, "rb") as handle:
+                salt = handle.read()
+        except OSError as exc:
+            log_warning("Could not read the mesh metrics history salt", exc)
+        if not salt or len(salt) < 16:
+            # Rows of this session still group together, but not with earlier ones.
+            salt = os.urandom(16)
+        _BLEND_TAG_SALTS[path] = salt
+    return salt
+
+
+def blend_file_tag(filepath):
+    """Salted hash identifying a .blend in the history without exporting its path.
+
+    The path can contain user names and folder layout, so only this tag is
+    stored. It is stable on one machine and empty for an unsaved file.
+    """
+    if not filepath:
+        return ""
+    return hashlib.blake2b(filepath.encode("utf-8"), key=_blend_tag_salt(), digest_size=8).hexdigest()
+
+
+def _history_rows(rows, filepath):
+    blend_file = blend_file_tag(filepath)
+    return [{"SessionID": SESSION_ID, "BlendFile": blend_file, **row} for row in rows]
+
+
+def append_mesh_metrics_history(rows):
+    """Append the metric rows of one save to the embedded history.
+
+    The history is never rewritten: new rows go to a plain CSV tail, and once
+    the tail holds MESH_METRICS_HISTORY_CHUNK_ROWS rows it is sealed into a
+    zlib+base64 chunk that is not touched again. Every chunk keeps its own
+    header, so a later change of MESH_METRIC_FIELDS only starts a new chunk.
+    The rows are also appended to TEMP_MESH_METRICS_HISTORY_CSV_PATH, which
+    every open .blend shares; the BlendFile column (blend_file_tag, not the
+    path) tells their rows apart.
+    """
+    rows = _history_rows(rows, bpy.data.filepath)
+    payload = {"format": MESH_METRICS_HISTORY_FORMAT, "chunks": [], "tail": "", "tail_rows": 0}
+    if MESH_METRICS_HISTORY_TEXTBLOCK in bpy.data.texts:
+        try:
+            payload = json.loads(bpy.data.texts[MESH_METRICS_HISTORY_TEXTBLOCK].as_string())
+        except ValueError as exc:
+            # Appending over an unreadable history would silently lose it.
+            log_warning("Could not read the embedded mesh metrics history", exc)
+            return False
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format") != MESH_METRICS_HISTORY_FORMAT
+            or not isinstance(payload.get("chunks"), list)
+        ):
+            log_warning("Unsupported embedded mesh metrics history format")
+            return False
+
+    tail = payload.get("tail", "")
+    tail_fields = csv.DictReader(io.StringIO(tail)).fieldnames if tail else None
+    if tail_fields and tail_fields != MESH_METRICS_HISTORY_FIELDS:
+        payload["chunks"].append({"rows": payload.get("tail_rows", 0), "data": _seal_history_chunk(tail)})
+        tail = ""
+        payload["tail_rows"] = 0
+
+    tail += _csv_text(MESH_METRICS_HISTORY_FIELDS, rows, header=not tail)
+    payload["tail_rows"] = payload.get("tail_rows", 0) + len(rows)
+    if payload["tail_rows"] >= MESH_METRICS_HISTORY_CHUNK_ROWS:
+        payload["chunks"].append({"rows": payload["tail_rows"], "data": _seal_history_chunk(tail)})
+        tail = ""
+        payload["tail_rows"] = 0
+    payload["tail"] = tail
+
+    try:
+        txt = get_or_create_textblock(MESH_METRICS_HISTORY_TEXTBLOCK)
+        txt.clear()
+        txt.write(json.dumps(payload, separators=(",", ":")))
+    except Exception as exc:
+        log_warning("Could not embed the mesh metrics history", exc)
+        return False
+
+    try:
+        _append_temp_history_csv(rows)
+    except OSError as exc:
+        log_warning("Could not append to the temporary mesh metrics history", exc)
+    return True
+
+
+def _seal_temp_history_csv(path):
+    """Compress the temporary history CSV to ``<name>.<n>.csv.gz`` and remove it."""
+    root, extension = os.path.splitext(path)
+    number = 1
+    while os.path.exists(f"{root}.{number}{extension}.gz"):
+        number += 1
+    sealed = f"{root}.{number}{extension}.gz"
+    with open(path, "rb") as source, gzip.open(sealed + ".tmp", "wb") as target:
+        shutil.copyfileobj(source, target)
+    os.replace(sealed + ".tmp", sealed)
+    os.remove(path)
+
+
+def _append_temp_history_csv(rows):
+    """Append to the temporary history CSV, sealing it when outdated or too large.
+
+    Like the embedded history, the shared file does not grow as plain CSV:
+    once it reaches MESH_METRICS_HISTORY_TEMP_MAX_BYTES, or if its header was
+    written by another logger version, it is compressed to
+    ``<name>.<n>.csv.gz`` and a new file is started. A sealed file keeps its
+    own columns instead of receiving misaligned rows.
+    """
+    path = TEMP_MESH_METRICS_HISTORY_CSV_PATH
+    header = None
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8", newline="") as handle:
+            header = next(csv.reader(handle), None)
+    if header is not None and (
+        header != MESH_METRICS_HISTORY_FIELDS
+        or os.path.getsize(path) >= MESH_METRICS_HISTORY_TEMP_MAX_BYTES
+    ):
+        _seal_temp_history_csv(path)
+        header = None
+    with open(path, "a", encoding="utf-8", newline="") as handle:
+        handle.write(_csv_text(MESH_METRICS_HISTORY_FIELDS, rows, header=header is None))
+
+
+def _scene_metrics_objects(metrics=None, error=None):
+    if error is not None:
+        return {"CombinedSceneMesh": {"error": f"{type(error).__name__}: {error}"}}
+    if metrics is None:
+        return {"CombinedSceneMesh": {
+            "error": "No convertible geometry found after excluding cameras and lights"
+        }}
+    return {"CombinedSceneMesh": metrics}
+
+
+# Metrics computed by the worker thread of the last save, if not committed yet.
+_mesh_metrics_job = None
+
+
+def _run_mesh_metrics_job(job):
+    try:
+        job["result"] = compute_scene_mesh_metrics(job["snapshot"], job["timings"])
+    except Exception as exc:
+        job["error"] = exc
+    finally:
+        job["snapshot"] = None
+
+
+def finish_pending_mesh_metrics():
+    """Commit the metrics of the previous asynchronous save, waiting if needed.
+
+    Runs on the main thread, from the polling timer or from the next
+    save_pre. The save they measure has already been written by then, so
+    the rows only reach the .blend on disk with the next save: the embedded
+    text blocks lag the saved file by one save.
+    """
+    global _mesh_metrics_job
+    job = _mesh_metrics_job
+    if job is None:
+        return None
+    _mesh_metrics_job = None
+    job["thread"].join()
+
+    if job["error"] is not None:
+        log_warning("Could not calculate combined scene mesh metrics", job["error"])
+        return write_mesh_metrics_csv(
+            _scene_metrics_objects(error=job["error"]), job["saved_at"], job["save_id"]
+        )
+    _commit_cache_result(job["result"], job["timings"])
+    return write_mesh_metrics_csv(
+        _scene_metrics_objects(job["result"]["metrics"]), job["saved_at"], job["save_id"]
+    )
+
+
+def discard_pending_mesh_metrics():
+    """Close an uncommitted job whose .blend is no longer loaded.
+
+    Its rows cannot be embedded in that file any more, so they are only
+    appended to the temporary history CSV, tagged with the file they
+    measure; its cache entries are dropped.
+    """
+    global _mesh_metrics_job
+    job = _mesh_metrics_job
+    if job is None:
+        return
+    _mesh_metrics_job = None
+    job["thread"].join()
+
+    if job["error"] is not None:
+        objects = _scene_metrics_objects(error=job["error"])
+    else:
+        objects = _scene_metrics_objects(job["result"]["metrics"])
+    rows = _mesh_metrics_rows(objects, job["saved_at"], job["save_id"])
+    try:
+        _append_temp_history_csv(_history_rows(rows, job["blend_file"]))
+    except OSError as exc:
+        log_warning("Could not append to the temporary mesh metrics history", exc)
+
+
+def _poll_mesh_metrics_job():
+    job = _mesh_metrics_job
+    if job is None:
+        return None
+    if job["thread"].is_alive():
+        return MESH_METRICS_POLL_INTERVAL
+    try:
+        finish_pending_mesh_metrics()
+    except Exception as exc:
+        log_warning("Could not embed asynchronous mesh metrics", exc)
+    return None
+
+
+def save_scene_mesh_metrics():
+    """Calculate one metric set from all scene geometry except cameras and lights.
+
+    Every row is stamped with a fresh SaveID and the time of the save it
+    measures. With ASYNC_MESH_METRICS the buffers are only snapshotted here
+    and the rows are committed later; the function then returns None.
+    """
+    global _mesh_metrics_job
+
+    save_id = str(uuid.uuid4())
+    saved_at = round(time.time(), 3)
+    timings = {}
+    try:
+        snapshot = snapshot_scene_mesh_metrics(timings)
+        if ASYNC_MESH_METRICS:
+            job = {
+                "snapshot": snapshot, "timings": timings, "save_id": save_id,
+                "saved_at": saved_at, "blend_file": bpy.data.filepath,
+                "result": None, "error": None,
+            }
+            job["thread"] = threading.Thread(
+                target=_run_mesh_metrics_job, args=(job,),
+                name="DataLoggerMeshMetrics", daemon=True,
+            )
+            _mesh_metrics_job = job
+            job["thread"].start()
+            bpy.app.timers.register(
+                _poll_mesh_metrics_job, first_interval=MESH_METRICS_POLL_INTERVAL
+            )
+            return None
+
+        result = compute_scene_mesh_metrics(snapshot, timings)
+        _commit_cache_result(result, timings)
+        objects = _scene_metrics_objects(result["metrics"])
+    except Exception as exc:
+        log_warning("Could not calculate combined scene mesh metrics", exc)
+        objects = _scene_metrics_objects(error=exc)
+
+    return write_mesh_metrics_csv(objects, saved_at, save_id)
 
 # OPERATOR DETECTION
 
@@ -1493,6 +2702,93 @@ def normalize_operator_name(bl_idname):
     return bl_idname.replace("_OT_", ".").lower()
 
 
+# Category bits produced by the operator classifier.
+OP_CATEGORY_CTRL_V = 1
+OP_CATEGORY_SHIFT_D = 2
+OP_CATEGORY_ALT_D = 4
+OP_CATEGORY_MERGE = 8
+OP_CATEGORY_UV = 16
+OP_CATEGORY_UV_TRANSFORM = 32
+
+OPERATOR_FLAG_CATEGORIES = (
+    ("ctrl_v", OP_CATEGORY_CTRL_V),
+    ("shift_d", OP_CATEGORY_SHIFT_D),
+    ("alt_d", OP_CATEGORY_ALT_D),
+    ("merge", OP_CATEGORY_MERGE),
+)
+
+# Rule table: (category, exact names, substrings, prefixes, suffixes, excluded
+# substrings). A normalized operator name matches a rule when it is one of the
+# exact names or contains/starts/ends with one of the patterns, and contains
+# none of the excluded substrings.
+OPERATOR_RULES = (
+    (OP_CATEGORY_CTRL_V, (), ("pastebuffer", "wm.paste"), (), (".paste",), ()),
+    (
+        OP_CATEGORY_SHIFT_D,
+        ("object.duplicate", "mesh.duplicate"),
+        ("object.duplicate_move", "mesh.duplicate_move"),
+        (), (), ("linked",),
+    ),
+    (
+        OP_CATEGORY_ALT_D,
+        (),
+        ("object.duplicate_move_linked", "object.duplicate_linked"),
+        (), (), (),
+    ),
+    (OP_CATEGORY_MERGE, MERGE_OPS, ("merge",), (), (), ()),
+    (OP_CATEGORY_UV, UV_DEPLOY_OPS | UV_ASSOCIATED_OPS, (), ("uv.",), (), ()),
+    (OP_CATEGORY_UV_TRANSFORM, UV_TRANSFORM_OPS, (), (), (), ()),
+)
+
+
+def _compile_operator_rules(rules):
+    """Split the rule table into an exact-name lookup and pattern rules."""
+    exact = {}
+    patterns = []
+    for category, names, substrings, prefixes, suffixes, excluded in rules:
+        for name in names:
+            if not any(part in name for part in excluded):
+                exact[name] = exact.get(name, 0) | category
+        if substrings or prefixes or suffixes:
+            patterns.append(
+                (category, tuple(substrings), tuple(prefixes), tuple(suffixes), tuple(excluded))
+            )
+    return exact, tuple(patterns)
+
+
+_OPERATOR_EXACT_CATEGORIES, _OPERATOR_PATTERN_RULES = _compile_operator_rules(OPERATOR_RULES)
+
+# bl_idname -> (normalized name, category mask). Operator ids are a small,
+# closed vocabulary, so every distinct id is classified only once.
+_operator_classification_cache = {}
+
+
+def _classify_normalized_operator(op):
+    mask = _OPERATOR_EXACT_CATEGORIES.get(op, 0)
+    for category, substrings, prefixes, suffixes, excluded in _OPERATOR_PATTERN_RULES:
+        if mask & category:
+            continue
+        if excluded and any(part in op for part in excluded):
+            continue
+        if (
+            any(part in op for part in substrings)
+            or (prefixes and op.startswith(prefixes))
+            or (suffixes and op.endswith(suffixes))
+        ):
+            mask |= category
+    return mask
+
+
+def classify_operator(bl_idname):
+    """Return ``(normalized_name, category_mask)`` for a Blender operator id."""
+    cached = _operator_classification_cache.get(bl_idname)
+    if cached is None:
+        op = normalize_operator_name(bl_idname)
+        cached = (op, _classify_normalized_operator(op))
+        _operator_classification_cache[bl_idname] = cached
+    return cached
+
+
 def mark_uv_pending():
     global _uv_action_pending, _uv_last_action_time, DEBUG_UV_PENDING
 
@@ -1507,52 +2803,10 @@ def mark_uv_pending():
     return True
 
 
-def detect_flags_from_operator(bl_idname):
-    global operator_flags, _uv_transform_pending
-    global DEBUG_LAST_OPERATOR, DEBUG_LAST_FLAGS
-
-    op = normalize_operator_name(bl_idname)
-    DEBUG_LAST_OPERATOR = op
-
-    changed = False
-
-    if (
-        "view3d.pastebuffer" in op or
-        "wm.paste" in op or
-        "pastebuffer" in op or
-        op.endswith(".paste")
-    ):
-        if operator_flags["ctrl_v"] == 0:
-            operator_flags["ctrl_v"] = 1
-            changed = True
-
-    if (
-        "object.duplicate_move" in op or
-        op == "object.duplicate" or
-        "mesh.duplicate_move" in op or
-        op == "mesh.duplicate"
-    ):
-        if "linked" not in op:
-            if operator_flags["shift_d"] == 0:
-                operator_flags["shift_d"] = 1
-                changed = True
-
-    if (
-        "object.duplicate_move_linked" in op or
-        "object.duplicate_linked" in op
-    ):
-        if operator_flags["alt_d"] == 0:
-            operator_flags["alt_d"] = 1
-            changed = True
-
-    if op in MERGE_OPS or "merge" in op:
-        if operator_flags["merge"] == 0:
-            operator_flags["merge"] = 1
-            changed = True
-
+def _mesh_is_being_edited():
     edit_obj = getattr(bpy.context, "edit_object", None)
     active_obj = getattr(bpy.context, "object", None)
-    mesh_is_being_edited = bool(
+    return bool(
         (edit_obj is not None and edit_obj.type == "MESH")
         or (
             active_obj is not None
@@ -1561,18 +2815,32 @@ def detect_flags_from_operator(bl_idname):
         )
     )
 
-    uv_editor_transform = (
-        op in UV_TRANSFORM_OPS
-        and is_uv_editor_open()
-        and mesh_is_being_edited
-    )
 
-    if (
-        op in UV_DEPLOY_OPS
-        or op in UV_ASSOCIATED_OPS
-        or op.startswith("uv.")
-        or uv_editor_transform
-    ):
+def detect_flags_from_operator(bl_idname, uv_editor_open=None):
+    """Update the operator flags for one history entry.
+
+    ``uv_editor_open`` is an optional callable used instead of
+    ``is_uv_editor_open`` so a batch of operators can share one screen probe.
+    """
+    global operator_flags, _uv_transform_pending
+    global DEBUG_LAST_OPERATOR, DEBUG_LAST_FLAGS
+
+    op, mask = classify_operator(bl_idname)
+    DEBUG_LAST_OPERATOR = op
+
+    changed = False
+
+    for flag, category in OPERATOR_FLAG_CATEGORIES:
+        if mask & category and operator_flags[flag] == 0:
+            operator_flags[flag] = 1
+            changed = True
+
+    uv_editor_transform = False
+    if mask & OP_CATEGORY_UV_TRANSFORM:
+        probe = uv_editor_open if uv_editor_open is not None else is_uv_editor_open
+        uv_editor_transform = bool(probe() and _mesh_is_being_edited())
+
+    if mask & OP_CATEGORY_UV or uv_editor_transform:
         # UV operators and generic transforms executed while a UV editor is
         # open are tracked as UV activity, but never force a row by themselves.
         mark_uv_pending()
@@ -1589,33 +2857,90 @@ def detect_flags_from_operator(bl_idname):
     return changed
 
 
+def _operator_identity(op):
+    """Return an identity for one operator history entry."""
+    try:
+        pointer = op.as_pointer()
+    except Exception:
+        pointer = id(op)
+    try:
+        bl_id = op.bl_idname
+    except Exception:
+        bl_id = ""
+    return (pointer, bl_id)
+
+
+def _operator_history_tail(ops):
+    try:
+        return tuple(_operator_identity(op) for op in list(ops)[-OPERATOR_TAIL_LENGTH:])
+    except Exception as exc:
+        log_warning("Could not read the operator history", exc)
+        return ()
+
+
+def find_new_operator_start(identities, tail):
+    """Return the index of the first history entry that was not processed yet.
+
+    Once Blender's operator history is full, every new operator evicts the
+    oldest one and the length stays constant. New entries are located by
+    identity instead: the most recent position whose predecessors agree with
+    the remembered tail marks the last processed operator. Predecessors that
+    were already evicted from the front are not required to match. If the
+    newest remembered entry has disappeared, shorter prefixes of the tail are
+    tried before treating the whole history as new.
+    """
+    if not tail:
+        return 0
+
+    for keep in range(len(tail), 0, -1):
+        expected = tail[:keep]
+        last = expected[-1]
+        for end in range(len(identities) - 1, -1, -1):
+            if identities[end] != last:
+                continue
+            matched = True
+            for offset in range(1, keep):
+                position = end - offset
+                if position < 0:
+                    break
+                if identities[position] != expected[-1 - offset]:
+                    matched = False
+                    break
+            if matched:
+                return end + 1
+    return 0
+
+
 def process_new_operators():
-    global _last_operator_index
+    global _last_operator_tail
 
     changed = False
 
     try:
         wm = bpy.context.window_manager
-        ops = wm.operators
-        count = len(ops)
+        identities = [_operator_identity(op) for op in wm.operators]
+        start = find_new_operator_start(identities, _last_operator_tail)
+        _last_operator_tail = tuple(identities[-OPERATOR_TAIL_LENGTH:])
 
-        if count < _last_operator_index:
-            _last_operator_index = 0
-
-        if count == _last_operator_index:
+        if start >= len(identities):
             return False
 
-        for i in range(_last_operator_index, count):
-            try:
-                bl_id = ops[i].bl_idname
-            except Exception as exc:
-                log_warning("Could not read a recent operator", exc)
+        uv_editor_state = []
+
+        def uv_editor_open_once():
+            # The screen layout cannot change inside one batch, so walk the
+            # areas at most once however many transforms were recorded.
+            if not uv_editor_state:
+                uv_editor_state.append(is_uv_editor_open())
+            return uv_editor_state[0]
+
+        for _, bl_id in identities[start:]:
+            if not bl_id:
+                log_warning("Could not read a recent operator")
                 continue
 
-            if detect_flags_from_operator(bl_id):
+            if detect_flags_from_operator(bl_id, uv_editor_open=uv_editor_open_once):
                 changed = True
-
-        _last_operator_index = count
     except Exception as exc:
         log_warning("Could not process new operators", exc)
         return False
@@ -1637,7 +2962,7 @@ def operator_tracker(scene, depsgraph):
             datablock = getattr(update, "id", None)
             if isinstance(datablock, (bpy.types.Mesh, bpy.types.Object)):
                 meaningful_update = True
-                break
+                _dirty_baseline_ids.add(datablock.name)
     except Exception as exc:
         log_warning("Could not inspect depsgraph updates", exc)
 
@@ -1668,27 +2993,82 @@ class VIEW3D_OT_paste_logger(bpy.types.Operator):
 
 # STATE SNAPSHOT
 
+def _object_baseline_identity(obj):
+    """Cheap identity used to validate a persisted per-object record."""
+    try:
+        mesh = obj.data
+        layer = mesh.uv_layers.active
+        return [
+            obj.name,
+            mesh.name,
+            safe_mode_of_object(obj),
+            len(mesh.vertices),
+            len(mesh.edges),
+            len(mesh.polygons),
+            len(mesh.loops),
+            layer.name if layer is not None else "",
+            [round(float(v), 5) for row in obj.matrix_world for v in row],
+        ]
+    except Exception as exc:
+        log_warning(f"Could not read baseline identity for {getattr(obj, 'name', '?')}", exc)
+        return None
+
+
+def _object_snapshot_record(obj):
+    """Return per-object statistics and digests, reusing a validated saved record."""
+    identity = _object_baseline_identity(obj)
+    saved = _persisted_object_records.pop(obj.name, None)
+    if identity is not None and isinstance(saved, dict) and saved.get("identity") == identity:
+        return dict(saved, reused=True)
+
+    return {
+        "identity": identity,
+        "stats": list(get_realtime_mesh_stats_safe(obj)),
+        "geometry": _object_geometry_digest(obj),
+        "uv_coordinates": _object_uv_coordinate_digest(obj),
+        "uv_topology": _object_uv_topology_digest(obj),
+        "reused": False,
+    }
+
+
 def build_snapshot():
     scene = bpy.context.scene
-    meshes = [o for o in scene.objects if o.type == "MESH"]
+    meshes = sorted((o for o in scene.objects if o.type == "MESH"), key=lambda o: o.name)
+    persisted_scene = _persisted_scene_state
+    persisted_names = set(_persisted_object_records)
 
     user = get_camera_pos()
-    scene_radius = get_scene_radius()
     ox, oy, oz, orad = get_active_object_data()
     active_name = get_active_object_name()
 
+    object_records = {obj.name: _object_snapshot_record(obj) for obj in meshes}
+
     total_verts = 0
     ngons = 0
     tris = 0
     total_inverted = 0
 
-    for obj in meshes:
-        v, n, t, inv = get_realtime_mesh_stats_safe(obj)
+    for record in object_records.values():
+        v, n, t, inv = record["stats"]
         total_verts += v
         ngons += n
         tris += t
         total_inverted += inv
 
+    # The scene radius depends only on mesh bounds and object matrices, which
+    # are covered by the identity check; reuse it when every object matched.
+    radius_reusable = bool(
+        isinstance(persisted_scene, dict)
+        and persisted_scene.get("complete")
+        and object_records
+        and set(object_records) == persisted_names
+        and all(record["reused"] for record in object_records.values())
+    )
+    if radius_reusable:
+        scene_radius = float(persisted_scene.get("scene_radius", 0.0))
+    else:
+        scene_radius = get_scene_radius()
+
     total_mods = sum(len(o.modifiers) for o in scene.objects)
 
     active_obj = bpy.context.object
@@ -1697,9 +3077,18 @@ def build_snapshot():
     else:
         mode = "OBJECT"
 
-    geometry_hash = get_realtime_geometry_hash_safe()
-    uv_coordinate_hash = get_realtime_uv_coordinate_hash_safe()
-    uv_hash = get_realtime_uv_hash_safe()
+    geometry_hash = _combine_object_digests(
+        (name, record["geometry"]) for name, record in object_records.items()
+    )
+    uv_coordinate_hash = _combine_object_digests(
+        (name, record["uv_coordinates"]) for name, record in object_records.items()
+    )
+    if ENABLE_UV_CHANGE_TRACKING:
+        uv_hash = _combine_object_digests(
+            (name, record["uv_topology"]) for name, record in object_records.items()
+        )
+    else:
+        uv_hash = "UV_TRACKING_DISABLED"
 
     snapshot = {
         "user": (user[0], user[1], user[2]),
@@ -1717,6 +3106,7 @@ def build_snapshot():
         "uv_coordinate_hash": uv_coordinate_hash,
         "uv_hash": uv_hash,
         "occlusion": get_occlusion_state(),
+        "object_records": object_records,
     }
 
     # Preserve the original logger sensitivity. UV coordinates themselves are
@@ -1755,6 +3145,7 @@ def apply_snapshot_as_baseline(snapshot, signature):
     global prev_snapshot_signature
     global prev_active_object_name
     global prev_object_state
+    global prev_scene_radius, prev_object_records
 
     prev_vert_count = snapshot["verts"]
     prev_ngon_count = snapshot["ngons"]
@@ -1769,10 +3160,14 @@ def apply_snapshot_as_baseline(snapshot, signature):
     prev_snapshot_signature = signature
     prev_active_object_name = snapshot["active_name"]
     prev_object_state = snapshot["object"]
+    prev_scene_radius = snapshot["scene_radius"]
+    prev_object_records = snapshot.get("object_records", {})
+    # Every record in the new baseline is current, so nothing is stale.
+    _dirty_baseline_ids.clear()
 
 
 def init_state_full():
-    global _last_operator_index
+    global _last_operator_tail
     global _last_timestamp, _force_log_pending
     global _uv_action_pending, _uv_transform_pending
     global operator_flags
@@ -1797,15 +3192,15 @@ def init_state_full():
     DEBUG_UV_PENDING = 0
 
     try:
-        _last_operator_index = len(bpy.context.window_manager.operators)
+        _last_operator_tail = _operator_history_tail(bpy.context.window_manager.operators)
     except Exception as exc:
-        log_warning("Could not initialize the operator index", exc)
-        _last_operator_index = 0
+        log_warning("Could not initialize the operator history tail", exc)
+        _last_operator_tail = ()
 
 
 def init_state_deferred():
     """Reset cheap logger state without scanning every mesh immediately."""
-    global _last_operator_index, _last_timestamp, _force_log_pending
+    global _last_operator_tail, _last_timestamp, _force_log_pending
     global _uv_action_pending, _uv_transform_pending, operator_flags
     global prev_snapshot_signature, _baseline_ready
     global DEBUG_LAST_LOG_REASON, DEBUG_LAST_REBASE_REASON
@@ -1829,21 +3224,102 @@ def init_state_deferred():
     DEBUG_UV_PENDING = 0
 
     try:
-        _last_operator_index = len(bpy.context.window_manager.operators)
+        _last_operator_tail = _operator_history_tail(bpy.context.window_manager.operators)
     except Exception as exc:
-        log_warning("Could not initialize the operator index", exc)
-        _last_operator_index = 0
+        log_warning("Could not initialize the operator history tail", exc)
+        _last_operator_tail = ()
 
 
 def ensure_deferred_baseline():
     """Build the expensive baseline after recording has already started."""
-    global _baseline_ready
+    global _baseline_ready, DEBUG_LAST_REBASE_REASON
     if _baseline_ready or not timer_running:
         return
     snapshot, signature = build_snapshot()
     apply_snapshot_as_baseline(snapshot, signature)
     _baseline_ready = True
 
+    records = snapshot["object_records"]
+    reused = sum(1 for record in records.values() if record["reused"])
+    if reused:
+        DEBUG_LAST_REBASE_REASON = f"baseline_reused {reused}/{len(records)}"
+    discard_persisted_baseline()
+
+
+def persist_logger_baseline():
+    """Embed the current baseline so reopening the file can skip rehashing.
+
+    Records of objects that received depsgraph updates after the baseline was
+    taken, or that are in Edit Mode (whose mesh datablock lags the edit
+    BMesh), are left out and will simply be rehashed on load.
+    """
+    if not timer_running or not _baseline_ready or not prev_object_records:
+        return False
+
+    objects = {}
+    for name, record in prev_object_records.items():
+        identity = record.get("identity")
+        if not identity or identity[2] == "EDIT":
+            continue
+        if name in _dirty_baseline_ids or identity[1] in _dirty_baseline_ids:
+            continue
+        objects[name] = {key: value for key, value in record.items() if key != "reused"}
+
+    payload = {
+        "format": BASELINE_FORMAT_VERSION,
+        "logger_version": LOGGER_VERSION,
+        "saved_at_unix": round(time.time(), 3),
+        "scene": {
+            "mode": prev_mode,
+            "scene_radius": prev_scene_radius,
+            "obj_count": prev_object_count,
+            "mods": prev_total_mods,
+            "complete": len(objects) == len(prev_object_records),
+        },
+        "objects": objects,
+    }
+    try:
+        txt = get_or_create_textblock(BASELINE_TEXTBLOCK)
+        txt.clear()
+        txt.write(json.dumps(payload, separators=(",", ":")))
+    except Exception as exc:
+        log_warning("Could not embed the logger baseline", exc)
+        return False
+    return True
+
+
+def load_persisted_baseline():
+    """Read the embedded baseline of the file that has just been opened."""
+    global _persisted_object_records, _persisted_scene_state
+
+    discard_persisted_baseline()
+    if BASELINE_TEXTBLOCK not in bpy.data.texts:
+        return False
+
+    try:
+        payload = json.loads(bpy.data.texts[BASELINE_TEXTBLOCK].as_string())
+    except ValueError as exc:
+        log_warning("Could not read the embedded logger baseline", exc)
+        return False
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format") != BASELINE_FORMAT_VERSION
+        or payload.get("logger_version") != LOGGER_VERSION
+        or not isinstance(payload.get("objects"), dict)
+    ):
+        return False
+
+    _persisted_object_records = dict(payload["objects"])
+    _persisted_scene_state = payload.get("scene")
+    return True
+
+
+def discard_persisted_baseline():
+    global _persisted_object_records, _persisted_scene_state
+    _persisted_object_records = {}
+    _persisted_scene_state = None
+
 # LOGGER CONTROL
 
 def has_accepted_consent():
@@ -2378,6 +3854,8 @@ def check_consent_on_load(dummy):
     # When a .blend file is opened, stop any previous capture before checking
     # whether this file has consent.
     hard_stop_logger_on_file_load()
+    discard_pending_mesh_metrics()
+    load_persisted_baseline()
 
     # With consent disabled, never auto-start and never show a popup.
     # Recording can begin only through the Start Logger button.
@@ -2411,6 +3889,12 @@ def handle_save(dummy):
     # save_pre: embed the latest logger CSV and mesh metrics in the same Ctrl+S.
     if not ENABLE_CONSENT_FLOW or has_accepted_consent():
         import_csv_to_blend()
+        persist_logger_baseline()
+    # Rows of a previous asynchronous save are embedded now at the latest.
+    try:
+        finish_pending_mesh_metrics()
+    except Exception as exc:
+        log_warning("Could not embed asynchronous mesh metrics", exc)
     save_scene_mesh_metrics()
 
 
@@ -2570,6 +4054,12 @@ class DATA_LOGGER_PT_DebugPanel(bpy.types.Panel):
         col.label(text=f"{tr('uv_changed', context)}: {DEBUG_UV_HASH_CHANGED}")
         col.separator()
         col.label(text=DEBUG_LAST_FLAGS)
+        col.label(text=f"{tr('metrics_cache', context)}: {DEBUG_METRICS_CACHE}")
+        if ASYNC_MESH_METRICS:
+            col.label(text=f"{tr('metrics_job', context)}: {'ON' if _mesh_metrics_job else 'OFF'}")
+        for stage in MESH_METRIC_STAGES:
+            if stage in DEBUG_METRIC_TIMINGS:
+                col.label(text=f"  {stage}: {DEBUG_METRIC_TIMINGS[stage] * 1000.0:.1f} ms")
         col.separator()
         col.label(text=f"{tr('active_object', context)}: {get_active_object_name() or '-'}")
         col.label(text=f"{tr('mode', context)}: {bpy.context.mode}")
@@ -2734,6 +4224,7 @@ def unregister():
 
     if handle_save in bpy.app.handlers.save_pre:
         bpy.app.handlers.save_pre.remove(handle_save)
+    discard_pending_mesh_metrics()
 
     if operator_tracker in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(operator_tracker)
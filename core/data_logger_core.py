@@ -36,6 +36,84 @@ def normalize_operator_name(bl_idname: str) -> str:
     return str(bl_idname).replace("_OT_", ".").lower()
 
 
+OP_CATEGORY_CTRL_V = 1
+OP_CATEGORY_SHIFT_D = 2
+OP_CATEGORY_ALT_D = 4
+OP_CATEGORY_MERGE = 8
+OP_CATEGORY_UV = 16
+
+OPERATOR_FLAG_CATEGORIES = (
+    ("ctrl_v", OP_CATEGORY_CTRL_V),
+    ("shift_d", OP_CATEGORY_SHIFT_D),
+    ("alt_d", OP_CATEGORY_ALT_D),
+    ("merge", OP_CATEGORY_MERGE),
+)
+
+# (category, exact names, substrings, prefixes, suffixes, excluded substrings)
+OPERATOR_RULES = (
+    (OP_CATEGORY_CTRL_V, (), ("pastebuffer", "wm.paste"), (), (".paste",), ()),
+    (
+        OP_CATEGORY_SHIFT_D,
+        ("object.duplicate", "mesh.duplicate"),
+        ("object.duplicate_move", "mesh.duplicate_move"),
+        (), (), ("linked",),
+    ),
+    (
+        OP_CATEGORY_ALT_D,
+        (),
+        ("object.duplicate_move_linked", "object.duplicate_linked"),
+        (), (), (),
+    ),
+    (OP_CATEGORY_MERGE, MERGE_OPS, ("merge",), (), (), ()),
+    (OP_CATEGORY_UV, UV_DEPLOY_OPS | UV_ASSOCIATED_OPS, (), (), (), ()),
+)
+
+
+def compile_operator_rules(rules) -> tuple[dict[str, int], tuple]:
+    """Split a rule table into an exact-name lookup and pattern rules."""
+    exact: dict[str, int] = {}
+    patterns = []
+    for category, names, substrings, prefixes, suffixes, excluded in rules:
+        for name in names:
+            if not any(part in name for part in excluded):
+                exact[name] = exact.get(name, 0) | category
+        if substrings or prefixes or suffixes:
+            patterns.append(
+                (category, tuple(substrings), tuple(prefixes), tuple(suffixes), tuple(excluded))
+            )
+    return exact, tuple(patterns)
+
+
+_EXACT_CATEGORIES, _PATTERN_RULES = compile_operator_rules(OPERATOR_RULES)
+_CLASSIFICATION_CACHE: dict[str, tuple[str, int]] = {}
+
+
+def _classify_normalized(op: str) -> int:
+    mask = _EXACT_CATEGORIES.get(op, 0)
+    for category, substrings, prefixes, suffixes, excluded in _PATTERN_RULES:
+        if mask & category:
+            continue
+        if excluded and any(part in op for part in excluded):
+            continue
+        if (
+            any(part in op for part in substrings)
+            or (prefixes and op.startswith(prefixes))
+            or (suffixes and op.endswith(suffixes))
+        ):
+            mask |= category
+    return mask
+
+
+def classify_operator_name(bl_idname: str) -> tuple[str, int]:
+    """Return ``(normalized_name, category_mask)``, memoized per ``bl_idname``."""
+    cached = _CLASSIFICATION_CACHE.get(bl_idname)
+    if cached is None:
+        op = normalize_operator_name(bl_idname)
+        cached = (op, _classify_normalized(op))
+        _CLASSIFICATION_CACHE[bl_idname] = cached
+    return cached
+
+
 @dataclass
 class OperatorDetectionState:
     flags: dict[str, int] = field(default_factory=lambda: {
@@ -47,31 +125,16 @@ class OperatorDetectionState:
 
 def detect_flags_from_operator_name(bl_idname: str, state: OperatorDetectionState | None = None) -> tuple[OperatorDetectionState, bool]:
     state = state or OperatorDetectionState()
-    op = normalize_operator_name(bl_idname)
+    op, mask = classify_operator_name(bl_idname)
     state.last_operator = op
     changed = False
 
-    if "view3d.pastebuffer" in op or "wm.paste" in op or "pastebuffer" in op or op.endswith(".paste"):
-        if state.flags["ctrl_v"] == 0:
-            state.flags["ctrl_v"] = 1
-            changed = True
-
-    if "object.duplicate_move" in op or op == "object.duplicate" or "mesh.duplicate_move" in op or op == "mesh.duplicate":
-        if "linked" not in op and state.flags["shift_d"] == 0:
-            state.flags["shift_d"] = 1
-            changed = True
-
-    if "object.duplicate_move_linked" in op or "object.duplicate_linked" in op:
-        if state.flags["alt_d"] == 0:
-            state.flags["alt_d"] = 1
-            changed = True
-
-    if op in MERGE_OPS or "merge" in op:
-        if state.flags["merge"] == 0:
-            state.flags["merge"] = 1
+    for flag, category in OPERATOR_FLAG_CATEGORIES:
+        if mask & category and state.flags[flag] == 0:
+            state.flags[flag] = 1
             changed = True
 
-    if op in UV_DEPLOY_OPS or op in UV_ASSOCIATED_OPS:
+    if mask & OP_CATEGORY_UV:
         state.uv_action_pending = 1
         changed = True
 
@@ -0,0 +1,368 @@
+"""Distancia de Hausdorff exacta entre nubes de puntos grandes.
+
+Sigue la idea de Taha y Hanbury (2015): la distancia dirigida ``h(A, B)`` es
+el máximo, sobre ``a`` en ``A``, de la distancia de ``a`` a su vecino más
+cercano en ``B``; basta con conocer exactamente las distancias que pueden
+superar el máximo provisional ``cmax``. Un punto cuya cota superior ya es
+``<= cmax`` se descarta sin terminar su búsqueda.
+
+1. ``B`` se indexa en una rejilla uniforme. Cada punto ``a`` se proyecta
+   sobre la caja de ``B`` (``a'``, a distancia ``d0``) y busca en anillos
+   de celdas de radio creciente alrededor de la celda de ``a'``. Tras el
+   anillo ``r`` cualquier punto no visto está a más de
+   ``sqrt(d0² + (m + r·celda)²)``, con ``m`` la distancia de ``a'`` al borde
+   de su celda; las distancias halladas por debajo son exactas y elevan
+   ``cmax``.
+2. Los pocos puntos que quedan tras ``RING_LIMIT`` anillos (lejos de ``B``)
+   recorren ``B`` en orden aleatorio por bloques y abandonan en cuanto
+   encuentran un punto a ``<= cmax``.
+
+La rejilla supone una densidad más o menos uniforme. Si alguna celda pasa de
+``CELL_OVERLOAD`` puntos (un detalle esculpido sobre una base de pocos
+polígonos, o una nube casi colapsada con unos pocos puntos lejanos), los
+pares punto-celda crecerían sin límite; en ese caso ``B`` se indexa en un
+árbol de cajas partido por la mediana del eje más largo, con hojas de
+``LEAF_POINTS`` puntos sea cual sea la densidad. Un descenso voraz da una
+cota superior (se descartan los puntos ya ``<= cmax``) y el resto recorre un
+frente de pares ``(punto, nodo)`` que poda los nodos más lejanos que la
+mejor distancia conocida; si el frente supera ``FRONTIER_LIMIT`` pares, el
+lote se parte en dos.
+
+El resultado es exacto. La distancia simétrica empieza la segunda dirección
+con ``cmax`` igual a la primera, lo que poda todavía más.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+# Anillos de la rejilla recorridos antes de pasar a la búsqueda por bloques.
+RING_LIMIT = 2
+# Puntos de A procesados a la vez en la rejilla (acota la memoria de los pares).
+QUERY_BATCH = 32_768
+# Tamaño de bloque de la búsqueda por fuerza bruta con salida temprana.
+BRUTE_QUERY_BLOCK = 1_024
+BRUTE_TARGET_BLOCK = 8_192
+# Puntos esperados por celda en la rejilla de B.
+POINTS_PER_CELL = 4.0
+# Máximo de celdas por punto de B; con extensiones muy desiguales se agranda la celda.
+MAX_CELLS_PER_POINT = 2
+# Puntos máximos en una celda de la rejilla; por encima se usa el árbol.
+CELL_OVERLOAD = 64
+# Puntos de B por hoja del árbol.
+LEAF_POINTS = 8
+# Pares (punto, nodo) máximos en el frente del árbol; por encima el lote se parte en dos.
+FRONTIER_LIMIT = 1 << 22
+
+
+def _as_points(points) -> np.ndarray:
+    """Acepta arrays, listas de tuplas o de ``mathutils.Vector``."""
+    array = np.asarray([tuple(point) for point in points] if not isinstance(points, np.ndarray) else points,
+                       dtype=np.float64)
+    return array.reshape(-1, 3)
+
+
+def _ring_offsets(radius: int) -> np.ndarray:
+    span = np.arange(-radius, radius + 1)
+    grid = np.stack(np.meshgrid(span, span, span, indexing="ij"), axis=-1).reshape(-1, 3)
+    return grid[np.abs(grid).max(axis=1) == radius]
+
+
+class _Grid:
+    """Rejilla uniforme sobre los puntos de B, ordenados por celda.
+
+    ``starts[key]:starts[key + 1]`` son los puntos de la celda ``key``; una
+    tabla densa evita búsquedas binarias dispersas sobre millones de claves.
+    """
+
+    def __init__(self, points: np.ndarray):
+        self.origin = points.min(axis=0)
+        self.upper = points.max(axis=0)
+        extent = self.upper - self.origin
+        largest = float(extent.max())
+        if largest <= 0.0:
+            self.cell = 1.0
+        else:
+            # Volumen (o área/longitud si la nube es plana) repartido entre las celdas.
+            used = extent[extent > largest * 1e-9]
+            self.cell = (float(np.prod(used)) * POINTS_PER_CELL / points.shape[0]) ** (1.0 / used.size)
+            self.cell = max(self.cell, largest * 1e-6)
+        while True:
+            self.shape = np.floor(extent / self.cell).astype(np.int64) + 1
+            if np.prod(self.shape.astype(np.float64)) <= MAX_CELLS_PER_POINT * points.shape[0] + 1:
+                break
+            self.cell *= 2.0
+        cells = np.minimum(np.floor((points - self.origin) / self.cell).astype(np.int64), self.shape - 1)
+        keys = self._key(cells)
+        order = np.argsort(keys, kind="stable")
+        self.points = points[order]
+        self.starts = np.zeros(int(np.prod(self.shape)) + 1, dtype=np.int64)
+        occupancy = np.bincount(keys, minlength=self.starts.size - 1)
+        self.max_occupancy = int(occupancy.max())
+        np.cumsum(occupancy, out=self.starts[1:])
+
+    def _key(self, cells: np.ndarray) -> np.ndarray:
+        return (cells[:, 0] * self.shape[1] + cells[:, 1]) * self.shape[2] + cells[:, 2]
+
+    def locate(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Celda de la proyección sobre la caja, ``d0²`` y margen al borde de la celda."""
+        clamped = np.clip(points, self.origin, self.upper)
+        outside = np.square(points - clamped).sum(axis=1)
+        scaled = (clamped - self.origin) / self.cell
+        cells = np.minimum(np.floor(scaled).astype(np.int64), self.shape - 1)
+        local = scaled - cells
+        margin = np.minimum(local, 1.0 - local).min(axis=1).clip(min=0.0) * self.cell
+        return cells, outside, margin
+
+    def ring_nearest(self, queries: np.ndarray, cells: np.ndarray, radius: int) -> np.ndarray:
+        """Distancia mínima de cada consulta a los puntos del anillo ``radius``."""
+        best = np.full(queries.shape[0], np.inf)
+        for offset in _ring_offsets(radius):
+            probe = cells + offset
+            inside = np.all((probe >= 0) & (probe < self.shape), axis=1)
+            query_index = np.flatnonzero(inside)
+            if query_index.size == 0:
+                continue
+            keys = self._key(probe[inside])
+            starts = self.starts[keys]
+            counts = self.starts[keys + 1] - starts
+            occupied = counts > 0
+            if not occupied.any():
+                continue
+            query_index, starts, counts = query_index[occupied], starts[occupied], counts[occupied]
+            owners = np.repeat(query_index, counts)
+            segments = np.cumsum(counts) - counts
+            targets = np.repeat(starts - segments, counts) + np.arange(owners.size)
+            distances = np.linalg.norm(self.points[targets] - queries[owners], axis=1)
+            # Los pares están agrupados por consulta: un mínimo por segmento.
+            nearest = np.minimum.reduceat(distances, segments)
+            best[query_index] = np.minimum(best[query_index], nearest)
+        return best
+
+
+def _box_distance_squared(points, lower, upper) -> np.ndarray:
+    gap = np.maximum(lower - points, 0.0) + np.maximum(points - upper, 0.0)
+    return np.einsum("ij,ij->i", gap, gap)
+
+
+class _PointTree:
+    """Árbol de cajas sobre los puntos de B, construido nivel a nivel.
+
+    Los hijos de un nodo son consecutivos (``first_child`` y
+    ``first_child + 1``); las hojas tienen ``-1`` y sus puntos son
+    ``points[start:start + count]``.
+    """
+
+    def __init__(self, points: np.ndarray):
+        total = points.shape[0]
+        ranks = np.empty((3, total), dtype=np.int64)
+        for axis in range(3):
+            ranks[axis, np.argsort(points[:, axis], kind="stable")] = np.arange(total)
+        # Una fila de relleno permite reducir rangos que terminan en el último punto.
+        padding = np.zeros((1, 3))
+
+        order = np.arange(total)
+        lower, upper, first_child, start, count = [], [], [], [], []
+        begin = np.zeros(1, dtype=np.int64)
+        end = np.full(1, total, dtype=np.int64)
+        created = 1
+        while begin.size:
+            ordered = np.vstack([points[order], padding])
+            bounds = np.column_stack([begin, end]).ravel()
+            level_lower = np.minimum.reduceat(ordered, bounds)[::2]
+            level_upper = np.maximum.reduceat(ordered, bounds)[::2]
+            lower.append(level_lower)
+            upper.append(level_upper)
+            start.append(begin)
+            count.append(end - begin)
+            inner = end - begin > LEAF_POINTS
+            children = np.full(begin.size, -1, dtype=np.int64)
+            children[inner] = created + 2 * np.arange(int(inner.sum()))
+            first_child.append(children)
+            created += 2 * int(inner.sum())
+            begin, end = begin[inner], end[inner]
+            if not begin.size:
+                break
+
+            axis = (level_upper[inner] - level_lower[inner]).argmax(axis=1)
+            sizes = end - begin
+            segment = np.repeat(np.arange(begin.size), sizes)
+            positions = np.repeat(begin - (np.cumsum(sizes) - sizes), sizes) + np.arange(segment.size)
+            members = order[positions]
+            key = segment * total + ranks[axis[segment], members]
+            order[positions] = members[np.argsort(key, kind="stable")]
+
+            middle = (begin + end) // 2
+            begin = np.column_stack([begin, middle]).ravel()
+            end = np.column_stack([middle, end]).ravel()
+
+        self.points = points[order]
+        self.lower = np.concatenate(lower)
+        self.upper = np.concatenate(upper)
+        self.first_child = np.concatenate(first_child)
+        self.start = np.concatenate(start)
+        self.count = np.concatenate(count)
+
+    def _leaf_nearest(self, queries, query_index, leaves, best) -> None:
+        """Actualiza ``best`` (cuadrados) con los puntos de las hojas ``leaves``."""
+        counts = self.count[leaves]
+        owners = np.repeat(query_index, counts)
+        segments = np.cumsum(counts) - counts
+        targets = np.repeat(self.start[leaves] - segments, counts) + np.arange(owners.size)
+        difference = self.points[targets] - queries[owners]
+        squared = np.einsum("ij,ij->i", difference, difference)
+        grouped = np.argsort(owners, kind="stable")
+        owners, squared = owners[grouped], squared[grouped]
+        heads = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+        nearest = np.minimum.reduceat(squared, heads)
+        best[owners[heads]] = np.minimum(best[owners[heads]], nearest)
+
+    def greedy(self, queries) -> np.ndarray:
+        """Cota superior (al cuadrado): distancia a la hoja de caja más cercana en cada bifurcación."""
+        best = np.full(queries.shape[0], np.inf)
+        node = np.zeros(queries.shape[0], dtype=np.int64)
+        while True:
+            inner = np.flatnonzero(self.first_child[node] >= 0)
+            if not inner.size:
+                break
+            left = self.first_child[node[inner]]
+            points = queries[inner]
+            to_left = _box_distance_squared(points, self.lower[left], self.upper[left])
+            to_right = _box_distance_squared(points, self.lower[left + 1], self.upper[left + 1])
+            node[inner] = np.where(to_left <= to_right, left, left + 1)
+        self._leaf_nearest(queries, np.arange(queries.shape[0]), node, best)
+        return best
+
+    def refine(self, queries, best, cmax_squared: float) -> None:
+        """Completa ``best`` (cuadrados) de los puntos que aún pueden superar ``cmax``.
+
+        Al terminar, cada valor es exacto o ya es ``<= cmax``.
+        """
+        query_index = np.arange(queries.shape[0])
+        node = np.zeros(queries.shape[0], dtype=np.int64)
+        while query_index.size:
+            if query_index.size > FRONTIER_LIMIT and queries.shape[0] > 1:
+                # Frente demasiado grande: cada mitad del lote por separado.
+                half = queries.shape[0] // 2
+                for part in (slice(0, half), slice(half, None)):
+                    part_best = best[part]
+                    self.refine(queries[part], part_best, cmax_squared)
+                    best[part] = part_best
+                return
+            bound = _box_distance_squared(queries[query_index], self.lower[node], self.upper[node])
+            current = best[query_index]
+            useful = (bound < current) & (current > cmax_squared)
+            query_index, node = query_index[useful], node[useful]
+            leaf = self.first_child[node] < 0
+            if leaf.any():
+                self._leaf_nearest(queries, query_index[leaf], node[leaf], best)
+            query_index, children = query_index[~leaf], self.first_child[node[~leaf]]
+            query_index = np.concatenate([query_index, query_index])
+            node = np.concatenate([children, children + 1])
+
+
+def _brute_force_pass(queries: np.ndarray, upper: np.ndarray, targets: np.ndarray,
+                      cmax: float, rng: np.random.Generator) -> float:
+    """Completa las consultas sin resolver con salida temprana por bloques."""
+    targets = targets[rng.permutation(targets.shape[0])]
+    for start in range(0, queries.shape[0], BRUTE_QUERY_BLOCK):
+        block = queries[start:start + BRUTE_QUERY_BLOCK]
+        best = upper[start:start + BRUTE_QUERY_BLOCK].copy()
+        alive = best > cmax
+        for target_start in range(0, targets.shape[0], BRUTE_TARGET_BLOCK):
+            if not alive.any():
+                break
+            chunk = targets[target_start:target_start + BRUTE_TARGET_BLOCK]
+            alive_index = np.flatnonzero(alive)
+            squared = (
+                np.square(block[alive_index]).sum(axis=1)[:, None]
+                - 2.0 * block[alive_index] @ chunk.T
+                + np.square(chunk).sum(axis=1)[None, :]
+            )
+            # La expansión del cuadrado solo elige el candidato; su distancia se
+            # recalcula directamente para no arrastrar error de cancelación.
+            nearest = chunk[squared.argmin(axis=1)]
+            distances = np.linalg.norm(block[alive_index] - nearest, axis=1)
+            best[alive_index] = np.minimum(best[alive_index], distances)
+            alive[alive_index] = best[alive_index] > cmax
+        if alive.any():
+            # Recorrieron todo B: su distancia es exacta y mayor que cmax.
+            cmax = float(best[alive].max())
+    return cmax
+
+
+def _grid_directed(source: np.ndarray, target: np.ndarray, grid: _Grid, cmax: float,
+                   rng: np.random.Generator) -> float:
+    pending_points = []
+    pending_upper = []
+    for start in range(0, source.shape[0], QUERY_BATCH):
+        queries = source[start:start + QUERY_BATCH]
+        cells, outside, margin = grid.locate(queries)
+        best = np.full(queries.shape[0], np.inf)
+        for radius in range(RING_LIMIT + 1):
+            best = np.minimum(best, grid.ring_nearest(queries, cells, radius))
+            exact = best <= np.sqrt(outside + np.square(margin + radius * grid.cell))
+            if exact.any():
+                cmax = max(cmax, float(best[exact].max()))
+            # Exactas o incapaces de superar cmax: no hace falta seguir buscando.
+            keep = ~exact & (best > cmax)
+            queries, cells, best = queries[keep], cells[keep], best[keep]
+            outside, margin = outside[keep], margin[keep]
+            if queries.shape[0] == 0:
+                break
+        pending_points.append(queries)
+        pending_upper.append(best)
+
+    remaining = np.concatenate(pending_points)
+    upper = np.concatenate(pending_upper)
+    keep = upper > cmax
+    if keep.any():
+        cmax = _brute_force_pass(remaining[keep], upper[keep], target, cmax, rng)
+    return cmax
+
+
+def _tree_directed(source: np.ndarray, tree: _PointTree, cmax: float, rng: np.random.Generator) -> float:
+    # Orden aleatorio: los máximos aparecen pronto y podan el resto.
+    source = source[rng.permutation(source.shape[0])]
+    cmax_squared = cmax ** 2
+    for start in range(0, source.shape[0], QUERY_BATCH):
+        queries = source[start:start + QUERY_BATCH]
+        best = tree.greedy(queries)
+        pending = np.flatnonzero(best > cmax_squared)
+        if pending.size:
+            pending_best = best[pending]
+            tree.refine(queries[pending], pending_best, cmax_squared)
+            cmax_squared = max(cmax_squared, float(pending_best.max()))
+    return max(cmax, math.sqrt(cmax_squared))
+
+
+def directed_hausdorff(source, target, lower_bound: float = 0.0, seed: int = 0) -> float:
+    """``max_a min_b |a - b|`` exacto; ``lower_bound`` es un ``cmax`` inicial conocido.
+
+    Devuelve ``max(lower_bound, h(source, target))``. Con ``source`` vacío es
+    ``lower_bound``; con ``target`` vacío y ``source`` no vacío, infinito.
+    """
+    source = _as_points(source)
+    target = _as_points(target)
+    if source.shape[0] == 0:
+        return float(lower_bound)
+    if target.shape[0] == 0:
+        return math.inf
+
+    # Centrar en B reduce el error de redondeo con coordenadas grandes.
+    centre = target.mean(axis=0)
+    source = source - centre
+    target = target - centre
+    rng = np.random.default_rng(seed)
+    grid = _Grid(target)
+    if grid.max_occupancy > CELL_OVERLOAD:
+        del grid
+        return _tree_directed(source, _PointTree(target), float(lower_bound), rng)
+    return _grid_directed(source, target, grid, float(lower_bound), rng)
+
+
+def hausdorff_distance(first, second) -> float:
+    """Distancia de Hausdorff simétrica exacta; 0 si ambas nubes están vacías."""
+    forward = directed_hausdorff(first, second)
+    return directed_hausdorff(second, first, lower_bound=forward)
@@ -0,0 +1,112 @@
+"""Núcleos vectorizados de métricas de malla, independientes de Blender.
+
+Trabajan con los mismos arrays planos que ``bpy.types.Mesh`` expone mediante
+``foreach_get``: coordenadas de vértices, índice de vértice por loop y
+``loop_start``/``loop_total`` por polígono. El logger mantiene una copia de
+estas funciones porque se instala como un único archivo.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+# Ángulos diedros plegados a [0, 90] grados, en intervalos de 5 grados.
+ANGLE_HISTOGRAM_BINS = 18
+ANGLE_HISTOGRAM_RANGE = (0.0, 90.0)
+
+
+def polygon_corners(loop_start, loop_total) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Devuelve ``(cara, loop, loop siguiente, primer loop)`` de cada esquina."""
+    loop_start = np.asarray(loop_start, dtype=np.int64)
+    loop_total = np.asarray(loop_total, dtype=np.int64)
+    faces = np.repeat(np.arange(loop_total.size), loop_total)
+    offsets = np.arange(faces.size) - np.repeat(np.cumsum(loop_total) - loop_total, loop_total)
+    first = loop_start[faces]
+    return faces, first + offsets, first + (offsets + 1) % loop_total[faces], first
+
+
+def newell_face_normals(coords, loop_verts, loop_start, loop_total) -> np.ndarray:
+    """Normales de Newell sin normalizar; su módulo es el doble del área."""
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    loop_verts = np.asarray(loop_verts, dtype=np.int64)
+    faces, corner, following, first = polygon_corners(loop_start, loop_total)
+    face_count = len(loop_total)
+    origin = coords[loop_verts[first]]
+    newell = np.cross(coords[loop_verts[corner]] - origin, coords[loop_verts[following]] - origin)
+    return np.column_stack([
+        np.bincount(faces, weights=newell[:, axis], minlength=face_count) for axis in range(3)
+    ]).reshape(-1, 3)
+
+
+def manifold_edge_faces(loop_verts, loop_start, loop_total) -> tuple[np.ndarray, np.ndarray]:
+    """Tabla arista manifold → ``(cara_a, cara_b)``.
+
+    Las esquinas se agrupan por arista no dirigida; solo las aristas usadas
+    por exactamente dos esquinas son manifold.
+    """
+    faces, corner, following, _ = polygon_corners(loop_start, loop_total)
+    loop_verts = np.asarray(loop_verts, dtype=np.int64)
+    start_vert = loop_verts[corner]
+    end_vert = loop_verts[following]
+    low = np.minimum(start_vert, end_vert)
+    high = np.maximum(start_vert, end_vert)
+    order = np.lexsort((high, low))
+    low = low[order]
+    high = high[order]
+    same_edge = (low[1:] == low[:-1]) & (high[1:] == high[:-1])
+    boundaries = np.flatnonzero(np.concatenate(([True], ~same_edge, [True])))
+    group_starts = boundaries[:-1][np.diff(boundaries) == 2]
+    return faces[order[group_starts]], faces[order[group_starts + 1]]
+
+
+@dataclass
+class DihedralStats:
+    count: int = 0
+    total: float = 0.0
+    mean: float = 0.0
+    median: float = 0.0
+    histogram: list[int] = field(default_factory=lambda: [0] * ANGLE_HISTOGRAM_BINS)
+    bin_edges: list[float] = field(default_factory=lambda: np.linspace(
+        *ANGLE_HISTOGRAM_RANGE, ANGLE_HISTOGRAM_BINS + 1
+    ).tolist())
+
+
+def dihedral_angle_statistics(normals, face_a, face_b, bins: int = ANGLE_HISTOGRAM_BINS) -> DihedralStats:
+    """Media, mediana e histograma de los ángulos diedros plegados.
+
+    Equivale a ``BMEdge.calc_face_angle()`` en grados sobre cada arista
+    manifold, plegado a ``[0, 90]``. Se omiten las aristas con alguna cara
+    degenerada (normal nula).
+    """
+    normals = np.asarray(normals, dtype=np.float64).reshape(-1, 3)
+    face_a = np.asarray(face_a, dtype=np.int64)
+    face_b = np.asarray(face_b, dtype=np.int64)
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = (lengths[face_a] > 0.0) & (lengths[face_b] > 0.0)
+    face_a = face_a[valid]
+    face_b = face_b[valid]
+
+    cosines = (normals[face_a] * normals[face_b]).sum(axis=1) / (lengths[face_a] * lengths[face_b])
+    angles = np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0)))
+    angles = np.where(angles > 90.0, 180.0 - angles, angles)
+
+    histogram, edges = np.histogram(angles, bins=bins, range=ANGLE_HISTOGRAM_RANGE)
+    if angles.size == 0:
+        return DihedralStats(histogram=histogram.tolist(), bin_edges=edges.tolist())
+    return DihedralStats(
+        count=int(angles.size),
+        total=float(angles.sum()),
+        mean=float(angles.mean()),
+        median=float(np.median(angles)),
+        histogram=histogram.tolist(),
+        bin_edges=edges.tolist(),
+    )
+
+
+def mesh_dihedral_statistics(coords, loop_verts, loop_start, loop_total,
+                             bins: int = ANGLE_HISTOGRAM_BINS) -> DihedralStats:
+    """Atajo desde arrays planos de malla hasta ``DihedralStats``."""
+    normals = newell_face_normals(coords, loop_verts, loop_start, loop_total)
+    face_a, face_b = manifold_edge_faces(loop_verts, loop_start, loop_total)
+    return dihedral_angle_statistics(normals, face_a, face_b, bins)
@@ -0,0 +1,82 @@
+"""Lectura del histórico de métricas de malla que el logger incrusta en el .blend.
+
+El text block ``data_logger_mesh_metrics_history.json`` guarda una fila por
+guardado y objeto, con la ``SessionID`` de la sesión que la escribió y una
+huella del .blend (``BlendFile``): un hash de la ruta con una sal aleatoria
+que solo existe en el equipo del alumno, de modo que la ruta (con nombres
+de usuario y carpetas) no sale del equipo. Las filas antiguas se almacenan
+en trozos CSV comprimidos (zlib + base64) y las más recientes en una cola
+CSV sin comprimir. El logger también añade las filas a
+``blender_mesh_metrics_history.csv`` en el directorio temporal, compartido
+por todos los .blend; cuando supera unos megabytes o su cabecera es de otra
+versión, se comprime a ``blender_mesh_metrics_history.<n>.csv.gz`` y se
+empieza otro.
+"""
+from __future__ import annotations
+
+import base64
+import csv
+import gzip
+import io
+import json
+from pathlib import Path
+import zlib
+
+HISTORY_FORMAT = 1
+
+
+def decode_history_chunk(data: str) -> str:
+    """Devuelve el texto CSV (con cabecera) de un trozo sellado."""
+    return zlib.decompress(base64.b64decode(data)).decode("utf-8")
+
+
+def _csv_rows(text: str) -> list[dict[str, str]]:
+    return list(csv.DictReader(io.StringIO(text))) if text else []
+
+
+def parse_mesh_metrics_history(text: str) -> list[dict[str, str]]:
+    """Filas del histórico en orden de guardado a partir del JSON del text block.
+
+    Cada trozo conserva su propia cabecera, así que las filas de versiones
+    anteriores del logger solo contienen las columnas que existían entonces.
+    """
+    payload = json.loads(text)
+    if not isinstance(payload, dict) or payload.get("format") != HISTORY_FORMAT:
+        raise ValueError("Formato de histórico de métricas no soportado")
+
+    rows = []
+    for chunk in payload.get("chunks", []):
+        rows.extend(_csv_rows(decode_history_chunk(chunk["data"])))
+    rows.extend(_csv_rows(payload.get("tail", "")))
+    return rows
+
+
+def load_mesh_metrics_history(path: str | Path) -> list[dict[str, str]]:
+    """Carga el histórico desde el JSON exportado del text block o desde un CSV temporal.
+
+    Acepta también los CSV temporales ya sellados (``.csv.gz``).
+    """
+    path = Path(path)
+    if path.name.lower().endswith(".csv.gz"):
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            return _csv_rows(handle.read())
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".csv":
+        return _csv_rows(text)
+    return parse_mesh_metrics_history(text)
+
+
+def history_by_session(rows: list[dict[str, str]]) -> dict[str, list[dict[str, str]]]:
+    """Agrupa las filas por ``SessionID`` para unirlas con los logs de sesión."""
+    sessions: dict[str, list[dict[str, str]]] = {}
+    for row in rows:
+        sessions.setdefault(row.get("SessionID", ""), []).append(row)
+    return sessions
+
+
+def history_by_blend(rows: list[dict[str, str]]) -> dict[str, list[dict[str, str]]]:
+    """Agrupa las filas del CSV temporal por la huella (``BlendFile``) del .blend que las escribió."""
+    blends: dict[str, list[dict[str, str]]] = {}
+    for row in rows:
+        blends.setdefault(row.get("BlendFile", ""), []).append(row)
+    return blends
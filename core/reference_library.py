@@ -0,0 +1,266 @@
+"""Biblioteca de mallas de referencia con índices espaciales reutilizables.
+
+RF-44/RF-46 comparan un objeto con una referencia y reconstruyen la
+estructura espacial en cada llamada. ``ReferenceLibrary`` construye la
+``TriangleBVH`` de cada referencia una sola vez y la guarda en una caché LRU
+acotada en bytes; al superarse ``memory_limit`` se descartan las menos
+usadas y, si hacen falta de nuevo, se vuelven a leer del disco.
+
+Con ``directory`` la biblioteca persiste entre sesiones de Blender: cada
+geometría distinta se guarda una vez, en una carpeta con el nombre de su
+digest BLAKE2b, como un ``.npy`` por array del árbol que se abre con
+``mmap_mode="r"``; ``references.json`` asocia cada nombre a su digest. Sin
+``directory`` se conserva en memoria la geometría de cada referencia para
+poder reconstruir su índice tras un descarte, y nada sobrevive a la sesión.
+``DEFAULT_LIBRARY_DIR`` es una carpeta de datos del usuario (no el
+directorio temporal, que el sistema puede vaciar) pensada para pasarse como
+``directory``.
+
+Cada referencia tiene además una ``ShapeSignature`` (``signature.json`` en
+su carpeta). Con ``top_k``, ``similarities`` ordena las referencias por la
+distancia entre firmas y solo compara exactamente las ``top_k`` primeras.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+try:
+    from .shape_signature import ShapeSignature, compute_signature, rank_candidates
+    from .surface_distance import (
+        DEFAULT_SURFACE_SAMPLES,
+        TriangleBVH,
+        sample_surface,
+        similarity_from_summary,
+        summarise_distances,
+    )
+except ImportError:
+    from shape_signature import ShapeSignature, compute_signature, rank_candidates
+    from surface_distance import (
+        DEFAULT_SURFACE_SAMPLES,
+        TriangleBVH,
+        sample_surface,
+        similarity_from_summary,
+        summarise_distances,
+    )
+
+# Cambiar si cambia la BVH o la disposición de los archivos.
+LIBRARY_FORMAT = 1
+
+
+def _user_data_dir() -> Path:
+    """Carpeta de datos de aplicación del usuario según el sistema."""
+    if sys.platform == "win32":
+        return Path(os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming")
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Application Support"
+    return Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+
+
+DEFAULT_LIBRARY_DIR = _user_data_dir() / "analysis3d" / "reference_library"
+DEFAULT_MEMORY_LIMIT = 512 * 1024 * 1024
+_MANIFEST_NAME = "references.json"
+
+
+def geometry_digest(vertices, triangles) -> str:
+    vertices = np.ascontiguousarray(vertices, dtype=np.float64).reshape(-1, 3)
+    triangles = np.ascontiguousarray(triangles, dtype=np.int64).reshape(-1, 3)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(np.asarray(vertices.shape + triangles.shape, dtype=np.int64).tobytes())
+    digest.update(vertices.tobytes())
+    digest.update(triangles.tobytes())
+    return digest.hexdigest()
+
+
+def _load_entry(entry: Path) -> TriangleBVH | None:
+    try:
+        meta = json.loads((entry / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("format") != LIBRARY_FORMAT:
+            return None
+        return TriangleBVH.from_arrays({
+            name: np.load(entry / f"{name}.npy", mmap_mode="r") for name in TriangleBVH.ARRAYS
+        })
+    except (OSError, ValueError):
+        return None
+
+
+def _signature_of(bvh: TriangleBVH) -> ShapeSignature:
+    return compute_signature(bvh.vertices, bvh.triangles)
+
+
+def _store_entry(entry: Path, bvh: TriangleBVH, signature: ShapeSignature) -> None:
+    """Escribe la entrada en una carpeta temporal y la publica con un rename."""
+    temporary = Path(tempfile.mkdtemp(dir=entry.parent, prefix=".tmp-"))
+    try:
+        for name in TriangleBVH.ARRAYS:
+            np.save(temporary / f"{name}.npy", getattr(bvh, name))
+        (temporary / "signature.json").write_text(json.dumps(signature.to_dict()), encoding="utf-8")
+        (temporary / "meta.json").write_text(json.dumps({"format": LIBRARY_FORMAT}), encoding="utf-8")
+        os.replace(temporary, entry)
+    except OSError:
+        # Otro proceso ya publicó la misma geometría.
+        shutil.rmtree(temporary, ignore_errors=True)
+
+
+class ReferenceLibrary:
+    """Referencias por nombre con sus BVH en una caché LRU limitada a ``memory_limit`` bytes."""
+
+    def __init__(self, directory: str | Path | None = None, memory_limit: int = DEFAULT_MEMORY_LIMIT):
+        self.directory = Path(directory) if directory is not None else None
+        self.memory_limit = memory_limit
+        self.references: dict[str, str] = {}
+        # Contadores para diagnóstico: aciertos, lecturas de disco, construcciones y descartes.
+        self.stats = {"hits": 0, "loads": 0, "builds": 0, "evictions": 0}
+        self._cache: OrderedDict[str, TriangleBVH] = OrderedDict()
+        self._geometry: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._signatures: dict[str, ShapeSignature] = {}
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.references = self._read_manifest()
+
+    def __len__(self) -> int:
+        return len(self.references)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.references
+
+    @property
+    def cached_bytes(self) -> int:
+        return sum(bvh.nbytes for bvh in self._cache.values())
+
+    def _read_manifest(self) -> dict[str, str]:
+        try:
+            manifest = json.loads((self.directory / _MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("format") != LIBRARY_FORMAT:
+            return {}
+        return dict(manifest.get("references", {}))
+
+    def _write_manifest(self) -> None:
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".json")
+        with os.fdopen(handle, "w", encoding="utf-8") as stream:
+            json.dump({"format": LIBRARY_FORMAT, "references": self.references}, stream)
+        os.replace(temporary, self.directory / _MANIFEST_NAME)
+
+    def add(self, name: str, vertices, triangles) -> str:
+        """Registra (o sustituye) una referencia y construye su índice; devuelve su digest."""
+        bvh = TriangleBVH(vertices, triangles)
+        digest = geometry_digest(bvh.vertices, bvh.triangles)
+        self.stats["builds"] += 1
+        self._signatures[digest] = _signature_of(bvh)
+        if self.directory is not None:
+            entry = self.directory / digest
+            if _load_entry(entry) is None:
+                shutil.rmtree(entry, ignore_errors=True)
+                _store_entry(entry, bvh, self._signatures[digest])
+        else:
+            self._geometry[digest] = (bvh.vertices, bvh.triangles)
+        self.references[name] = digest
+        if self.directory is not None:
+            self._write_manifest()
+        self._remember(digest, bvh)
+        return digest
+
+    def remove(self, name: str) -> None:
+        """Quita el nombre; la entrada en disco se conserva para otras referencias iguales."""
+        digest = self.references.pop(name)
+        if digest not in self.references.values():
+            self._cache.pop(digest, None)
+            self._geometry.pop(digest, None)
+            self._signatures.pop(digest, None)
+        if self.directory is not None:
+            self._write_manifest()
+
+    def index(self, name: str) -> TriangleBVH:
+        """BVH de la referencia ``name``, de la caché, del disco o reconstruida."""
+        digest = self.references[name]
+        bvh = self._cache.get(digest)
+        if bvh is not None:
+            self.stats["hits"] += 1
+            self._cache.move_to_end(digest)
+            return bvh
+        if self.directory is not None:
+            bvh = _load_entry(self.directory / digest)
+            if bvh is None:
+                raise FileNotFoundError(f"Falta la entrada de la referencia {name!r} en {self.directory}")
+            self.stats["loads"] += 1
+        else:
+            bvh = TriangleBVH(*self._geometry[digest])
+            self.stats["builds"] += 1
+        self._remember(digest, bvh)
+        return bvh
+
+    def signature(self, name: str) -> ShapeSignature:
+        """Firma de la referencia; las entradas sin ``signature.json`` la calculan y la guardan."""
+        digest = self.references[name]
+        signature = self._signatures.get(digest)
+        if signature is not None:
+            return signature
+        # Sin directorio, la firma se calculó en ``add``.
+        path = self.directory / digest / "signature.json"
+        try:
+            signature = ShapeSignature.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, KeyError):
+            signature = _signature_of(self.index(name))
+            path.write_text(json.dumps(signature.to_dict()), encoding="utf-8")
+        self._signatures[digest] = signature
+        return signature
+
+    def _remember(self, digest: str, bvh: TriangleBVH) -> None:
+        self._cache[digest] = bvh
+        self._cache.move_to_end(digest)
+        # Siempre se conserva la última, aunque supere el límite por sí sola.
+        while len(self._cache) > 1 and self.cached_bytes > self.memory_limit:
+            self._cache.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def similarities(self, meshes: dict, names=None, samples: int = DEFAULT_SURFACE_SAMPLES,
+                     seed: int = 0, top_k: int | None = None) -> dict[str, dict[str, dict[str, float]]]:
+        """Compara cada malla de ``meshes`` (``{nombre: (vértices, triángulos)}``) con las referencias.
+
+        Devuelve ``{malla: {referencia: resumen}}``, donde el resumen es el de
+        ``summarise_distances`` más ``Similarity``. Con ``top_k`` cada malla
+        solo se compara con sus ``top_k`` referencias de firma más cercana, y
+        el resumen incluye ``SignatureDistance``. Las muestras y la BVH de
+        cada malla se calculan una vez, y las referencias se recorren en el
+        bucle externo para que cada índice se use con todas sus mallas
+        seguidas, aunque la caché no las pueda contener todas.
+        """
+        names = list(self.references) if names is None else list(names)
+        signatures = {name: self.signature(name) for name in names} if top_k is not None else {}
+        queries = {}
+        candidates = {}
+        for model, (vertices, triangles) in meshes.items():
+            bvh = TriangleBVH(vertices, triangles)
+            queries[model] = (bvh, sample_surface(bvh.vertices, bvh.triangles, samples, seed))
+            if top_k is not None:
+                candidates[model] = dict(rank_candidates(_signature_of(bvh), signatures, top_k))
+
+        results = {model: {} for model in meshes}
+        for name in names:
+            wanted = [model for model in queries if top_k is None or name in candidates[model]]
+            if not wanted:
+                continue
+            reference = self.index(name)
+            reference_points = sample_surface(reference.vertices, reference.triangles, samples, seed + 1)
+            for model in wanted:
+                bvh, points = queries[model]
+                summary = summarise_distances(reference.distances(points), bvh.distances(reference_points))
+                summary["Similarity"] = similarity_from_summary(summary, reference.vertices)
+                if top_k is not None:
+                    summary["SignatureDistance"] = candidates[model][name]
+                results[model][name] = summary
+        return results
+
+
+def clear_reference_library(directory: str | Path | None = None) -> None:
+    shutil.rmtree(Path(directory) if directory is not None else DEFAULT_LIBRARY_DIR, ignore_errors=True)
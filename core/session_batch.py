@@ -0,0 +1,238 @@
+"""Análisis por lotes de muchos CSV de sesión en un pool de procesos.
+
+Cada archivo se carga con ``session_columns`` y se resume en una fila
+(sesión, usuario, número de registros y media/mediana/máximo de A1--A16).
+Las filas de todos los archivos forman una tabla única, en el orden de
+entrada, que puede escribirse como CSV. Los ``MetricStream`` de cada sesión
+se fusionan en un resumen de la cohorte de memoria acotada. No depende de
+Blender::
+
+    python -m core.session_batch datos_analisis -o resumen.csv --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import csv
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import sys
+
+import numpy as np
+
+try:
+    from .streaming_stats import summarise_metrics
+    from .session_cache import load_session_columns_cached
+    from .session_columns import (
+        DEFAULT_MAX_REASONABLE_SPEED,
+        METRIC_IDS,
+        compute_metrics_for_columns,
+        load_session_columns,
+    )
+except ImportError:
+    from streaming_stats import summarise_metrics
+    from session_cache import load_session_columns_cached
+    from session_columns import (
+        DEFAULT_MAX_REASONABLE_SPEED,
+        METRIC_IDS,
+        compute_metrics_for_columns,
+        load_session_columns,
+    )
+
+SUMMARY_STATISTICS = ("mean", "median", "max")
+SUMMARY_FIELDS = ["File", "SessionID", "UserID", "Rows", "InvalidValues"] + [
+    f"{metric}_{statistic}" for metric in METRIC_IDS for statistic in SUMMARY_STATISTICS
+] + ["Error"]
+# Cada cuánto (segundos) se comprueba la cancelación mientras hay trabajos en curso.
+CANCEL_POLL_INTERVAL = 0.1
+
+
+@dataclass
+class BatchResult:
+    rows: list[dict] = field(default_factory=list)
+    cancelled: bool = False
+    # MetricStream por métrica con todas las filas de las sesiones terminadas.
+    cohort: dict = field(default_factory=dict)
+
+    def cohort_summary(self) -> dict[str, dict[str, float]]:
+        """Mínimo, cuartiles, máximo, media y desviación de cada métrica en la cohorte."""
+        return {metric: stream.summary() for metric, stream in self.cohort.items()}
+
+
+def _first_text(values) -> str:
+    return next((str(value) for value in values if value), "")
+
+
+def summarise_session(path: str | Path,
+                      max_reasonable_speed: float = DEFAULT_MAX_REASONABLE_SPEED,
+                      cache_dir: str | Path | None = None) -> dict:
+    """Carga un CSV y devuelve su fila de resumen; los errores van a ``Error``.
+
+    Con ``cache_dir`` las columnas se leen de la caché de ``session_cache``.
+    """
+    return _analyse_session(path, max_reasonable_speed, cache_dir)[0]
+
+
+def _analyse_session(path, max_reasonable_speed, cache_dir):
+    """Fila de resumen y ``MetricStream`` por métrica (None si hubo error).
+
+    Cualquier fallo de una sesión queda en su columna ``Error`` en lugar de
+    propagarse y detener el resto del lote.
+    """
+    try:
+        return _summarise_session(path, max_reasonable_speed, cache_dir)
+    except Exception as exc:
+        return _error_row(path, exc), None
+
+
+def _error_row(path, exc) -> dict:
+    row = {name: "" for name in SUMMARY_FIELDS}
+    row["File"] = str(path)
+    row["Error"] = f"{type(exc).__name__}: {exc}"
+    return row
+
+
+def _summarise_session(path, max_reasonable_speed, cache_dir):
+    row = {name: "" for name in SUMMARY_FIELDS}
+    row["File"] = str(path)
+    if cache_dir is None:
+        columns = load_session_columns(path)
+    else:
+        columns = load_session_columns_cached(path, cache_dir)
+    metrics = compute_metrics_for_columns(columns, max_reasonable_speed)
+
+    row["SessionID"] = _first_text(columns["SessionID"])
+    row["UserID"] = _first_text(columns["UserID"])
+    row["Rows"] = len(columns)
+    row["InvalidValues"] = sum(columns.invalid.values())
+    for metric, values in metrics.items():
+        if values.size == 0:
+            continue
+        row[f"{metric}_mean"] = float(values.mean())
+        row[f"{metric}_median"] = float(np.median(values))
+        row[f"{metric}_max"] = float(values.max())
+    return row, summarise_metrics(metrics)
+
+
+def find_session_files(directory: str | Path, pattern: str = "*.csv") -> list[Path]:
+    """CSV de sesión de una carpeta, en orden alfabético."""
+    return sorted(Path(directory).glob(pattern))
+
+
+def run_batch(paths, workers: int | None = None, progress=None, cancel=None,
+              max_reasonable_speed: float = DEFAULT_MAX_REASONABLE_SPEED,
+              cache_dir: str | Path | None = None) -> BatchResult:
+    """Resume ``paths`` en paralelo.
+
+    ``workers`` es el tamaño del pool (por defecto, los núcleos disponibles);
+    con 0 o 1 los archivos se procesan en este proceso. ``progress(hechos,
+    total, ruta)`` se llama al terminar cada archivo. ``cancel`` es un objeto
+    con ``is_set()``, como ``threading.Event``: al activarse no se empiezan
+    más archivos y se devuelven las filas ya terminadas con ``cancelled``.
+
+    Si el resultado de un archivo no llega del pool (p. ej. no se puede
+    serializar), el fallo queda en su ``Error``. Si un proceso del pool muere,
+    todas las sesiones sin terminar fallan con ``BrokenProcessPool``; se
+    reparten en dos mitades, cada una en un pool nuevo, hasta aislar la que lo
+    rompe, que es la única que termina con ese error.
+    """
+    paths = [Path(path) for path in paths]
+    total = len(paths)
+    rows: list[dict | None] = [None] * total
+    result = BatchResult()
+
+    def finished(index, analysed, done):
+        rows[index], streams = analysed
+        for metric, stream in (streams or {}).items():
+            if metric in result.cohort:
+                result.cohort[metric].merge(stream)
+            else:
+                result.cohort[metric] = stream
+        if progress is not None:
+            progress(done, total, paths[index])
+
+    if workers is None:
+        workers = min(os.cpu_count() or 1, total)
+    if workers <= 1:
+        for index, path in enumerate(paths):
+            if cancel is not None and cancel.is_set():
+                result.cancelled = True
+                break
+            finished(index, _analyse_session(path, max_reasonable_speed, cache_dir), index + 1)
+    else:
+        batches = [list(range(total))]
+        done = 0
+        while batches and not result.cancelled:
+            indices = batches.pop()
+            broken = []
+            executor = ProcessPoolExecutor(max_workers=min(workers, len(indices)))
+            try:
+                pending = {
+                    executor.submit(_analyse_session, paths[index], max_reasonable_speed, cache_dir): index
+                    for index in indices
+                }
+                while pending:
+                    if cancel is not None and cancel.is_set():
+                        result.cancelled = True
+                        break
+                    completed, _ = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        index = pending.pop(future)
+                        try:
+                            analysed = future.result()
+                        except BrokenProcessPool as exc:
+                            broken.append((index, exc))
+                            continue
+                        except Exception as exc:
+                            analysed = (_error_row(paths[index], exc), None)
+                        done += 1
+                        finished(index, analysed, done)
+            finally:
+                executor.shutdown(wait=not result.cancelled, cancel_futures=True)
+
+            broken.sort(key=lambda item: item[0])
+            if len(broken) == 1 and not result.cancelled:
+                index, exc = broken[0]
+                done += 1
+                finished(index, (_error_row(paths[index], exc), None), done)
+            elif broken:
+                half = len(broken) // 2
+                batches.append([index for index, _ in broken[half:]])
+                batches.append([index for index, _ in broken[:half]])
+
+    result.rows = [row for row in rows if row is not None]
+    return result
+
+
+def write_summary_csv(rows, path: str | Path) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=SUMMARY_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Resume A1--A16 de una carpeta de CSV de sesión.")
+    parser.add_argument("directory")
+    parser.add_argument("-o", "--output", default="resumen_sesiones.csv")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--pattern", default="*.csv")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Carpeta de la caché de sesiones parseadas (sin caché si se omite).")
+    args = parser.parse_args(argv)
+
+    def report(done, total, path):
+        print(f"[{done}/{total}] {path.name}", file=sys.stderr)
+
+    result = run_batch(
+        find_session_files(args.directory, args.pattern), args.workers, report,
+        cache_dir=args.cache_dir,
+    )
+    write_summary_csv(result.rows, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
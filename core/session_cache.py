@@ -0,0 +1,127 @@
+"""Caché en disco de CSV de sesión ya convertidos a columnas.
+
+Cada contenido distinto se guarda una vez, en una carpeta con el nombre de
+su digest BLAKE2b, como dos ``.npy`` que se abren con ``mmap_mode="r"``:
+los valores numéricos (una fila por columna de ``NUMERIC_COLUMNS``) y los
+textos en ancho fijo. ``paths.json`` asocia ruta, tamaño y ``mtime`` al
+digest, de modo que un archivo sin cambios no se vuelve a leer; si solo
+cambia el ``mtime``, se recalcula el digest pero no se vuelve a parsear.
+Cuando el contenido de una ruta cambia (p. ej. una sesión en curso que sigue
+creciendo), la entrada anterior se borra si ninguna otra ruta la usa, así
+que la caché ocupa como mucho una entrada por archivo.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+import tempfile
+
+import numpy as np
+
+try:
+    from .session_columns import NUMERIC_COLUMNS, TEXT_COLUMNS, SessionColumns, parse_session_csv
+except ImportError:
+    from session_columns import NUMERIC_COLUMNS, TEXT_COLUMNS, SessionColumns, parse_session_csv
+
+# Cambiar si cambia el parseo o la disposición de los archivos.
+CACHE_FORMAT = 1
+DEFAULT_CACHE_DIR = Path(tempfile.gettempdir()) / "analysis3d_session_cache"
+_INDEX_NAME = "paths.json"
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _read_index(cache_dir: Path) -> dict:
+    try:
+        index = json.loads((cache_dir / _INDEX_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) and index.get("format") == CACHE_FORMAT else {}
+
+
+def _write_index(cache_dir: Path, index: dict) -> None:
+    handle, temporary = tempfile.mkstemp(dir=cache_dir, suffix=".json")
+    with os.fdopen(handle, "w", encoding="utf-8") as stream:
+        json.dump(index, stream)
+    os.replace(temporary, cache_dir / _INDEX_NAME)
+
+
+def _load_entry(entry: Path) -> SessionColumns | None:
+    try:
+        meta = json.loads((entry / "meta.json").read_text(encoding="utf-8"))
+        numeric = np.load(entry / "numeric.npy", mmap_mode="r")
+        text = np.load(entry / "text.npy", mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if meta.get("format") != CACHE_FORMAT:
+        return None
+    return SessionColumns(
+        {name: numeric[position] for position, name in enumerate(NUMERIC_COLUMNS)},
+        {name: text[position] for position, name in enumerate(TEXT_COLUMNS)},
+        meta.get("invalid", {}),
+    )
+
+
+def _store_entry(entry: Path, columns: SessionColumns) -> None:
+    """Escribe la entrada en una carpeta temporal y la publica con un rename."""
+    temporary = Path(tempfile.mkdtemp(dir=entry.parent, prefix=".tmp-"))
+    try:
+        np.save(temporary / "numeric.npy", np.stack([columns[name] for name in NUMERIC_COLUMNS]))
+        np.save(temporary / "text.npy", np.stack([
+            np.asarray(columns[name], dtype=str) for name in TEXT_COLUMNS
+        ]))
+        (temporary / "meta.json").write_text(
+            json.dumps({"format": CACHE_FORMAT, "invalid": columns.invalid}), encoding="utf-8"
+        )
+        os.replace(temporary, entry)
+    except OSError:
+        # Otro proceso ya publicó el mismo contenido.
+        shutil.rmtree(temporary, ignore_errors=True)
+
+
+def load_session_columns_cached(path: str | Path, cache_dir: str | Path | None = None) -> SessionColumns:
+    """Como ``load_session_columns``, pero reutilizando la caché si es posible."""
+    path = Path(path).resolve()
+    cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    stat = path.stat()
+    index = _read_index(cache_dir)
+    known = index.get("paths", {}).get(str(path))
+
+    data = None
+    if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+        digest = known["digest"]
+    else:
+        data = path.read_bytes()
+        digest = content_digest(data)
+
+    entry = cache_dir / digest
+    columns = _load_entry(entry) if entry.is_dir() else None
+    if columns is None:
+        if data is None:
+            data = path.read_bytes()
+        columns = parse_session_csv(data.decode("utf-8"))
+        shutil.rmtree(entry, ignore_errors=True)
+        _store_entry(entry, columns)
+
+    if known is None or known.get("digest") != digest or known["mtime_ns"] != stat.st_mtime_ns:
+        index = _read_index(cache_dir)
+        index["format"] = CACHE_FORMAT
+        paths = index.setdefault("paths", {})
+        previous = paths.get(str(path), {}).get("digest")
+        paths[str(path)] = {
+            "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest,
+        }
+        _write_index(cache_dir, index)
+        if previous and previous != digest and all(item.get("digest") != previous for item in paths.values()):
+            shutil.rmtree(cache_dir / previous, ignore_errors=True)
+    return columns
+
+
+def clear_session_cache(cache_dir: str | Path | None = None) -> None:
+    shutil.rmtree(Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR, ignore_errors=True)
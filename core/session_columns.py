@@ -0,0 +1,265 @@
+"""Carga columnar de los CSV de sesión y cálculo vectorizado de A1--A16.
+
+Un CSV de sesión (v1 o v2, como los de ``datos_analisis/``) se convierte en
+un array NumPy por columna en lugar de un diccionario por fila. Las métricas
+se calculan sobre esos arrays; ``compute_metrics_for_rows`` adapta la API
+antigua basada en filas.
+
+Definiciones (memoria, capítulo 3):
+
+- A1: horas desde el primer registro, ``(t - t0) / 3600``.
+- A2: duración del intervalo si ``dt >= media + 2σ`` de los intervalos
+  positivos y la fila no tiene evento de edición; 0 en otro caso.
+- A3: la misma detección que A2; la partición por fases es de presentación.
+- A4: velocidad de la vista en unidades por hora.
+- A5: ``max(|P - O| - r, 0)``, distancia de la vista a la superficie
+  aproximada del objeto activo.
+- A6: velocidad (u/h) de los picos ``v >= media + 2σ`` de las velocidades
+  positivas; 0 fuera de los picos.
+- A7: velocidad (u/h) en filas sin evento de edición (navegación pura).
+- A8: velocidad (u/h) en filas con evento de edición.
+- A9: distancia acumulada recorrida por la vista.
+- A10: ``|CtrlV| + |ShiftD| + |AltD|``.
+- A11: ``ModifierDelta``.
+- A12: ``VertexDelta``.
+- A13: ``|NgonDelta| + |TriDelta| + |NormalDelta|``.
+- A14: 2 en modo edición, 1 en modo objeto, 0 en otros estados.
+- A15: ``UV``.
+- A16: ``ObjectDelta``.
+"""
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+import io
+from pathlib import Path
+
+import numpy as np
+
+METRIC_IDS = tuple(f"A{index}" for index in range(1, 17))
+
+TEXT_COLUMNS = ("SchemaVersion", "LoggerVersion", "SessionID", "UserID")
+NUMERIC_COLUMNS = (
+    "TimeStamp", "Minute", "Second",
+    "UserX", "UserY", "UserZ", "SceneRadius",
+    "ObjX", "ObjY", "ObjZ", "ObjRadius",
+    "ObjDeltaX", "ObjDeltaY", "ObjDeltaZ", "ObjDeltaRadius",
+    "VertexDelta", "NgonDelta", "TriDelta", "NormalDelta",
+    "ObjModeState", "EditModeState", "ModeChanged",
+    "UV", "ObjectDelta", "ModifierDelta",
+    "CtrlV", "ShiftD", "AltD", "Merge", "Occlusion",
+)
+# Cabeceras v1 con otro nombre en v2.
+LEGACY_COLUMN_NAMES = {"USER_ID": "UserID"}
+# Columnas cuyo valor distinto de cero indica un evento de edición en la fila.
+EDIT_EVENT_COLUMNS = (
+    "VertexDelta", "NgonDelta", "TriDelta", "NormalDelta",
+    "UV", "ObjectDelta", "ModifierDelta",
+    "CtrlV", "ShiftD", "AltD", "Merge",
+)
+# Velocidad de vista (unidades/s) a partir de la cual el salto se considera
+# un cambio de cámara y no un desplazamiento.
+DEFAULT_MAX_REASONABLE_SPEED = 1_000.0
+
+
+@dataclass
+class SessionColumns:
+    """Columnas tipadas de una sesión; las ausentes valen 0 o ``""``."""
+
+    numeric: dict[str, np.ndarray]
+    text: dict[str, np.ndarray]
+    # Valores no numéricos o no finitos sustituidos por 0, por columna.
+    invalid: dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return self.numeric["TimeStamp"].size
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.numeric[name] if name in self.numeric else self.text[name]
+
+
+def _parse_numeric(values) -> tuple[np.ndarray, int]:
+    """Convierte una columna de cadenas a float64; lo inválido pasa a 0."""
+    try:
+        array = np.fromiter(map(float, values), dtype=np.float64, count=len(values))
+    except ValueError:
+        array = np.empty(len(values), dtype=np.float64)
+        for index, value in enumerate(values):
+            try:
+                array[index] = float(value)
+            except ValueError:
+                array[index] = np.nan
+    return _zero_non_finite(array)
+
+
+def _zero_non_finite(array: np.ndarray) -> tuple[np.ndarray, int]:
+    bad = ~np.isfinite(array)
+    array[bad] = 0.0
+    return array, int(bad.sum())
+
+
+def columns_from_table(header, records) -> SessionColumns:
+    """Construye ``SessionColumns`` a partir de la cabecera y filas en lista."""
+    header = [LEGACY_COLUMN_NAMES.get(name, name) for name in header]
+    count = len(records)
+    width = len(header)
+    records = [record + [""] * (width - len(record)) if len(record) < width else record
+               for record in records]
+    raw = dict(zip(header, zip(*records))) if count else {}
+
+    numeric = {}
+    invalid = {}
+    for name in NUMERIC_COLUMNS:
+        if name in raw:
+            numeric[name], bad = _parse_numeric(raw[name])
+            if bad:
+                invalid[name] = bad
+        else:
+            numeric[name] = np.zeros(count)
+    text = {
+        name: np.asarray(raw[name] if name in raw else [""] * count, dtype=object)
+        for name in TEXT_COLUMNS
+    }
+    return SessionColumns(numeric, text, invalid)
+
+
+def _fast_parse(content: str, header: list[str]) -> SessionColumns:
+    """Lectura en C con ``np.loadtxt``; falla con ValueError ante celdas vacías o comillas."""
+    if '"' in content or not content.partition("\n")[2].strip():
+        raise ValueError("CSV con comillas o sin filas")
+    header = [LEGACY_COLUMN_NAMES.get(name, name) for name in header]
+    numeric_names = [name for name in NUMERIC_COLUMNS if name in header]
+    text_names = [name for name in TEXT_COLUMNS if name in header]
+
+    def read(names, dtype):
+        return np.loadtxt(
+            io.StringIO(content), delimiter=",", skiprows=1, dtype=dtype, ndmin=2,
+            usecols=[header.index(name) for name in names], comments=None,
+        )
+
+    table = read(numeric_names, np.float64) if numeric_names else None
+    count = table.shape[0] if table is not None else len(read(text_names, str))
+    numeric = {}
+    invalid = {}
+    for name in NUMERIC_COLUMNS:
+        if name not in header:
+            numeric[name] = np.zeros(count)
+            continue
+        numeric[name], bad = _zero_non_finite(np.ascontiguousarray(table[:, numeric_names.index(name)]))
+        if bad:
+            invalid[name] = bad
+    text_table = read(text_names, str) if text_names else None
+    text = {
+        name: (text_table[:, text_names.index(name)].astype(object) if name in text_names
+               else np.full(count, "", dtype=object))
+        for name in TEXT_COLUMNS
+    }
+    return SessionColumns(numeric, text, invalid)
+
+
+def parse_session_csv(content: str) -> SessionColumns:
+    """Carga el texto de un CSV de sesión v1 o v2 en columnas.
+
+    Los archivos regulares se leen con ``np.loadtxt``; los que tienen celdas
+    vacías, comillas o filas irregulares pasan por el módulo ``csv``.
+    """
+    reader = csv.reader(io.StringIO(content))
+    header = next(reader, [])
+    try:
+        return _fast_parse(content, header)
+    except ValueError:
+        return columns_from_table(header, [record for record in reader if record])
+
+
+def load_session_columns(path: str | Path) -> SessionColumns:
+    """Carga un archivo CSV de sesión en columnas."""
+    return parse_session_csv(Path(path).read_text(encoding="utf-8"))
+
+
+def columns_from_rows(rows) -> SessionColumns:
+    """Adapta una lista de diccionarios por fila a ``SessionColumns``."""
+    header = []
+    for row in rows:
+        header.extend(name for name in row if name not in header)
+    return columns_from_table(header, [[row.get(name, "") for name in header] for row in rows])
+
+
+def _threshold(values: np.ndarray) -> float:
+    """Media + 2σ de los valores positivos; infinito si no hay ninguno."""
+    positive = values[values > 0]
+    if positive.size == 0:
+        return np.inf
+    return float(positive.mean() + 2.0 * positive.std())
+
+
+def row_metrics(columns: SessionColumns,
+                max_reasonable_speed: float = DEFAULT_MAX_REASONABLE_SPEED,
+                previous: tuple | None = None) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray]:
+    """Métricas que solo dependen de la fila y de la anterior.
+
+    Devuelve ``(métricas, dt, velocidad, evento_de_edición)``; faltan A2, A3
+    y A6, cuyos umbrales dependen de toda la sesión. ``previous`` es
+    ``(t0, t_anterior, vista_anterior, distancia_acumulada)`` de las filas ya
+    procesadas, para continuar una sesión por bloques.
+    """
+    count = len(columns)
+    times = columns["TimeStamp"]
+    view = np.column_stack([columns["UserX"], columns["UserY"], columns["UserZ"]])
+    if previous is None:
+        start_time, last_time, last_view, distance = times[0], times[0], view[0], 0.0
+    else:
+        start_time, last_time, last_view, distance = previous
+
+    dt = np.diff(times, prepend=last_time)
+    step = np.linalg.norm(np.diff(view, axis=0, prepend=np.reshape(last_view, (1, 3))), axis=1)
+    speed = np.zeros(count)
+    moving = dt > 0
+    speed[moving] = step[moving] / dt[moving]
+    jumps = speed > max_reasonable_speed
+    speed[jumps] = 0.0
+    step[jumps] = 0.0
+
+    edit_event = np.zeros(count, dtype=bool)
+    for name in EDIT_EVENT_COLUMNS:
+        edit_event |= columns[name] != 0
+
+    speed_per_hour = speed * 3600.0
+    target = np.column_stack([columns["ObjX"], columns["ObjY"], columns["ObjZ"]])
+    metrics = {
+        "A1": (times - start_time) / 3600.0,
+        "A4": speed_per_hour,
+        "A5": np.maximum(np.linalg.norm(view - target, axis=1) - columns["ObjRadius"], 0.0),
+        "A7": np.where(edit_event, 0.0, speed_per_hour),
+        "A8": np.where(edit_event, speed_per_hour, 0.0),
+        "A9": distance + np.cumsum(step),
+        "A10": np.abs(columns["CtrlV"]) + np.abs(columns["ShiftD"]) + np.abs(columns["AltD"]),
+        "A11": np.array(columns["ModifierDelta"], dtype=np.float64),
+        "A12": np.array(columns["VertexDelta"], dtype=np.float64),
+        "A13": np.abs(columns["NgonDelta"]) + np.abs(columns["TriDelta"]) + np.abs(columns["NormalDelta"]),
+        "A14": np.where(columns["EditModeState"] != 0, 2.0,
+                        np.where(columns["ObjModeState"] != 0, 1.0, 0.0)),
+        "A15": np.array(columns["UV"], dtype=np.float64),
+        "A16": np.array(columns["ObjectDelta"], dtype=np.float64),
+    }
+    return metrics, dt, speed, edit_event
+
+
+def compute_metrics_for_columns(columns: SessionColumns,
+                                max_reasonable_speed: float = DEFAULT_MAX_REASONABLE_SPEED) -> dict[str, np.ndarray]:
+    """Calcula A1--A16 como un array por métrica, alineado con las filas."""
+    if len(columns) == 0:
+        return {metric: np.zeros(0) for metric in METRIC_IDS}
+
+    metrics, dt, speed, edit_event = row_metrics(columns, max_reasonable_speed)
+    pauses = np.where((dt >= _threshold(dt)) & ~edit_event, dt, 0.0)
+    metrics["A2"] = pauses
+    metrics["A3"] = pauses.copy()
+    metrics["A6"] = np.where(speed >= _threshold(speed), metrics["A4"], 0.0)
+    return {metric: metrics[metric] for metric in METRIC_IDS}
+
+
+def compute_metrics_for_rows(rows,
+                             max_reasonable_speed: float = DEFAULT_MAX_REASONABLE_SPEED) -> dict[str, list[float]]:
+    """Adaptador para la API por filas: mismas métricas, como listas."""
+    metrics = compute_metrics_for_columns(columns_from_rows(rows), max_reasonable_speed)
+    return {metric: values.tolist() for metric, values in metrics.items()}
@@ -0,0 +1,271 @@
+"""Reanálisis incremental de un CSV de sesión que sigue creciendo.
+
+El logger solo añade filas al CSV, así que ``SessionAccumulator`` guarda
+el desplazamiento en bytes ya leído y el estado necesario para continuar:
+primer y último instante, última posición de vista, distancia acumulada,
+un ``MetricStream`` por métrica (momentos exactos y cuartiles KLL) y las
+estadísticas de intervalos y velocidades. ``refresh`` solo parsea las
+filas nuevas.
+
+A2/A3 y A6 usan umbrales (media + 2σ) de toda la sesión, que cambian al
+llegar filas. Los intervalos candidatos a pausa y las velocidades positivas
+se acumulan en un ``LogHistogram``: cada ``refresh`` cuesta lo que sus
+filas nuevas, y el estado crece con el rango de los valores (unas 16
+cubetas por cada factor 2), no con la longitud de la sesión. Media,
+desviación y cuartiles de A2/A3/A6 son exactos salvo por la cubeta que
+contiene al umbral, que se estima.
+"""
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+import hashlib
+import io
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+
+try:
+    from .streaming_stats import LogHistogram, MetricStream
+    from .session_columns import (
+        DEFAULT_MAX_REASONABLE_SPEED,
+        METRIC_IDS,
+        SessionColumns,
+        columns_from_table,
+        row_metrics,
+    )
+except ImportError:
+    from streaming_stats import LogHistogram, MetricStream
+    from session_columns import (
+        DEFAULT_MAX_REASONABLE_SPEED,
+        METRIC_IDS,
+        SessionColumns,
+        columns_from_table,
+        row_metrics,
+    )
+
+STATE_FORMAT = 3
+# Bytes iniciales del archivo, y bytes justo antes del cursor, que se comparan
+# para detectar que se ha sustituido o reescrito (p. ej. al quitar duplicados).
+_PREFIX_BYTES = 4096
+_ANCHOR_BYTES = 256
+_ROW_LOCAL_METRICS = tuple(metric for metric in METRIC_IDS if metric not in ("A2", "A3", "A6"))
+_HISTOGRAMS = ("pause_candidates", "positive_speeds")
+
+
+def _prefix_digest(data: bytes) -> str:
+    return hashlib.blake2b(data[:_PREFIX_BYTES], digest_size=16).hexdigest()
+
+
+def _thresholded_summary(histogram: LogHistogram, threshold: float, rows: int,
+                         scale: float = 1.0) -> dict[str, float]:
+    """Resumen de una serie que vale ``valor * scale`` si supera el umbral y 0 si no.
+
+    ``histogram`` tiene los candidatos; el resto de filas vale 0. Dentro de
+    una cubeta, los cuartiles se interpolan entre su mínimo y su máximo.
+    """
+    counts, totals, squares, minima, maxima = histogram.above(threshold)
+    selected = int(counts.sum())
+    zeros = rows - selected
+    mean = float(totals.sum()) * scale / rows
+    ranks = np.maximum(np.ceil(np.array(list(MetricStream.QUANTILES.values())) * rows) - 1, 0).astype(int)
+    ends = np.cumsum(counts)
+    quartiles = []
+    for rank in ranks:
+        if rank < zeros:
+            quartiles.append(0.0)
+            continue
+        position = rank - zeros
+        bucket = int(np.searchsorted(ends, position, side="right"))
+        inside = position - (ends[bucket] - counts[bucket])
+        step = (maxima[bucket] - minima[bucket]) / max(counts[bucket] - 1, 1)
+        quartiles.append(float(minima[bucket] + inside * step) * scale)
+    summary = {
+        "min": 0.0 if zeros else float(minima[0]) * scale,
+        "max": float(maxima[-1]) * scale if selected else 0.0,
+        "mean": mean,
+        "std": math.sqrt(max(float(squares.sum()) * scale * scale / rows - mean * mean, 0.0)),
+    }
+    summary.update(zip(MetricStream.QUANTILES, quartiles))
+    return summary
+
+
+@dataclass
+class RunningMoments:
+    """Cuenta, suma y suma de cuadrados de los valores positivos."""
+
+    count: int = 0
+    total: float = 0.0
+    squares: float = 0.0
+
+    def add(self, values: np.ndarray) -> None:
+        positive = values[values > 0]
+        self.count += int(positive.size)
+        self.total += float(positive.sum())
+        self.squares += float(np.square(positive).sum())
+
+    def threshold(self) -> float:
+        """Media + 2σ (poblacional); infinito si no hay valores."""
+        if self.count == 0:
+            return math.inf
+        mean = self.total / self.count
+        return mean + 2.0 * math.sqrt(max(self.squares / self.count - mean * mean, 0.0))
+
+
+@dataclass
+class SessionAccumulator:
+    max_reasonable_speed: float = DEFAULT_MAX_REASONABLE_SPEED
+    offset: int = 0
+    prefix_digest: str = ""
+    anchor_digest: str = ""
+    header: list[str] = field(default_factory=list)
+    rows: int = 0
+    start_time: float = 0.0
+    last_time: float = 0.0
+    last_view: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    distance: float = 0.0
+    streams: dict[str, MetricStream] = field(
+        default_factory=lambda: {metric: MetricStream() for metric in _ROW_LOCAL_METRICS}
+    )
+    intervals: RunningMoments = field(default_factory=RunningMoments)
+    speeds: RunningMoments = field(default_factory=RunningMoments)
+    # Intervalos positivos de filas sin evento de edición y velocidades positivas.
+    pause_candidates: LogHistogram = field(default_factory=LogHistogram)
+    positive_speeds: LogHistogram = field(default_factory=LogHistogram)
+
+    def ingest(self, columns: SessionColumns) -> None:
+        """Añade filas ya parseadas, que continúan a las anteriores."""
+        count = len(columns)
+        if count == 0:
+            return
+        previous = None
+        if self.rows:
+            previous = (self.start_time, self.last_time, np.asarray(self.last_view), self.distance)
+        else:
+            self.start_time = float(columns["TimeStamp"][0])
+        metrics, dt, speed, edit_event = row_metrics(columns, self.max_reasonable_speed, previous)
+
+        for metric in _ROW_LOCAL_METRICS:
+            self.streams[metric].update(metrics[metric])
+        self.intervals.add(dt)
+        self.speeds.add(speed)
+        self.pause_candidates.update(dt[(dt > 0) & ~edit_event])
+        self.positive_speeds.update(speed[speed > 0])
+
+        self.rows += count
+        self.last_time = float(columns["TimeStamp"][-1])
+        self.last_view = [float(columns[axis][-1]) for axis in ("UserX", "UserY", "UserZ")]
+        self.distance = float(metrics["A9"][-1])
+
+    def refresh(self, path: str | Path) -> int:
+        """Lee las filas completas añadidas al archivo desde el último ``refresh``."""
+        with open(path, "rb") as handle:
+            return self.refresh_from(handle)
+
+    def refresh_from(self, handle) -> int:
+        """Como ``refresh`` sobre un objeto binario con ``seek``.
+
+        Si el contenido es más corto que lo ya leído o ha cambiado su comienzo
+        o los bytes previos al cursor, se ha sustituido: el estado se reinicia
+        y se lee desde el principio. Devuelve el número de filas nuevas.
+        """
+        prefix = handle.read(_PREFIX_BYTES)
+        size = handle.seek(0, io.SEEK_END)
+        if self.offset and (
+            size < self.offset
+            or _prefix_digest(prefix[:self.offset]) != self.prefix_digest
+            or self._anchor(handle) != self.anchor_digest
+        ):
+            self.reset()
+        handle.seek(self.offset)
+        data = handle.read()
+
+        complete = data[:data.rfind(b"\n") + 1]
+        if not complete:
+            return 0
+        lines = list(csv.reader(io.StringIO(complete.decode("utf-8"))))
+        if not self.header:
+            self.header = lines.pop(0) if lines else []
+        before = self.rows
+        self.ingest(columns_from_table(self.header, [line for line in lines if line]))
+        self.offset += len(complete)
+        self.prefix_digest = _prefix_digest(prefix[:self.offset])
+        self.anchor_digest = self._anchor(handle)
+        return self.rows - before
+
+    def _anchor(self, handle) -> str:
+        handle.seek(max(self.offset - _ANCHOR_BYTES, 0))
+        return _prefix_digest(handle.read(self.offset - handle.tell()))
+
+    def reset(self) -> None:
+        self.__init__(max_reasonable_speed=self.max_reasonable_speed)
+
+    def summary(self) -> dict[str, float]:
+        """Mínimo, cuartiles, máximo, media y desviación de A1--A16.
+
+        Media, desviación y extremos de las métricas por fila son exactos y
+        sus cuartiles vienen del sketch KLL; A2/A3/A6 salen del histograma
+        (ver el docstring del módulo).
+        """
+        summary = {"Rows": self.rows}
+        if not self.rows:
+            return summary
+        per_metric = {metric: self.streams[metric].summary() for metric in _ROW_LOCAL_METRICS}
+        per_metric["A2"] = per_metric["A3"] = _thresholded_summary(
+            self.pause_candidates, self.intervals.threshold(), self.rows
+        )
+        per_metric["A6"] = _thresholded_summary(
+            self.positive_speeds, self.speeds.threshold(), self.rows, scale=3600.0
+        )
+        for metric in METRIC_IDS:
+            for statistic, value in per_metric[metric].items():
+                summary[f"{metric}_{statistic}"] = value
+        return summary
+
+    def save(self, path: str | Path) -> None:
+        """Guarda el estado en un ``.npz`` (cubetas de los histogramas y JSON del resto)."""
+        meta = {
+            "format": STATE_FORMAT,
+            "max_reasonable_speed": self.max_reasonable_speed,
+            "offset": self.offset,
+            "prefix_digest": self.prefix_digest,
+            "anchor_digest": self.anchor_digest,
+            "header": self.header,
+            "rows": self.rows,
+            "start_time": self.start_time,
+            "last_time": self.last_time,
+            "last_view": self.last_view,
+            "distance": self.distance,
+            "streams": {metric: stream.to_dict() for metric, stream in self.streams.items()},
+            "intervals": vars(self.intervals),
+            "speeds": vars(self.speeds),
+        }
+        arrays = {
+            f"{name}_{field_name}": getattr(getattr(self, name), field_name)
+            for name in _HISTOGRAMS
+            for field_name in LogHistogram.FIELDS
+        }
+        meta["histograms"] = {name: getattr(self, name).bins_per_octave for name in _HISTOGRAMS}
+        with open(path, "wb") as handle:
+            np.savez(handle, meta=np.array(json.dumps(meta)), **arrays)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SessionAccumulator":
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.pop("format") != STATE_FORMAT:
+                raise ValueError("Formato de estado incremental no soportado")
+            meta["intervals"] = RunningMoments(**meta["intervals"])
+            meta["speeds"] = RunningMoments(**meta["speeds"])
+            meta["streams"] = {
+                metric: MetricStream.from_dict(stream) for metric, stream in meta["streams"].items()
+            }
+            histograms = {}
+            for name, bins_per_octave in meta.pop("histograms").items():
+                histograms[name] = LogHistogram.from_dict({
+                    "bins_per_octave": bins_per_octave,
+                    **{field_name: data[f"{name}_{field_name}"] for field_name in LogHistogram.FIELDS},
+                })
+            return cls(**histograms, **meta)
@@ -0,0 +1,113 @@
+"""Análisis en directo de la sesión que el logger está grabando.
+
+``LiveSessionTail`` sigue el CSV temporal del logger (``blender_data_log.csv``
+en el directorio temporal) o el text block ``data_log_internal.csv`` con un
+cursor en bytes: en cada sondeo solo se parsean las filas nuevas, que pasan
+a un ``SessionAccumulator``. Los sondeos se limitan a uno cada
+``min_interval`` segundos y los oyentes (paneles, gráficas) solo se avisan
+cuando llegan filas. ``timer`` tiene la firma que espera
+``bpy.app.timers.register``; un error en un sondeo (un CSV a medio
+reescribir, un oyente que falla) se registra como aviso y no detiene el
+temporizador. El módulo no importa Blender.
+"""
+from __future__ import annotations
+
+import io
+import logging
+import os
+from pathlib import Path
+import tempfile
+import time
+
+try:
+    from .session_incremental import SessionAccumulator
+except ImportError:
+    from session_incremental import SessionAccumulator
+
+# Mismos nombres que TEMP_CSV_PATH y DATA_TEXTBLOCK en Data_Logger_3D.py.
+LOGGER_TEMP_CSV_PATH = Path(tempfile.gettempdir()) / "blender_data_log.csv"
+LOGGER_DATA_TEXTBLOCK = "data_log_internal.csv"
+DEFAULT_REFRESH_INTERVAL = 1.0
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def textblock_source(texts, name: str = LOGGER_DATA_TEXTBLOCK):
+    """Fuente que lee un text block, p. ej. ``textblock_source(bpy.data.texts)``.
+
+    Un text block no se puede leer por partes, así que cada sondeo copia su
+    texto; el cursor evita volver a parsearlo.
+    """
+    def read():
+        return texts[name].as_string() if name in texts else None
+    return read
+
+
+class LiveSessionTail:
+    """Cursor sobre una sesión en curso que alimenta un acumulador incremental.
+
+    ``source`` es la ruta de un CSV o una función sin argumentos que devuelve
+    el contenido completo (``str``/``bytes``) o None si aún no existe.
+    """
+
+    def __init__(self, source=LOGGER_TEMP_CSV_PATH, accumulator: SessionAccumulator | None = None,
+                 min_interval: float = DEFAULT_REFRESH_INTERVAL, clock=time.monotonic):
+        self.source = source
+        self.accumulator = accumulator if accumulator is not None else SessionAccumulator()
+        self.min_interval = min_interval
+        self.listeners = []
+        self.running = True
+        self._clock = clock
+        self._last_poll = None
+        # Último error de ``timer``, para mostrarlo en la interfaz; None si el último sondeo fue bien.
+        self.last_error: Exception | None = None
+
+    def add_listener(self, callback) -> None:
+        """``callback(summary, new_rows)`` se llama tras cada sondeo con filas nuevas."""
+        self.listeners.append(callback)
+
+    def poll(self, force: bool = False) -> int | None:
+        """Lee las filas nuevas; None si el sondeo se ha limitado por tiempo."""
+        now = self._clock()
+        if not force and self._last_poll is not None and now - self._last_poll < self.min_interval:
+            return None
+        self._last_poll = now
+
+        new_rows = self._refresh()
+        if new_rows:
+            summary = self.accumulator.summary()
+            for callback in self.listeners:
+                callback(summary, new_rows)
+        return new_rows
+
+    def _refresh(self) -> int:
+        if callable(self.source):
+            content = self.source()
+            if content is None:
+                return 0
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            return self.accumulator.refresh_from(io.BytesIO(content))
+        if not os.path.exists(self.source):
+            return 0
+        return self.accumulator.refresh(self.source)
+
+    def timer(self) -> float | None:
+        """Callback para ``bpy.app.timers``: sondea y devuelve el próximo intervalo.
+
+        Blender desregistra un temporizador cuya función lanza una excepción,
+        así que los errores se registran y el sondeo sigue en el siguiente
+        intervalo.
+        """
+        if not self.running:
+            return None
+        try:
+            self.poll(force=True)
+            self.last_error = None
+        except Exception as exc:
+            self.last_error = exc
+            _LOGGER.warning("No se pudo actualizar la sesión en directo: %s: %s", type(exc).__name__, exc)
+        return self.min_interval
+
+    def stop(self) -> None:
+        self.running = False
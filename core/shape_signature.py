@@ -0,0 +1,168 @@
+"""Firmas de forma baratas para descartar candidatos antes de comparar.
+
+Una ``ShapeSignature`` resume una malla en unos cientos de bytes:
+
+- ``extents``: dimensiones de la caja envolvente divididas por la mayor,
+  ordenadas de menor a mayor;
+- ``d2``: histograma de la distribución D2 (Osada et al., 2002), las
+  distancias entre pares de puntos muestreados sobre la superficie,
+  divididas por la diagonal de la caja;
+- ``voxels``: ocupación de una rejilla de ``VOXEL_RESOLUTION``³ celdas
+  sobre la caja normalizada, empaquetada en bits;
+- ``counts``: vértices, aristas y caras, como en la similitud topológica
+  (RF-45).
+
+Todo es invariante a traslación y escala; la rejilla de vóxeles no lo es a
+rotaciones, igual que la comparación exacta. ``signature_distance`` y
+``rank_candidates`` dan una distancia en ``[0, 1]`` (0 para firmas iguales)
+y solo los mejores candidatos pasan a la comparación exacta.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+try:
+    from .surface_distance import sample_surface
+except ImportError:
+    from surface_distance import sample_surface
+
+SIGNATURE_FORMAT = 1
+D2_BINS = 32
+D2_PAIRS = 4_096
+VOXEL_RESOLUTION = 16
+# Peso de cada componente en la distancia combinada.
+DEFAULT_WEIGHTS = {"extents": 1.0, "d2": 1.0, "voxels": 1.0, "counts": 0.5}
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.int64)
+
+
+@dataclass
+class ShapeSignature:
+    extents: np.ndarray
+    d2: np.ndarray
+    voxels: np.ndarray
+    counts: np.ndarray
+
+    def to_dict(self) -> dict:
+        """Forma serializable en JSON, p. ej. para una propiedad del objeto en Blender."""
+        return {
+            "format": SIGNATURE_FORMAT,
+            "extents": self.extents.tolist(),
+            "d2": self.d2.tolist(),
+            "voxels": self.voxels.tobytes().hex(),
+            "counts": self.counts.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ShapeSignature":
+        if data.get("format") != SIGNATURE_FORMAT:
+            raise ValueError("Formato de firma de forma no soportado")
+        return cls(
+            np.asarray(data["extents"], dtype=np.float64),
+            np.asarray(data["d2"], dtype=np.float64),
+            np.frombuffer(bytes.fromhex(data["voxels"]), dtype=np.uint8).copy(),
+            np.asarray(data["counts"], dtype=np.int64),
+        )
+
+
+def _as_mesh(vertices, triangles) -> tuple[np.ndarray, np.ndarray]:
+    if not isinstance(vertices, np.ndarray):
+        vertices = [tuple(vertex) for vertex in vertices]
+    return (np.asarray(vertices, dtype=np.float64).reshape(-1, 3),
+            np.asarray(triangles, dtype=np.int64).reshape(-1, 3))
+
+
+def _edge_count(polygons) -> int:
+    edges = {
+        (min(polygon[index - 1], polygon[index]), max(polygon[index - 1], polygon[index]))
+        for polygon in polygons
+        for index in range(len(polygon))
+    }
+    return len(edges)
+
+
+def _triangle_edge_count(triangles: np.ndarray) -> int:
+    edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    return int(np.unique(edges, axis=0).shape[0]) if edges.size else 0
+
+
+def compute_signature(vertices, triangles, polygons=None, seed: int = 0) -> ShapeSignature:
+    """Firma de una malla triangulada.
+
+    ``polygons`` son las caras originales (listas de índices); si se dan,
+    aristas y caras se cuentan sobre ellas en lugar de sobre los triángulos.
+    """
+    vertices, triangles = _as_mesh(vertices, triangles)
+    if polygons is not None:
+        counts = [vertices.shape[0], _edge_count(polygons), len(polygons)]
+    else:
+        counts = [vertices.shape[0], _triangle_edge_count(triangles), triangles.shape[0]]
+
+    points = sample_surface(vertices, triangles, 2 * D2_PAIRS, seed)
+    cloud = np.vstack([vertices, points])
+    d2 = np.zeros(D2_BINS)
+    voxels = np.zeros(VOXEL_RESOLUTION ** 3 // 8, dtype=np.uint8)
+    extents = np.zeros(3)
+    if cloud.shape[0]:
+        lower = cloud.min(axis=0)
+        size = cloud.max(axis=0) - lower
+        largest = float(size.max())
+        if largest > 0.0:
+            extents = np.sort(size / largest)
+            scaled = np.minimum(((cloud - lower) / largest * VOXEL_RESOLUTION).astype(np.int64),
+                                VOXEL_RESOLUTION - 1)
+            occupied = np.zeros(VOXEL_RESOLUTION ** 3, dtype=bool)
+            occupied[(scaled[:, 0] * VOXEL_RESOLUTION + scaled[:, 1]) * VOXEL_RESOLUTION + scaled[:, 2]] = True
+            voxels = np.packbits(occupied)
+        else:
+            voxels[0] = 0x80
+        if points.shape[0]:
+            diagonal = float(np.linalg.norm(size)) or 1.0
+            distances = np.linalg.norm(points[:D2_PAIRS] - points[D2_PAIRS:], axis=1) / diagonal
+            d2 = np.histogram(distances, bins=D2_BINS, range=(0.0, 1.0))[0] / distances.size
+    return ShapeSignature(extents, d2, voxels, np.asarray(counts, dtype=np.int64))
+
+
+def _stack(signatures) -> dict[str, np.ndarray]:
+    return {name: np.stack([getattr(signature, name) for signature in signatures])
+            for name in ("extents", "d2", "voxels", "counts")}
+
+
+def _component_distances(query: ShapeSignature, stacked: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    union = _POPCOUNT[query.voxels | stacked["voxels"]].sum(axis=1)
+    common = _POPCOUNT[query.voxels & stacked["voxels"]].sum(axis=1)
+    larger = np.maximum(np.maximum(query.counts, stacked["counts"]), 1)
+    return {
+        "extents": np.abs(stacked["extents"] - query.extents).max(axis=1),
+        "d2": 0.5 * np.abs(stacked["d2"] - query.d2).sum(axis=1),
+        # Distancia de Jaccard entre conjuntos de celdas ocupadas.
+        "voxels": np.where(union > 0, 1.0 - common / np.maximum(union, 1), 0.0),
+        "counts": (np.abs(stacked["counts"] - query.counts) / larger).mean(axis=1),
+    }
+
+
+def signature_distances(query: ShapeSignature, signatures, weights=None) -> np.ndarray:
+    """Distancia ponderada en ``[0, 1]`` de ``query`` a cada firma de ``signatures``."""
+    signatures = list(signatures)
+    if not signatures:
+        return np.zeros(0)
+    weights = DEFAULT_WEIGHTS if weights is None else weights
+    components = _component_distances(query, _stack(signatures))
+    total = sum(weights.values())
+    return sum(weights[name] * components[name] for name in weights) / total
+
+
+def signature_distance(first: ShapeSignature, second: ShapeSignature, weights=None) -> float:
+    return float(signature_distances(first, [second], weights)[0])
+
+
+def rank_candidates(query: ShapeSignature, signatures: dict, top_k: int | None = None,
+                    weights=None) -> list[tuple[str, float]]:
+    """``(nombre, distancia)`` de las ``top_k`` firmas más parecidas, de más a menos."""
+    names = list(signatures)
+    distances = signature_distances(query, (signatures[name] for name in names), weights)
+    order = np.argsort(distances, kind="stable")
+    if top_k is not None:
+        order = order[:top_k]
+    return [(names[index], float(distances[index])) for index in order]
@@ -0,0 +1,282 @@
+"""Estimadores de una sola pasada para resumir series de métricas.
+
+- ``Moments``: cuenta, media y varianza exactas (Welford; los bloques y las
+  fusiones usan la fórmula de Chan), además de mínimo y máximo.
+- ``KLLSketch``: cuantiles aproximados con memoria acotada y fusionables
+  (Karnin, Lang y Liberty, 2016). Cada nivel ``h`` guarda muestras de peso
+  ``2**h``; al llenarse, se ordena y se conserva una de cada dos posiciones
+  con desplazamiento aleatorio. El error de rango normalizado es
+  proporcional a ``1/k``: con ``k=200`` ronda el 1,65 % con un 99 % de
+  confianza, y la memoria es ``O(k + log n)``: unas ``3k`` muestras más
+  un nivel por cada duplicación de la longitud ``n``.
+- ``MetricStream`` combina ambos y da mínimo, cuartiles, máximo, media y
+  desviación típica.
+- ``LogHistogram``: valores positivos en cubetas logarítmicas con cuenta,
+  suma, suma de cuadrados y extremos exactos por cubeta, para resumir la
+  parte que supera un umbral que aún no se conoce (A2/A3/A6). La memoria
+  depende del rango de los valores, no de cuántos hay.
+
+Todos se pueden fusionar, de modo que una cohorte se resume fusionando los
+resúmenes de cada sesión.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+DEFAULT_SKETCH_K = 200
+_CAPACITY_DECAY = 2.0 / 3.0
+
+
+class Moments:
+    """Media y varianza exactas en una pasada."""
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0,
+                 minimum: float = math.inf, maximum: float = -math.inf):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def update(self, values) -> None:
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size:
+            mean = float(values.mean())
+            self.merge(Moments(values.size, mean, float(np.square(values - mean).sum()),
+                               float(values.min()), float(values.max())))
+
+    def merge(self, other: "Moments") -> None:
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """Varianza poblacional, como ``np.var``."""
+        return self.m2 / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "mean": self.mean, "m2": self.m2,
+                "minimum": self.minimum, "maximum": self.maximum}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Moments":
+        return cls(**data)
+
+
+class KLLSketch:
+    """Sketch de cuantiles KLL sobre arrays NumPy."""
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K, seed: int | None = 0):
+        self.k = k
+        self.levels: list[np.ndarray] = [np.zeros(0)]
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return int(math.ceil(self.k * _CAPACITY_DECAY ** depth)) + 1
+
+    def _size(self) -> int:
+        return sum(level.size for level in self.levels)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(level) for level in range(len(self.levels)))
+
+    def update(self, values) -> None:
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self.count += values.size
+        # Bloques del tamaño del nivel 0 para compactar con la misma granularidad
+        # que una inserción elemento a elemento.
+        step = self.k
+        for start in range(0, values.size, step):
+            self.levels[0] = np.concatenate([self.levels[0], values[start:start + step]])
+            self._compress()
+
+    def _compress(self) -> None:
+        while self._size() >= self._max_size():
+            for level in range(len(self.levels)):
+                if self.levels[level].size >= self._capacity(level):
+                    if level + 1 == len(self.levels):
+                        self.levels.append(np.zeros(0))
+                    items = np.sort(self.levels[level])
+                    keep = items[-1:] if items.size % 2 else items[:0]
+                    paired = items[:items.size - keep.size]
+                    promoted = paired[int(self._rng.integers(2))::2]
+                    self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                    self.levels[level] = keep
+                    break
+
+    def merge(self, other: "KLLSketch") -> None:
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.zeros(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def quantiles(self, fractions) -> np.ndarray:
+        """Valores cuyo rango normalizado aproxima cada fracción en ``[0, 1]``."""
+        fractions = np.asarray(fractions, dtype=np.float64)
+        if self.count == 0:
+            return np.full(fractions.shape, np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(level.size, 2.0 ** height) for height, level in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        targets = fractions * cumulative[-1]
+        index = np.minimum(np.searchsorted(cumulative, targets, side="left"), items.size - 1)
+        return items[index]
+
+    def to_dict(self) -> dict:
+        return {"k": self.k, "count": self.count, "levels": [level.tolist() for level in self.levels]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "KLLSketch":
+        sketch = cls(data["k"])
+        sketch.count = data["count"]
+        sketch.levels = [np.asarray(level, dtype=np.float64) for level in data["levels"]]
+        return sketch
+
+
+class LogHistogram:
+    """Valores positivos en cubetas ``[2**(i/b), 2**((i+1)/b))``, con ``b = bins_per_octave``.
+
+    Lo que queda por encima de un umbral es exacto salvo en la única cubeta
+    cuyos valores lo rodean, que se reparte uniformemente entre su mínimo y
+    su máximo; con 16 cubetas por octava su anchura relativa es del 4,4 %.
+    """
+
+    FIELDS = ("keys", "counts", "totals", "squares", "minima", "maxima")
+
+    def __init__(self, bins_per_octave: int = 16):
+        self.bins_per_octave = bins_per_octave
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.totals = np.zeros(0)
+        self.squares = np.zeros(0)
+        self.minima = np.zeros(0)
+        self.maxima = np.zeros(0)
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def update(self, values) -> None:
+        """Añade los valores positivos y finitos de ``values``; el resto se ignora."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[(values > 0) & np.isfinite(values)]
+        if values.size:
+            keys = np.floor(np.log2(values) * self.bins_per_octave).astype(np.int64)
+            self._combine(keys, np.ones(values.size, dtype=np.int64), values, np.square(values), values, values)
+
+    def merge(self, other: "LogHistogram") -> None:
+        if other.bins_per_octave != self.bins_per_octave:
+            raise ValueError("Solo se fusionan histogramas con las mismas cubetas")
+        self._combine(other.keys, other.counts, other.totals, other.squares, other.minima, other.maxima)
+
+    def _combine(self, keys, counts, totals, squares, minima, maxima) -> None:
+        keys, inverse = np.unique(np.concatenate([self.keys, keys]), return_inverse=True)
+        def total(mine, theirs):
+            return np.bincount(inverse, weights=np.concatenate([mine, theirs]), minlength=keys.size)
+        self.counts = total(self.counts, counts).round().astype(np.int64)
+        self.totals = total(self.totals, totals)
+        self.squares = total(self.squares, squares)
+        lowest = np.full(keys.size, np.inf)
+        np.minimum.at(lowest, inverse, np.concatenate([self.minima, minima]))
+        highest = np.full(keys.size, -np.inf)
+        np.maximum.at(highest, inverse, np.concatenate([self.maxima, maxima]))
+        self.keys, self.minima, self.maxima = keys, lowest, highest
+
+    def above(self, threshold: float) -> tuple[np.ndarray, ...]:
+        """``(counts, totals, squares, minima, maxima)`` por cubeta de los valores ``>= threshold``.
+
+        Las cubetas van de menor a mayor. La cubeta que contiene al umbral se
+        estima suponiendo sus valores repartidos por igual entre su mínimo y
+        su máximo.
+        """
+        start = int(np.searchsorted(self.maxima, threshold, side="left"))
+        counts = self.counts[start:].copy()
+        totals, squares = self.totals[start:].copy(), self.squares[start:].copy()
+        minima, maxima = self.minima[start:].copy(), self.maxima[start:]
+        if counts.size and minima[0] < threshold:
+            low, high = threshold, maxima[0]
+            share = (high - low) / (high - minima[0])
+            counts[0] = max(1, int(round(counts[0] * share)))
+            totals[0] = counts[0] * (low + high) / 2.0
+            squares[0] = counts[0] * (low * low + low * high + high * high) / 3.0
+            minima[0] = low if counts[0] > 1 else high
+        return counts, totals, squares, minima, maxima
+
+    def to_dict(self) -> dict:
+        data = {name: getattr(self, name).tolist() for name in self.FIELDS}
+        data["bins_per_octave"] = self.bins_per_octave
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LogHistogram":
+        histogram = cls(data["bins_per_octave"])
+        for name in cls.FIELDS:
+            setattr(histogram, name, np.asarray(data[name], dtype=getattr(histogram, name).dtype))
+        return histogram
+
+
+class MetricStream:
+    """Resumen fusionable de una métrica: momentos exactos y cuartiles aproximados."""
+
+    QUANTILES = {"q1": 0.25, "median": 0.5, "q3": 0.75}
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K):
+        self.moments = Moments()
+        self.sketch = KLLSketch(k)
+
+    def update(self, values) -> None:
+        self.moments.update(values)
+        self.sketch.update(values)
+
+    def merge(self, other: "MetricStream") -> None:
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+
+    def summary(self) -> dict[str, float]:
+        if self.moments.count == 0:
+            return {}
+        quartiles = self.sketch.quantiles(list(self.QUANTILES.values()))
+        summary = {
+            "min": self.moments.minimum,
+            "max": self.moments.maximum,
+            "mean": self.moments.mean,
+            "std": math.sqrt(self.moments.variance),
+        }
+        summary.update({name: float(value) for name, value in zip(self.QUANTILES, quartiles)})
+        return summary
+
+    def to_dict(self) -> dict:
+        return {"moments": self.moments.to_dict(), "sketch": self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MetricStream":
+        stream = cls(data["sketch"]["k"])
+        stream.moments = Moments.from_dict(data["moments"])
+        stream.sketch = KLLSketch.from_dict(data["sketch"])
+        return stream
+
+
+def summarise_metrics(metrics: dict[str, np.ndarray], k: int = DEFAULT_SKETCH_K) -> dict[str, MetricStream]:
+    """Un ``MetricStream`` por métrica de ``compute_metrics_for_columns``."""
+    streams = {}
+    for metric, values in metrics.items():
+        streams[metric] = MetricStream(k)
+        streams[metric].update(values)
+    return streams
@@ -0,0 +1,333 @@
+"""Distancia punto-superficie con una BVH de triángulos, sin Blender.
+
+Comparar solo vértices depende de la densidad de teselado: un plano de dos
+triángulos y el mismo plano subdividido tienen vértices distintos aunque la
+superficie sea idéntica. Aquí se muestrean puntos sobre la superficie
+(proporcionalmente al área y de forma determinista con ``seed``) y se mide
+su distancia al triángulo más cercano de la otra malla.
+
+``TriangleBVH`` guarda el árbol en arrays planos (cajas, primer hijo y rango
+de triángulos por nodo). Las consultas se resuelven por lotes: un descenso
+voraz da una primera cota por punto y después se recorre un frente de pares
+``(punto, nodo)`` descartando los nodos cuya caja queda más lejos que la
+mejor distancia conocida. El resultado es exacto para los puntos dados.
+
+La poda falla cuando un punto está casi a la misma distancia de muchos
+triángulos (p. ej. el centro de una esfera cerrada) y entonces cada punto
+arrastra casi todo el árbol. Por eso el frente se procesa como una pila de
+tramos de como mucho ``FRONTIER_LIMIT`` pares, en profundidad: la memoria
+queda acotada por ``2 * FRONTIER_LIMIT`` pares por nivel del árbol, sea
+cual sea el número de puntos.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+# Triángulos por hoja de la BVH.
+LEAF_SIZE = 2
+# Puntos consultados a la vez (acota la memoria del descenso voraz).
+QUERY_BATCH = 65_536
+# Pares (punto, nodo) expandidos a la vez al recorrer el frente.
+FRONTIER_LIMIT = 1 << 16
+DEFAULT_SURFACE_SAMPLES = 20_000
+
+
+def fan_triangles(polygons) -> np.ndarray:
+    """Triangula en abanico polígonos dados como listas de índices de vértice."""
+    triangles = [
+        (polygon[0], polygon[index], polygon[index + 1])
+        for polygon in polygons
+        for index in range(1, len(polygon) - 1)
+    ]
+    return np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+
+
+def _as_mesh(vertices, triangles) -> tuple[np.ndarray, np.ndarray]:
+    if not isinstance(vertices, np.ndarray):
+        vertices = [tuple(vertex) for vertex in vertices]
+    return (np.asarray(vertices, dtype=np.float64).reshape(-1, 3),
+            np.asarray(triangles, dtype=np.int64).reshape(-1, 3))
+
+
+def triangle_areas(vertices, triangles) -> np.ndarray:
+    vertices, triangles = _as_mesh(vertices, triangles)
+    a, b, c = (vertices[triangles[:, corner]] for corner in range(3))
+    return 0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1)
+
+
+def sample_surface(vertices, triangles, count: int, seed: int = 0) -> np.ndarray:
+    """``count`` puntos uniformes sobre el área de la malla; mismos puntos con la misma ``seed``."""
+    vertices, triangles = _as_mesh(vertices, triangles)
+    areas = triangle_areas(vertices, triangles)
+    total = float(areas.sum()) if areas.size else 0.0
+    if count <= 0 or total <= 0.0:
+        return np.zeros((0, 3))
+    rng = np.random.default_rng(seed)
+    cumulative = np.cumsum(areas)
+    chosen = np.minimum(np.searchsorted(cumulative, rng.random(count) * total, side="right"),
+                        areas.size - 1)
+    # Coordenadas baricéntricas uniformes: sqrt(r1) reparte bien hacia el vértice opuesto.
+    root = np.sqrt(rng.random(count))[:, None]
+    second = rng.random(count)[:, None]
+    a, b, c = (vertices[triangles[chosen, corner]] for corner in range(3))
+    return (1.0 - root) * a + root * (1.0 - second) * b + root * second * c
+
+
+def _segment_closest(points, start, end):
+    direction = end - start
+    length = np.einsum("ij,ij->i", direction, direction)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.einsum("ij,ij->i", points - start, direction) / length
+    t = np.where(length > 0.0, np.clip(t, 0.0, 1.0), 0.0)
+    return start + t[:, None] * direction
+
+
+def closest_points_on_triangles(points, a, b, c) -> np.ndarray:
+    """Punto más cercano de cada triángulo ``(a, b, c)`` a su punto (Ericson, 5.1.5)."""
+    ab, ac = b - a, c - a
+
+    def dot(u, v):
+        return np.einsum("ij,ij->i", u, v)
+
+    ap, bp, cp = points - a, points - b, points - c
+    d1, d2 = dot(ab, ap), dot(ac, ap)
+    d3, d4 = dot(ab, bp), dot(ac, bp)
+    d5, d6 = dot(ab, cp), dot(ac, cp)
+    va, vb, vc = d3 * d6 - d5 * d4, d5 * d2 - d1 * d6, d1 * d4 - d3 * d2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = va + vb + vc
+        result = a + ab * (vb / denom)[:, None] + ac * (vc / denom)[:, None]
+        # Regiones de Voronoi de aristas y vértices; las últimas tienen prioridad.
+        regions = (
+            ((va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0),
+             lambda: b + ((d4 - d3) / ((d4 - d3) + (d5 - d6)))[:, None] * (c - b)),
+            ((vb <= 0) & (d2 >= 0) & (d6 <= 0), lambda: a + (d2 / (d2 - d6))[:, None] * ac),
+            ((d6 >= 0) & (d5 <= d6), lambda: c),
+            ((vc <= 0) & (d1 >= 0) & (d3 <= 0), lambda: a + (d1 / (d1 - d3))[:, None] * ab),
+            ((d3 >= 0) & (d4 <= d3), lambda: b),
+            ((d1 <= 0) & (d2 <= 0), lambda: a),
+        )
+        for mask, closest in regions:
+            if mask.any():
+                result = np.where(mask[:, None], closest(), result)
+
+    # Triángulos degenerados (área nula): el más cercano de sus tres lados.
+    broken = ~np.isfinite(result).all(axis=1) | (np.abs(denom) <= 1e-300)
+    if broken.any():
+        p, ta, tb, tc = points[broken], a[broken], b[broken], c[broken]
+        candidates = np.stack([_segment_closest(p, ta, tb), _segment_closest(p, tb, tc),
+                               _segment_closest(p, tc, ta)], axis=1)
+        nearest = np.linalg.norm(candidates - p[:, None, :], axis=2).argmin(axis=1)
+        result[broken] = candidates[np.arange(p.shape[0]), nearest]
+    return result
+
+
+def _box_distance_squared(points, lower, upper) -> np.ndarray:
+    gap = np.maximum(lower - points, 0.0) + np.maximum(points - upper, 0.0)
+    return np.einsum("ij,ij->i", gap, gap)
+
+
+class TriangleBVH:
+    """BVH de cajas alineadas sobre los triángulos de una malla de referencia.
+
+    Cada nodo parte sus triángulos por la mediana del centroide en el eje de
+    mayor extensión. El árbol se construye nivel a nivel: todos los nodos de
+    un nivel se ordenan a la vez con una clave ``(nodo, rango en su eje)``.
+    Los hijos de un nodo son consecutivos (``first_child`` y
+    ``first_child + 1``); las hojas tienen ``-1``.
+    """
+
+    ARRAYS = ("vertices", "triangles", "order", "lower", "upper", "first_child", "start", "count")
+
+    def __init__(self, vertices, triangles):
+        self.vertices, self.triangles = _as_mesh(vertices, triangles)
+        corners = self.vertices[self.triangles]
+        centroids = corners.mean(axis=1)
+        total = len(self)
+        ranks = np.empty((3, total), dtype=np.int64)
+        for axis in range(3):
+            ranks[axis, np.argsort(centroids[:, axis], kind="stable")] = np.arange(total)
+        # Una fila de relleno permite reducir rangos que terminan en el último triángulo.
+        padding = np.zeros((1, 3))
+        triangle_lower, triangle_upper = corners.min(axis=1), corners.max(axis=1)
+
+        order = np.arange(total)
+        lower, upper, first_child, start, count = [], [], [], [], []
+        begin = np.zeros(1 if total else 0, dtype=np.int64)
+        end = np.full(begin.size, total, dtype=np.int64)
+        created = begin.size
+        while begin.size:
+            bounds = np.column_stack([begin, end]).ravel()
+            lower.append(np.minimum.reduceat(np.vstack([triangle_lower[order], padding]), bounds)[::2])
+            upper.append(np.maximum.reduceat(np.vstack([triangle_upper[order], padding]), bounds)[::2])
+            start.append(begin)
+            count.append(end - begin)
+            inner = end - begin > LEAF_SIZE
+            children = np.full(begin.size, -1, dtype=np.int64)
+            children[inner] = created + 2 * np.arange(int(inner.sum()))
+            first_child.append(children)
+            created += 2 * int(inner.sum())
+            begin, end = begin[inner], end[inner]
+            if not begin.size:
+                break
+
+            sorted_centroids = np.vstack([centroids[order], padding])
+            bounds = np.column_stack([begin, end]).ravel()
+            extent = (np.maximum.reduceat(sorted_centroids, bounds)[::2]
+                      - np.minimum.reduceat(sorted_centroids, bounds)[::2])
+            axis = extent.argmax(axis=1)
+            sizes = end - begin
+            segment = np.repeat(np.arange(begin.size), sizes)
+            positions = np.repeat(begin - (np.cumsum(sizes) - sizes), sizes) + np.arange(segment.size)
+            members = order[positions]
+            key = segment * total + ranks[axis[segment], members]
+            order[positions] = members[np.argsort(key, kind="stable")]
+
+            middle = (begin + end) // 2
+            begin = np.column_stack([begin, middle]).ravel()
+            end = np.column_stack([middle, end]).ravel()
+
+        self.order = order
+
+        empty = [np.zeros(0, dtype=np.int64)]
+        self.lower = np.concatenate(lower or [np.zeros((0, 3))])
+        self.upper = np.concatenate(upper or [np.zeros((0, 3))])
+        self.first_child = np.concatenate(first_child or empty)
+        self.start = np.concatenate(start or empty)
+        self.count = np.concatenate(count or empty)
+
+    def __len__(self) -> int:
+        return int(self.triangles.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.ARRAYS)
+
+    @classmethod
+    def from_arrays(cls, arrays) -> "TriangleBVH":
+        """Reconstruye un árbol ya calculado a partir de sus ``ARRAYS``."""
+        bvh = cls.__new__(cls)
+        for name in cls.ARRAYS:
+            setattr(bvh, name, arrays[name])
+        return bvh
+
+    def _leaf_distances(self, queries, query_index, leaves, best) -> None:
+        """Actualiza ``best`` (cuadrados) con los triángulos de las hojas ``leaves``."""
+        counts = self.count[leaves]
+        owners = np.repeat(query_index, counts)
+        segments = np.cumsum(counts) - counts
+        slots = np.repeat(self.start[leaves] - segments, counts) + np.arange(owners.size)
+        triangles = self.triangles[self.order[slots]]
+        points = queries[owners]
+        closest = closest_points_on_triangles(points, *(self.vertices[triangles[:, corner]] for corner in range(3)))
+        squared = np.einsum("ij,ij->i", closest - points, closest - points)
+        # Agrupa por consulta para reducir con un mínimo por segmento.
+        grouped = np.argsort(owners, kind="stable")
+        owners, squared = owners[grouped], squared[grouped]
+        heads = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+        nearest = np.minimum.reduceat(squared, heads)
+        best[owners[heads]] = np.minimum(best[owners[heads]], nearest)
+
+    def _query_batch(self, queries) -> np.ndarray:
+        best = np.full(queries.shape[0], np.inf)
+        everyone = np.arange(queries.shape[0])
+
+        # Descenso voraz hacia la caja hija más cercana: primera cota superior.
+        node = np.zeros(queries.shape[0], dtype=np.int64)
+        while True:
+            inner = self.first_child[node] >= 0
+            if not inner.any():
+                break
+            left = self.first_child[node[inner]]
+            points = queries[inner]
+            to_left = _box_distance_squared(points, self.lower[left], self.upper[left])
+            to_right = _box_distance_squared(points, self.lower[left + 1], self.upper[left + 1])
+            node[inner] = np.where(to_left <= to_right, left, left + 1)
+        self._leaf_distances(queries, everyone, node, best)
+
+        # Frente de pares (consulta, nodo) podado por la mejor distancia conocida,
+        # como pila de tramos: se expande siempre el final del último tramo.
+        pending = [(everyone, np.zeros(queries.shape[0], dtype=np.int64))]
+        while pending:
+            query_index, node = pending.pop()
+            if query_index.size > FRONTIER_LIMIT:
+                pending.append((query_index[:-FRONTIER_LIMIT], node[:-FRONTIER_LIMIT]))
+                query_index, node = query_index[-FRONTIER_LIMIT:], node[-FRONTIER_LIMIT:]
+            bound = _box_distance_squared(queries[query_index], self.lower[node], self.upper[node])
+            useful = bound < best[query_index]
+            query_index, node = query_index[useful], node[useful]
+            leaf = self.first_child[node] < 0
+            if leaf.any():
+                self._leaf_distances(queries, query_index[leaf], node[leaf], best)
+            query_index, children = query_index[~leaf], self.first_child[node[~leaf]]
+            if query_index.size:
+                pending.append((np.concatenate([query_index, query_index]),
+                                np.concatenate([children, children + 1])))
+        return np.sqrt(best)
+
+    def distances(self, points) -> np.ndarray:
+        """Distancia exacta de cada punto a la superficie; infinito si no hay triángulos."""
+        points, _ = _as_mesh(points, [])
+        if len(self) == 0:
+            return np.full(points.shape[0], np.inf)
+        return np.concatenate([
+            self._query_batch(points[begin:begin + QUERY_BATCH])
+            for begin in range(0, points.shape[0], QUERY_BATCH)
+        ] or [np.zeros(0)])
+
+
+def summarise_distances(forward: np.ndarray, backward: np.ndarray) -> dict[str, float]:
+    """Media, RMS y máximo de cada dirección; vacío si alguna no tiene puntos."""
+    summary = {}
+    for prefix, values in (("mesh_to_reference", forward), ("reference_to_mesh", backward)):
+        if values.size == 0:
+            return {}
+        summary[f"{prefix}_mean"] = float(values.mean())
+        summary[f"{prefix}_rms"] = float(np.sqrt(np.square(values).mean()))
+        summary[f"{prefix}_max"] = float(values.max())
+    summary["Hausdorff"] = max(summary["mesh_to_reference_max"], summary["reference_to_mesh_max"])
+    return summary
+
+
+def similarity_from_summary(summary: dict[str, float], reference_vertices) -> float:
+    """Similitud 0--100 de un resumen de ``summarise_distances``.
+
+    ``100 * (1 - d / diagonal)``, con ``d`` la media de las distancias medias
+    en ambas direcciones y ``diagonal`` la de la caja de la referencia;
+    redondeada a dos decimales. 0 con un resumen vacío.
+    """
+    if not summary:
+        return 0.0
+    reference, _ = _as_mesh(reference_vertices, [])
+    diagonal = float(np.linalg.norm(reference.max(axis=0) - reference.min(axis=0)))
+    distance = 0.5 * (summary["mesh_to_reference_mean"] + summary["reference_to_mesh_mean"])
+    if diagonal <= 0.0:
+        return 100.0 if distance == 0.0 else 0.0
+    return round(max(0.0, 100.0 * (1.0 - distance / diagonal)), 2)
+
+
+def surface_distance_summary(vertices, triangles, reference_vertices, reference_triangles,
+                             samples: int = DEFAULT_SURFACE_SAMPLES, seed: int = 0) -> dict[str, float]:
+    """Media, RMS y máximo de las distancias muestreadas en ambas direcciones.
+
+    ``*_to_reference`` mide puntos de la malla contra la referencia y
+    ``reference_to_*`` al revés; ``Hausdorff`` es el máximo de ambos máximos
+    (una aproximación por muestreo de la distancia entre superficies).
+    """
+    forward = TriangleBVH(reference_vertices, reference_triangles).distances(
+        sample_surface(vertices, triangles, samples, seed))
+    backward = TriangleBVH(vertices, triangles).distances(
+        sample_surface(reference_vertices, reference_triangles, samples, seed + 1))
+    return summarise_distances(forward, backward)
+
+
+def surface_similarity(vertices, triangles, reference_vertices, reference_triangles,
+                       samples: int = DEFAULT_SURFACE_SAMPLES, seed: int = 0) -> float:
+    """Similitud 0--100 por distancia media entre superficies (``similarity_from_summary``).
+
+    0 si alguna malla no tiene área.
+    """
+    summary = surface_distance_summary(vertices, triangles, reference_vertices, reference_triangles,
+                                       samples, seed)
+    return similarity_from_summary(summary, reference_vertices)
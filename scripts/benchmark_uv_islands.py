@@ -0,0 +1,110 @@
+"""Compara el recuento de islas UV anterior con el basado en union-find.
+
+Uso recomendado:
+    blender --background --python scripts/benchmark_uv_islands.py
+
+Crea rejillas de 10k a 1M caras con ``bmesh.ops.create_grid`` y mide ambas
+implementaciones sobre la misma BMesh. La versión anterior se conserva aquí
+solo como referencia; por encima de ``LEGACY_FACE_LIMIT`` no se ejecuta
+porque tarda demasiado.
+"""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+import time
+
+import bmesh
+import bpy
+
+FACE_COUNTS = (10_000, 100_000, 1_000_000)
+LEGACY_FACE_LIMIT = 100_000
+
+
+def load_logger():
+    """Importa ``Data_Logger_3D.py`` sin registrarlo como add-on."""
+    path = Path(__file__).resolve().parents[1] / "Data_Loggers" / "Data_Logger_3D.py"
+    spec = importlib.util.spec_from_file_location("data_logger_benchmark", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_count_uv_islands(bm, uv_layer, tol=1e-4):
+    """Recorrido DFS anterior con comparación de todos los pares de loops."""
+    visited = set()
+    islands = 0
+    for face in bm.faces:
+        if face.index in visited:
+            continue
+        stack = [face]
+        while stack:
+            current = stack.pop()
+            if current.index in visited:
+                continue
+            visited.add(current.index)
+            for edge in current.edges:
+                for linked in edge.link_faces:
+                    if linked.index in visited:
+                        continue
+                    connected = any(
+                        abs(loop_a[uv_layer].uv.x - loop_b[uv_layer].uv.x) <= tol
+                        and abs(loop_a[uv_layer].uv.y - loop_b[uv_layer].uv.y) <= tol
+                        for loop_a in current.loops
+                        for loop_b in linked.loops
+                    )
+                    if connected:
+                        stack.append(linked)
+        islands += 1
+    return islands
+
+
+def grid_bmesh(face_count):
+    side = max(int(round(face_count ** 0.5)), 1)
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    bmesh.ops.create_grid(bm, x_segments=side, y_segments=side, size=1.0, calc_uvs=True)
+    bm.faces.ensure_lookup_table()
+    bm.verts.ensure_lookup_table()
+    return bm
+
+
+def union_find_count(logger, bm, uv_layer):
+    """Recuento actual: buffers de la malla y ``uv_island_labels``."""
+    mesh = bpy.data.meshes.new("uv_island_benchmark")
+    try:
+        bm.to_mesh(mesh)
+        buffers = logger.read_mesh_buffers(mesh)
+    finally:
+        bpy.data.meshes.remove(mesh)
+    return logger._uv_island_count(logger.mesh_arrays_from_buffers(buffers))
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    logger = load_logger()
+    print(f"{'faces':>10} {'legacy_s':>10} {'union_find_s':>13} {'islands':>8}")
+    for face_count in FACE_COUNTS:
+        bm = grid_bmesh(face_count)
+        try:
+            uv_layer = bm.loops.layers.uv.active
+            islands, new_seconds = timed(union_find_count, logger, bm, uv_layer)
+            legacy = "-"
+            if len(bm.faces) <= LEGACY_FACE_LIMIT:
+                legacy_islands, legacy_seconds = timed(legacy_count_uv_islands, bm, uv_layer)
+                assert legacy_islands == islands, (legacy_islands, islands)
+                legacy = f"{legacy_seconds:.3f}"
+            print(f"{len(bm.faces):>10} {legacy:>10} {new_seconds:>13.3f} {islands:>8}")
+        finally:
+            bm.free()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import types
+
+import pytest
+
+from ._logger_test_utils import load_logger_module
+
+
+@pytest.fixture(scope="module")
+def logger():
+    return load_logger_module()
+
+
+def _fake_mesh_object(name, vertex_count=4):
+    mesh = types.SimpleNamespace(
+        name=f"{name}_mesh",
+        vertices=[object()] * vertex_count,
+        edges=[object()] * vertex_count,
+        polygons=[object()],
+        loops=[object()] * vertex_count,
+        uv_layers=types.SimpleNamespace(active=None),
+    )
+    return types.SimpleNamespace(
+        name=name,
+        type="MESH",
+        mode="OBJECT",
+        data=mesh,
+        matrix_world=[[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0],
+                      [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]],
+    )
+
+
+@pytest.fixture
+def baseline_logger(logger, monkeypatch):
+    logger.bpy.data.texts.clear()
+    hashed = []
+
+    def digest(kind):
+        def _digest(obj):
+            hashed.append((kind, obj.name))
+            return f"{kind}-{obj.name}"
+        return _digest
+
+    monkeypatch.setattr(logger, "_object_geometry_digest", digest("geometry"))
+    monkeypatch.setattr(logger, "_object_uv_coordinate_digest", digest("uv"))
+    monkeypatch.setattr(logger, "_object_uv_topology_digest", digest("topology"))
+    monkeypatch.setattr(logger, "get_realtime_mesh_stats_safe", lambda obj: (4, 0, 0, 0))
+    monkeypatch.setattr(logger, "timer_running", True, raising=False)
+    monkeypatch.setattr(logger, "_baseline_ready", True, raising=False)
+    monkeypatch.setattr(logger, "_dirty_baseline_ids", set(), raising=False)
+    logger.discard_persisted_baseline()
+    yield logger, hashed
+    logger.discard_persisted_baseline()
+    logger.bpy.data.texts.clear()
+
+
+def _persist(logger, monkeypatch, objects):
+    records = {obj.name: logger._object_snapshot_record(obj) for obj in objects}
+    monkeypatch.setattr(logger, "prev_object_records", records, raising=False)
+    assert logger.persist_logger_baseline() is True
+
+
+def test_reopened_file_reuses_matching_records(baseline_logger, monkeypatch):
+    logger, hashed = baseline_logger
+    objects = [_fake_mesh_object("Cube"), _fake_mesh_object("Plane")]
+    _persist(logger, monkeypatch, objects)
+    hashed.clear()
+
+    assert logger.load_persisted_baseline() is True
+    records = [logger._object_snapshot_record(obj) for obj in objects]
+
+    assert hashed == []
+    assert all(record["reused"] for record in records)
+    assert records[0]["geometry"] == "geometry-Cube"
+
+
+def test_only_objects_that_disagree_are_rehashed(baseline_logger, monkeypatch):
+    logger, hashed = baseline_logger
+    cube, plane = _fake_mesh_object("Cube"), _fake_mesh_object("Plane")
+    _persist(logger, monkeypatch, [cube, plane])
+    hashed.clear()
+
+    logger.load_persisted_baseline()
+    edited_plane = _fake_mesh_object("Plane", vertex_count=8)
+    cube_record = logger._object_snapshot_record(cube)
+    plane_record = logger._object_snapshot_record(edited_plane)
+
+    assert cube_record["reused"] is True
+    assert plane_record["reused"] is False
+    assert {name for _, name in hashed} == {"Plane"}
+
+
+def test_dirty_and_edit_mode_objects_are_not_persisted(baseline_logger, monkeypatch):
+    logger, _ = baseline_logger
+    cube, plane, sphere = (
+        _fake_mesh_object("Cube"),
+        _fake_mesh_object("Plane"),
+        _fake_mesh_object("Sphere"),
+    )
+    sphere.mode = "EDIT"
+    records = {obj.name: logger._object_snapshot_record(obj) for obj in (cube, plane, sphere)}
+    monkeypatch.setattr(logger, "prev_object_records", records, raising=False)
+    logger._dirty_baseline_ids.add("Plane_mesh")
+
+    logger.persist_logger_baseline()
+    payload = json.loads(
+        logger.bpy.data.texts[logger.BASELINE_TEXTBLOCK].as_string()
+    )
+
+    assert set(payload["objects"]) == {"Cube"}
+    assert payload["scene"]["complete"] is False
+
+
+def test_baseline_from_another_logger_version_is_ignored(baseline_logger, monkeypatch):
+    logger, _ = baseline_logger
+    _persist(logger, monkeypatch, [_fake_mesh_object("Cube")])
+    text = logger.bpy.data.texts[logger.BASELINE_TEXTBLOCK]
+    payload = json.loads(text.as_string())
+    payload["logger_version"] = "0.0.1"
+    text.clear()
+    text.write(json.dumps(payload))
+
+    assert logger.load_persisted_baseline() is False
+    assert logger._persisted_object_records == {}
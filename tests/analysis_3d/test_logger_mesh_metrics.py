@@ -0,0 +1,795 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import csv
+import io
+import json
+import math
+import time
+import types
+
+import numpy as np
+import pytest
+
+from tests._project_loader import load_project_module
+
+from ._logger_test_utils import load_logger_module
+
+
+@pytest.fixture(scope="module")
+def logger():
+    return load_logger_module()
+
+
+def _partial(logger, **values):
+    partial = {key: 0 for key in logger.MESH_METRIC_PARTIAL_KEYS}
+    partial.update(values)
+    return partial
+
+
+def test_merge_mesh_metric_partials_sums_every_key(logger):
+    first = _partial(logger, faces=10, verts=12, components=1, uv_area=0.25)
+    second = _partial(logger, faces=6, verts=8, components=2, uv_area=0.5)
+
+    total = logger.merge_mesh_metric_partials([first, second])
+
+    assert total["faces"] == 16
+    assert total["verts"] == 20
+    assert total["components"] == 3
+    assert total["uv_area"] == pytest.approx(0.75)
+
+
+def test_finalize_reduces_scene_metrics_from_merged_partials(logger):
+    cube = _partial(
+        logger, faces=6, verts=8, components=1, non_quad_faces=0,
+        uv_mapped_area=0.5, surface_mapped_area=6.0,
+        uv_stretch_sum=0.6, uv_stretch_faces=6,
+        angle_sum=12 * 90.0, angle_count=12,
+    )
+    cone = _partial(
+        logger, faces=4, verts=5, components=1, non_quad_faces=4,
+        duplicate_verts=1, flipped_faces=2,
+        uv_mapped_area=0.25, surface_mapped_area=3.0,
+        uv_stretch_sum=0.2, uv_stretch_faces=4,
+        angle_sum=8 * 45.0, angle_count=8,
+    )
+
+    metrics = logger.finalize_mesh_metrics(
+        logger.merge_mesh_metric_partials([cube, cone]),
+        transforms_applied=True,
+        at_origin=False,
+    )
+
+    assert metrics["N_faces"] == 10
+    assert metrics["N_meshes"] == 2
+    assert metrics["Face_by_mesh"] == 5.0
+    assert metrics["Non_quads_percentage"] == 40.0
+    assert metrics["Normal_percentage"] == 20.0
+    assert metrics["Vertex_duplicate"] == 1
+    assert metrics["Vertex_duplicate_percentage"] == round(100.0 / 13, 2)
+    assert metrics["UV_stretch"] == pytest.approx(0.08)
+    assert metrics["UV_textel_density"] == round(math.sqrt(0.75 / 9.0), 4)
+    assert metrics["Angle"] == 72.0
+    assert metrics["Transformations"] is True
+    assert metrics["Position"] is False
+
+
+def test_finalize_empty_totals_returns_zeroes(logger):
+    metrics = logger.finalize_mesh_metrics(logger.merge_mesh_metric_partials([]))
+
+    assert metrics["N_faces"] == 0
+    assert metrics["Face_by_mesh"] == 0.0
+    assert metrics["UV_stretch"] == 0.0
+    assert metrics["Angle"] == 0.0
+
+
+class _FakeCollection(list):
+    """Colección mínima con ``foreach_get`` como las de ``bpy.types.Mesh``."""
+
+    def __init__(self, items, attribute):
+        super().__init__(items)
+        self._attribute = attribute
+
+    def foreach_get(self, attribute, buffer):
+        flat = []
+        for item in self:
+            value = item[attribute] if isinstance(item, dict) else item
+            flat.extend(value if isinstance(value, (list, tuple)) else [value])
+        buffer[:] = flat
+
+
+def _fake_evaluated_mesh(offset=0.0):
+    coords = [(0.0 + offset, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)]
+    uv_data = _FakeCollection([{"uv": (x, y)} for x, y, _ in coords], "uv")
+    return types.SimpleNamespace(
+        vertices=_FakeCollection([{"co": co} for co in coords], "co"),
+        edges=_FakeCollection([{"vertices": (i, (i + 1) % 4)} for i in range(4)], "vertices"),
+        loops=_FakeCollection([{"vertex_index": i} for i in range(4)], "vertex_index"),
+        polygons=_FakeCollection([{"loop_start": 0, "loop_total": 4}], "loop_start"),
+        uv_layers=types.SimpleNamespace(
+            active=types.SimpleNamespace(name="UVMap", data=uv_data)
+        ),
+    )
+
+
+_IDENTITY = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0],
+             [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]
+
+
+def _fake_scene_object(name, mesh):
+    evaluated = types.SimpleNamespace(
+        to_mesh=lambda **kwargs: mesh,
+        to_mesh_clear=lambda: None,
+    )
+    return types.SimpleNamespace(
+        name=name, type="MESH", mode="OBJECT",
+        matrix_world=_IDENTITY,
+        scale=(1.0, 1.0, 1.0), rotation_euler=(0.0, 0.0, 0.0), location=(0.0, 0.0, 0.0),
+        evaluated_get=lambda depsgraph: evaluated,
+    )
+
+
+def _digest(logger, mesh, matrix):
+    return logger._mesh_buffers_digest(logger.read_mesh_buffers(mesh), matrix)
+
+
+def test_evaluated_mesh_digest_tracks_geometry_and_transform(logger):
+    base = _digest(logger, _fake_evaluated_mesh(), _IDENTITY)
+    moved = [row[:] for row in _IDENTITY]
+    moved[0][3] = 2.0
+
+    assert base == _digest(logger, _fake_evaluated_mesh(), _IDENTITY)
+    assert base != _digest(logger, _fake_evaluated_mesh(0.5), _IDENTITY)
+    assert base != _digest(logger, _fake_evaluated_mesh(), moved)
+
+
+def test_mesh_arrays_from_buffers_applies_world_matrix(logger):
+    moved = [row[:] for row in _IDENTITY]
+    moved[0][3] = 2.0
+    buffers = logger.read_mesh_buffers(_fake_evaluated_mesh())
+
+    mesh = logger.mesh_arrays_from_buffers(buffers, moved)
+
+    assert mesh.coords[:, 0].tolist() == [2.0, 3.0, 3.0, 2.0]
+    assert mesh.loop_uvs.shape == (4, 2)
+    assert mesh.areas.tolist() == [1.0]
+
+
+@pytest.fixture
+def scene_metrics(logger, monkeypatch, tmp_path):
+    logger.bpy.data.texts.clear()
+    monkeypatch.setattr(logger, "TEMP_MESH_METRICS_HISTORY_CSV_PATH", str(tmp_path / "history.csv"))
+    measured = []
+
+    def fake_partials(mesh, timings=None, sample_fraction=1.0, seed=0, skip=()):
+        measured.append(mesh)
+        return _partial(logger, faces=1, verts=4, components=1, sampled_faces=1, skipped_stages=sorted(skip))
+
+    monkeypatch.setattr(logger, "mesh_metric_partials", fake_partials)
+    monkeypatch.setattr(logger.bpy.context, "evaluated_depsgraph_get", lambda: None, raising=False)
+    yield logger, measured
+    logger.bpy.data.texts.clear()
+
+
+def test_second_save_reuses_cached_partials_of_unchanged_objects(scene_metrics, monkeypatch):
+    logger, measured = scene_metrics
+    cube = _fake_scene_object("Cube", _fake_evaluated_mesh())
+    plane = _fake_scene_object("Plane", _fake_evaluated_mesh(0.25))
+    monkeypatch.setattr(logger.bpy.context.scene, "objects", [cube, plane])
+
+    first = logger.calculate_scene_mesh_metrics()
+    assert (first["Cache_hits"], first["Cache_misses"]) == (0, 2)
+    assert len(measured) == 2
+
+    edited = _fake_scene_object("Plane", _fake_evaluated_mesh(0.75))
+    monkeypatch.setattr(logger.bpy.context.scene, "objects", [cube, edited])
+    second = logger.calculate_scene_mesh_metrics()
+
+    assert (second["Cache_hits"], second["Cache_misses"]) == (1, 1)
+    assert len(measured) == 3
+    assert second["N_faces"] == first["N_faces"] == 2
+    assert len(logger.load_mesh_metrics_cache()) == 2
+
+
+def test_scene_row_keeps_transform_columns_and_reports_objects_separately(scene_metrics, monkeypatch):
+    logger, _ = scene_metrics
+    cube = _fake_scene_object("Cube", _fake_evaluated_mesh())
+    moved = _fake_scene_object("Plane", _fake_evaluated_mesh(0.25))
+    moved.location = (1.0, 0.0, 0.0)
+    monkeypatch.setattr(logger.bpy.context.scene, "objects", [cube, moved])
+
+    metrics = logger.calculate_scene_mesh_metrics()
+
+    # Transformations/Position describen la malla combinada, como antes.
+    assert (metrics["Transformations"], metrics["Position"]) == (True, True)
+    assert (metrics["All_transforms_applied"], metrics["All_at_origin"]) == (True, False)
+
+
+def test_cache_from_another_version_is_ignored(logger):
+    logger.bpy.data.texts.clear()
+    txt = logger.get_or_create_textblock(logger.MESH_METRICS_CACHE_TEXTBLOCK)
+    txt.write(json.dumps({"format": -1, "entries": {"abc": _partial(logger)}}))
+
+    assert logger.load_mesh_metrics_cache() == {}
+    logger.bpy.data.texts.clear()
+
+
+def _grid_loops(columns, rows, seam_after=None):
+    """Rejilla de quads con UV igual a XY; ``seam_after`` corta la UV en una columna."""
+    loop_faces, loop_verts, loop_uvs = [], [], []
+    face = 0
+    for row in range(rows):
+        for column in range(columns):
+            corners = ((column, row), (column + 1, row), (column + 1, row + 1), (column, row + 1))
+            shift = 10.0 if seam_after is not None and column > seam_after else 0.0
+            for x, y in corners:
+                loop_faces.append(face)
+                loop_verts.append(y * (columns + 1) + x)
+                loop_uvs.append((x + shift, y))
+            face += 1
+    return loop_faces, loop_verts, loop_uvs, face
+
+
+def test_union_find_labels_merges_long_chains(logger):
+    count = 1000
+    labels, components = logger._union_find_labels(
+        count + 1, list(range(count - 1, 0, -1)), list(range(count - 2, -1, -1))
+    )
+
+    assert components == 2
+    assert len(set(labels[:count].tolist())) == 1
+    assert labels[count] != labels[0]
+
+
+def test_uv_island_labels_counts_connected_and_seamed_grids(logger):
+    loop_faces, loop_verts, loop_uvs, faces = _grid_loops(4, 3)
+    labels, islands = logger.uv_island_labels(loop_faces, loop_verts, loop_uvs, faces)
+    assert islands == 1
+    assert labels.tolist() == [0] * faces
+
+    loop_faces, loop_verts, loop_uvs, faces = _grid_loops(4, 3, seam_after=1)
+    labels, islands = logger.uv_island_labels(loop_faces, loop_verts, loop_uvs, faces)
+    assert islands == 2
+    assert labels.reshape(3, 4)[:, :2].tolist() == [[labels[0]] * 2] * 3
+    assert labels[0] != labels[3]
+
+
+def test_uv_island_labels_tolerates_float_noise(logger):
+    loop_faces, loop_verts, loop_uvs, faces = _grid_loops(2, 1)
+    noisy = [(u + (1e-6 if index % 2 else -1e-6), v) for index, (u, v) in enumerate(loop_uvs)]
+
+    assert logger.uv_island_labels(loop_faces, loop_verts, noisy, faces)[1] == 1
+    assert logger.uv_island_labels([], [], [], 0)[1] == 0
+
+
+def test_uv_island_labels_joins_loops_across_bin_boundaries(logger):
+    tol = logger.UV_ISLAND_TOLERANCE
+    # Dos caras que solo comparten el vértice 0, con UV a ambos lados de un borde de celda.
+    loop_faces = [0, 0, 0, 1, 1, 1]
+    loop_verts = [0, 1, 2, 0, 3, 4]
+    for first, second in (((tol - 1e-9, 0.0), (tol + 1e-9, 0.0)),
+                          ((0.0, -1e-9), (0.0, 1e-9)),
+                          ((-1e-9, 2 * tol - 1e-9), (0.9 * tol, 1.9 * tol))):
+        loop_uvs = [first, (1.0, 0.0), (0.0, 1.0), second, (-1.0, 0.0), (0.0, -1.0)]
+        assert logger.uv_island_labels(loop_faces, loop_verts, loop_uvs, 2)[1] == 1, (first, second)
+
+    loop_uvs = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.5 * tol, 0.0), (-1.0, 0.0), (0.0, -1.0)]
+    assert logger.uv_island_labels(loop_faces, loop_verts, loop_uvs, 2)[1] == 2
+
+
+def _reference_uv_totals(polygons, coords):
+    """Definición anterior, cara a cara, usada como referencia del kernel."""
+    def sub(a, b):
+        return tuple(x - y for x, y in zip(a, b))
+
+    def norm(a):
+        return math.sqrt(sum(x * x for x in a))
+
+    def cross3(a, b):
+        return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+    totals = {"uv_area": 0.0, "uv_mapped_area": 0.0, "surface_mapped_area": 0.0,
+              "uv_stretch_sum": 0.0, "uv_stretch_faces": 0}
+    for verts, face_uvs in polygons:
+        points = [coords[v] for v in verts]
+        uv_area = sum(
+            abs(sub(face_uvs[i], face_uvs[0])[0] * sub(face_uvs[i + 1], face_uvs[0])[1]
+                - sub(face_uvs[i], face_uvs[0])[1] * sub(face_uvs[i + 1], face_uvs[0])[0]) * 0.5
+            for i in range(1, len(face_uvs) - 1)
+        )
+        # ``BMFace.calc_area()`` usa el área de Newell, también en caras no planas.
+        newell = [0.0, 0.0, 0.0]
+        for i in range(len(points)):
+            term = cross3(points[i], points[(i + 1) % len(points)])
+            newell = [total + value for total, value in zip(newell, term)]
+        area = norm(newell) * 0.5
+        totals["uv_area"] += uv_area
+        if area > 1e-12 and uv_area > 0.0:
+            totals["uv_mapped_area"] += uv_area
+            totals["surface_mapped_area"] += area
+        scale = math.sqrt(area) / math.sqrt(uv_area) if uv_area > 1e-8 else 1.0
+        stretches = []
+        for i in range(len(points)):
+            j = (i + 1) % len(points)
+            length = norm(sub(points[i], points[j]))
+            if length <= 1e-5:
+                continue
+            stretches.append(abs(norm(sub(face_uvs[i], face_uvs[j])) * scale / length - 1.0))
+        if stretches:
+            totals["uv_stretch_sum"] += sum(stretches) / len(stretches)
+            totals["uv_stretch_faces"] += 1
+    return totals
+
+
+def _flat_polygons(polygons):
+    loop_verts = [v for verts, _ in polygons for v in verts]
+    loop_uvs = [uv for _, face_uvs in polygons for uv in face_uvs]
+    loop_total = [len(verts) for verts, _ in polygons]
+    loop_start = [sum(loop_total[:index]) for index in range(len(loop_total))]
+    return loop_verts, loop_uvs, loop_start, loop_total
+
+
+def test_uv_surface_totals_match_the_per_face_definition(logger):
+    coords = [
+        (0.0, 0.0, 0.0), (2.0, 0.0, 0.0), (2.0, 1.0, 0.0), (0.0, 1.0, 0.0),
+        (3.0, 0.5, 0.0), (1.0, 0.5, 1.5), (1.0, 0.5, 1.5 + 1e-7),
+    ]
+    polygons = [
+        ((0, 1, 2, 3), ((0.0, 0.0), (0.5, 0.0), (0.5, 0.5), (0.0, 0.5))),
+        ((1, 4, 2), ((0.5, 0.0), (0.9, 0.2), (0.5, 0.5))),
+        ((0, 1, 4, 2, 5), ((0.0, 0.0), (0.2, 0.0), (0.4, 0.1), (0.2, 0.3), (0.0, 0.2))),
+        ((3, 5, 6), ((0.1, 0.1), (0.1, 0.1), (0.1, 0.1))),
+        ((0, 3, 5), ((0.0, 0.0), (0.0, 0.9), (0.3, 0.4))),
+    ]
+    loop_verts, loop_uvs, loop_start, loop_total = _flat_polygons(polygons)
+
+    totals = logger.uv_surface_totals(loop_verts, loop_uvs, coords, loop_start, loop_total)
+    expected = _reference_uv_totals(polygons, coords)
+
+    assert totals["uv_stretch_faces"] == expected["uv_stretch_faces"]
+    for key in ("uv_area", "uv_mapped_area", "surface_mapped_area", "uv_stretch_sum"):
+        assert totals[key] == pytest.approx(expected[key], rel=1e-9, abs=1e-12), key
+
+
+def test_uv_surface_totals_without_uv_layer_are_zero(logger):
+    totals = logger.uv_surface_totals([0, 1, 2], None, [(0, 0, 0), (1, 0, 0), (0, 1, 0)], [0], [3])
+
+    assert totals["uv_area"] == 0.0
+    assert totals["uv_stretch_faces"] == 0
+
+
+def _brute_force_duplicates(points, dist):
+    parent = list(range(len(points)))
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    for i, a in enumerate(points):
+        for j in range(i + 1, len(points)):
+            if sum((x - y) ** 2 for x, y in zip(a, points[j])) <= dist * dist:
+                parent[find(i)] = find(j)
+    return len(points) - len({find(i) for i in range(len(points))})
+
+
+def test_count_duplicate_vertices_matches_brute_force(logger):
+    rng = np.random.default_rng(7)
+    centres = rng.uniform(-1.0, 1.0, size=(60, 3))
+    jitter = rng.uniform(-4e-5, 4e-5, size=(180, 3))
+    points = np.vstack([centres, centres + jitter[:60], centres[:30] + jitter[60:90] * 3.0])
+
+    expected = _brute_force_duplicates(points.tolist(), 1e-4)
+
+    assert expected > 0
+    assert logger.count_duplicate_vertices(points) == expected
+
+
+def test_count_duplicate_vertices_returns_clusters_across_cells(logger):
+    # Los dos primeros vértices caen en celdas distintas pero están a 5e-5.
+    points = [(0.99999e-4, 0.0, 0.0), (1.49999e-4, 0.0, 0.0), (5.0, 5.0, 5.0),
+              (5.0, 5.0, 5.00005), (5.0, 5.0, 5.0001), (9.0, 0.0, 0.0)]
+
+    duplicates, clusters = logger.count_duplicate_vertices(points, return_clusters=True)
+
+    assert duplicates == 3
+    assert sorted(sorted(cluster.tolist()) for cluster in clusters) == [[0, 1], [2, 3, 4]]
+    assert logger.count_duplicate_vertices(points[:1]) == 0
+
+
+def test_count_duplicate_vertices_dense_groups_match_brute_force(logger):
+    # Nubes de unas pocas veces la distancia de fusión: muchos vértices por celda.
+    rng = np.random.default_rng(11)
+    for scale in (1e-4, 3e-4, 1e-3):
+        points = rng.uniform(0.0, scale, size=(400, 3))
+        points = np.vstack([points, points[:40]])
+
+        assert logger.count_duplicate_vertices(points) == _brute_force_duplicates(points.tolist(), 1e-4)
+
+
+def test_count_duplicate_vertices_collapsed_geometry_is_fast(logger):
+    # Regresión: pares por celda crecían como k² y agotaban la memoria en save_pre.
+    coincident = np.zeros((50_000, 3))
+    dense = np.random.default_rng(3).uniform(0.0, 3e-4, size=(20_000, 3))
+
+    started = time.perf_counter()
+    duplicates, clusters = logger.count_duplicate_vertices(coincident, return_clusters=True)
+    assert logger.count_duplicate_vertices(dense) == 19_999
+    elapsed = time.perf_counter() - started
+
+    assert duplicates == 49_999 and len(clusters) == 1
+    assert elapsed < 10.0
+
+
+_CUBE_COORDS = [
+    (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+    (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),
+]
+# Caras con normales hacia fuera (orden antihorario visto desde fuera).
+_CUBE_FACES = [
+    (0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4),
+    (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7),
+]
+
+
+def _flat_faces(faces, vertex_offset=0):
+    loop_verts = [v + vertex_offset for face in faces for v in face]
+    loop_total = [len(face) for face in faces]
+    loop_start = [sum(loop_total[:index]) for index in range(len(loop_total))]
+    return loop_verts, loop_start, loop_total
+
+
+def _flipped(logger, coords, faces):
+    loop_verts, loop_start, loop_total = _flat_faces(faces)
+    return logger.flipped_face_count(coords, loop_verts, loop_start, loop_total)
+
+
+def test_flipped_face_count_on_consistent_and_inverted_cubes(logger):
+    inverted = [tuple(reversed(face)) for face in _CUBE_FACES]
+
+    assert _flipped(logger, _CUBE_COORDS, _CUBE_FACES) == 0
+    assert _flipped(logger, _CUBE_COORDS, inverted) == 6
+
+
+def test_flipped_face_count_finds_single_reversed_faces(logger):
+    one_reversed = list(_CUBE_FACES)
+    one_reversed[3] = tuple(reversed(one_reversed[3]))
+    # Cinco caras invertidas: lo mayoritario no decide, manda la orientación exterior.
+    five_reversed = [tuple(reversed(face)) for face in _CUBE_FACES]
+    five_reversed[0] = _CUBE_FACES[0]
+
+    assert _flipped(logger, _CUBE_COORDS, one_reversed) == 1
+    assert _flipped(logger, _CUBE_COORDS, five_reversed) == 5
+
+
+def test_flipped_face_count_treats_components_independently(logger):
+    shifted = [(x + 10, y, z) for x, y, z in _CUBE_COORDS]
+    faces = list(_CUBE_FACES) + [tuple(v + 8 for v in reversed(face)) for face in _CUBE_FACES]
+
+    assert _flipped(logger, _CUBE_COORDS + shifted, faces) == 6
+    assert logger.flipped_face_count([], [], [], []) == 0
+
+
+def test_mesh_metric_partials_computes_every_total_in_one_pass(logger):
+    loop_verts, loop_start, loop_total = _flat_faces(_CUBE_FACES)
+    uvs = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)] * 6
+    mesh = logger.MeshArrays(_CUBE_COORDS, loop_verts, loop_start, loop_total, uvs)
+    timings = {}
+
+    partial = logger.mesh_metric_partials(mesh, timings)
+
+    assert set(partial) == set(logger.MESH_METRIC_PARTIAL_KEYS) | {"skipped_stages"}
+    assert partial["skipped_stages"] == []
+    assert (partial["faces"], partial["verts"], partial["components"]) == (6, 8, 1)
+    assert (partial["non_quad_faces"], partial["duplicate_verts"], partial["flipped_faces"]) == (0, 0, 0)
+    assert partial["angle_count"] == 12
+    assert partial["angle_sum"] == pytest.approx(12 * 90.0)
+    assert partial["uv_area"] == pytest.approx(6.0)
+    assert partial["surface_mapped_area"] == pytest.approx(24.0)
+    assert set(timings) == set(logger.MESH_METRIC_STAGES) - {"extract"}
+
+
+def _wavy_grid(side, seed=3):
+    """Rejilla de quads con relieve y UV ruidosas, construida con numpy."""
+    rng = np.random.default_rng(seed)
+    x, y = np.meshgrid(np.arange(side + 1, dtype=np.float64), np.arange(side + 1, dtype=np.float64))
+    z = np.sin(x * 0.3) * np.cos(y * 0.2) + rng.normal(0.0, 0.2, x.shape)
+    coords = np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+    column, row = np.meshgrid(np.arange(side), np.arange(side))
+    base = (row * (side + 1) + column).ravel()
+    loop_verts = np.column_stack([base, base + 1, base + side + 2, base + side + 1]).ravel()
+    uvs = coords[loop_verts, :2] / side + rng.normal(0.0, 0.05 / side, (loop_verts.size, 2))
+    loop_total = np.full(side * side, 4)
+    return coords, loop_verts, np.arange(side * side) * 4, loop_total, uvs
+
+
+def test_sampled_partials_estimate_stretch_and_angle_within_interval(logger):
+    grid = _wavy_grid(300)
+    exact_partial = logger.mesh_metric_partials(logger.MeshArrays(*grid))
+    sampled_partial = logger.mesh_metric_partials(logger.MeshArrays(*grid), sample_fraction=0.05, seed=7)
+
+    exact = logger.finalize_mesh_metrics(logger.merge_mesh_metric_partials([exact_partial]))
+    sampled = logger.finalize_mesh_metrics(logger.merge_mesh_metric_partials([sampled_partial]))
+
+    assert exact["Sampled"] is False
+    assert (exact["UV_stretch_ci"], exact["Angle_ci"]) == (0.0, 0.0)
+    assert sampled["Sampled"] is True
+    assert 0.04 * 90_000 <= sampled_partial["sampled_faces"] <= 0.06 * 90_000
+    assert 0.0 < sampled["UV_stretch_ci"] and abs(sampled["UV_stretch"] - exact["UV_stretch"]) <= sampled["UV_stretch_ci"]
+    assert 0.0 < sampled["Angle_ci"] and abs(sampled["Angle"] - exact["Angle"]) <= sampled["Angle_ci"]
+    for key in ("N_faces", "N_meshes", "UV_islands", "UV_area", "UV_textel_density",
+                "Non_quads_percentage", "Vertex_duplicate", "Normal_percentage"):
+        assert sampled[key] == exact[key], key
+
+
+def test_plan_samples_then_skips_stages_to_fit_the_budget(logger, monkeypatch):
+    assert logger.plan_mesh_metrics(10_000_000) == (1.0, ())
+    # Un microsegundo por cara y etapa: 6 s fijos y 2 s muestreables por millón de caras.
+    monkeypatch.setattr(logger, "_stage_face_seconds", {stage: 1e-6 for stage in logger.MESH_METRIC_STAGES})
+
+    assert logger.plan_mesh_metrics(100_000, budget=0.01) == (1.0, ())
+    assert logger.plan_mesh_metrics(1_000_000, budget=9.0) == (1.0, ())
+    assert logger.plan_mesh_metrics(1_000_000, budget=7.0) == (0.5, ())
+    assert logger.plan_mesh_metrics(1_000_000, budget=6.3) == (0.125, ())
+    assert logger.plan_mesh_metrics(1_000_000, budget=7.0, spent=1.0) == (0.5, ("duplicates",))
+    assert logger.plan_mesh_metrics(1_000_000, budget=0.5) == (
+        logger.SAMPLING_MIN_FRACTION, logger.MESH_METRIC_SKIPPABLE_STAGES,
+    )
+
+
+def test_skipped_stages_are_not_run_and_their_metrics_are_blank(logger):
+    grid = _wavy_grid(40)
+    exact = logger.finalize_mesh_metrics(
+        logger.merge_mesh_metric_partials([logger.mesh_metric_partials(logger.MeshArrays(*grid))])
+    )
+    timings = {}
+    partial = logger.mesh_metric_partials(
+        logger.MeshArrays(*grid), timings, skip=("duplicates", "normals", "components", "angles"),
+    )
+    skipped = logger.finalize_mesh_metrics(logger.merge_mesh_metric_partials([partial, _partial(logger)]))
+
+    assert set(timings) == {"uv_islands", "uv_surface"}
+    assert skipped["Skipped_stages"] == "angles;components;duplicates;normals"
+    assert exact["Skipped_stages"] == ""
+    for key in ("Vertex_duplicate", "Vertex_duplicate_percentage", "Normal_percentage",
+                "N_meshes", "Face_by_mesh", "Angle", "Angle_ci"):
+        assert skipped[key] is None, key
+    for key in ("N_faces", "UV_islands", "UV_area", "UV_stretch", "Non_quads_percentage"):
+        assert skipped[key] == exact[key], key
+
+
+def test_estimates_are_cached_under_their_plan(scene_metrics, monkeypatch):
+    logger, measured = scene_metrics
+    monkeypatch.setattr(logger.bpy.context.scene, "objects", [
+        _fake_scene_object("Cube", _fake_evaluated_mesh()),
+    ])
+    monkeypatch.setattr(logger, "plan_mesh_metrics", lambda faces, spent=0.0: (0.5, ("duplicates",)))
+
+    first = logger.calculate_scene_mesh_metrics()
+    second = logger.calculate_scene_mesh_metrics()
+    (key,) = logger.load_mesh_metrics_cache()
+
+    assert (first["Cache_misses"], second["Cache_hits"]) == (1, 1)
+    assert key.endswith("|0.5|duplicates")
+    assert second["Skipped_stages"] == "duplicates" and second["Vertex_duplicate"] is None
+    assert second["Metrics_seconds"] >= 0.0
+
+    # Una estimación nunca se reutiliza como resultado exacto.
+    monkeypatch.setattr(logger, "plan_mesh_metrics", lambda faces, spent=0.0: (1.0, ()))
+    exact = logger.calculate_scene_mesh_metrics()
+
+    assert (exact["Cache_hits"], exact["Cache_misses"]) == (0, 1)
+    assert len(measured) == 2
+    assert exact["Skipped_stages"] == ""
+
+
+def test_face_components_returns_labels_and_face_counts(logger):
+    shifted = [(x + 10, y, z) for x, y, z in _CUBE_COORDS]
+    # Un triángulo que solo toca el segundo cubo en un vértice es otra pieza.
+    faces = list(_CUBE_FACES) + [tuple(v + 8 for v in face) for face in _CUBE_FACES] + [(14, 16, 17)]
+    coords = _CUBE_COORDS + shifted + [(12.0, 2.0, 2.0), (13.0, 2.0, 2.0)]
+    loop_verts, loop_start, loop_total = _flat_faces(faces)
+
+    labels, face_counts = logger.MeshArrays(coords, loop_verts, loop_start, loop_total).face_components()
+
+    assert sorted(face_counts.tolist()) == [1, 6, 6]
+    assert len(set(labels[:6].tolist())) == 1
+    assert labels[0] != labels[6] != labels[12]
+
+
+def test_face_components_of_empty_mesh(logger):
+    labels, face_counts = logger.MeshArrays([], [], [], []).face_components()
+
+    assert labels.size == 0
+    assert face_counts.size == 0
+
+
+def test_logger_dihedral_statistics_match_core_kernel(logger):
+    kernels = load_project_module("mesh_kernels", "mesh_kernels.py", preferred_roots=("core",))
+    rng = np.random.default_rng(3)
+    coords = [tuple(c + rng.uniform(-0.3, 0.3, 3)) for c in _CUBE_COORDS]
+    loop_verts, loop_start, loop_total = _flat_faces(_CUBE_FACES)
+    mesh = logger.MeshArrays(coords, loop_verts, loop_start, loop_total)
+    _, _, face_a, face_b, _ = mesh.edge_adjacency()
+
+    ours = logger.dihedral_angle_statistics(mesh.normals, face_a, face_b)
+    theirs = kernels.mesh_dihedral_statistics(coords, loop_verts, loop_start, loop_total)
+
+    assert ours["count"] == theirs.count == 12
+    assert ours["mean"] == pytest.approx(theirs.mean)
+    assert ours["median"] == pytest.approx(theirs.median)
+    assert ours["histogram"] == theirs.histogram
+
+
+def _metrics_rows(logger):
+    content = logger.bpy.data.texts[logger.MESH_METRICS_CSV_TEXTBLOCK].as_string()
+    return list(csv.DictReader(io.StringIO(content)))
+
+
+def test_synchronous_save_stamps_rows_with_save_id(scene_metrics, monkeypatch, tmp_path):
+    logger, _ = scene_metrics
+    monkeypatch.setattr(logger, "TEMP_MESH_METRICS_CSV_PATH", str(tmp_path / "metrics.csv"))
+    monkeypatch.setattr(logger.bpy.context.scene, "objects", [
+        _fake_scene_object("Cube", _fake_evaluated_mesh()),
+    ])
+
+    payload = logger.save_scene_mesh_metrics()
+    rows = _metrics_rows(logger)
+
+    assert len(rows) == 1
+    assert rows[0]["SaveID"] == payload["save_id"]
+    assert rows[0]["N_faces"] == "1"
+    assert (tmp_path / "metrics.csv").read_text(encoding="utf-8").startswith("SavedAtUnix,SaveID,")
+
+
+def test_asynchronous_save_commits_rows_from_timer_or_next_save(scene_metrics, monkeypatch, tmp_path):
+    logger, _ = scene_metrics
+    timers = []
+    monkeypatch.setattr(logger, "ASYNC_MESH_METRICS", True)
+    monkeypatch.setattr(logger, "TEMP_MESH_METRICS_CSV_PATH", str(tmp_path / "metrics.csv"))
+    monkeypatch.setattr(logger.bpy.app.timers, "register",
+                        lambda fn, first_interval=None: timers.append(fn), raising=False)
+    monkeypatch.setattr(logger.bpy.context.scene, "objects", [
+        _fake_scene_object("Cube", _fake_evaluated_mesh()),
+    ])
+
+    assert logger.save_scene_mesh_metrics() is None
+    assert logger.MESH_METRICS_CSV_TEXTBLOCK not in logger.bpy.data.texts
+    first_id = logger._mesh_metrics_job["save_id"]
+    logger._mesh_metrics_job["thread"].join()
+
+    assert timers[0]() is None
+    assert _metrics_rows(logger)[0]["SaveID"] == first_id
+
+    logger.save_scene_mesh_metrics()
+    second_id = logger._mesh_metrics_job["save_id"]
+    payload = logger.finish_pending_mesh_metrics()
+
+    assert payload["save_id"] == second_id != first_id
+    assert _metrics_rows(logger)[0]["Cache_hits"] == "1"
+    assert logger._mesh_metrics_job is None
+
+
+def test_pending_rows_of_a_closed_file_reach_the_temporary_history(scene_metrics, monkeypatch, tmp_path):
+    logger, _ = scene_metrics
+    history = load_project_module("mesh_metrics_history", "mesh_metrics_history.py", preferred_roots=("core",))
+    monkeypatch.setattr(logger, "ASYNC_MESH_METRICS", True)
+    monkeypatch.setattr(logger.bpy.app.timers, "register", lambda fn, first_interval=None: None, raising=False)
+    monkeypatch.setattr(logger.bpy.context.scene, "objects", [
+        _fake_scene_object("Cube", _fake_evaluated_mesh()),
+    ])
+
+    logger.save_scene_mesh_metrics()
+    save_id = logger._mesh_metrics_job["save_id"]
+    # Se abre otro archivo antes de que el temporizador incruste las filas.
+    monkeypatch.setattr(logger.bpy.data, "filepath", "/tmp/next_scene.blend")
+    logger.discard_pending_mesh_metrics()
+
+    rows = history.load_mesh_metrics_history(tmp_path / "history.csv")
+    assert [(row["SaveID"], row["N_faces"]) for row in rows] == [(save_id, "1")]
+    assert rows[0]["BlendFile"] == logger.blend_file_tag("/tmp/test_scene.blend")
+    assert logger.MESH_METRICS_HISTORY_TEXTBLOCK not in logger.bpy.data.texts
+    assert logger._mesh_metrics_job is None
+
+
+def test_save_still_measures_when_the_pending_job_cannot_be_embedded(scene_metrics, monkeypatch):
+    logger, _ = scene_metrics
+    saves = []
+    monkeypatch.setattr(logger, "ENABLE_CONSENT_FLOW", True)
+    monkeypatch.setattr(logger, "has_accepted_consent", lambda: False)
+    monkeypatch.setattr(logger, "save_scene_mesh_metrics", lambda: saves.append(True))
+
+    def broken():
+        raise OSError("disk full")
+
+    monkeypatch.setattr(logger, "finish_pending_mesh_metrics", broken)
+
+    logger.handle_save(None)
+
+    assert saves == [True]
+    assert logger._WARNINGS[-1].endswith("Could not embed asynchronous mesh metrics: OSError: disk full")
+
+
+def test_history_appends_one_row_per_save_and_seals_chunks(scene_metrics, monkeypatch, tmp_path):
+    logger, _ = scene_metrics
+    history = load_project_module("mesh_metrics_history", "mesh_metrics_history.py", preferred_roots=("core",))
+    monkeypatch.setattr(logger, "TEMP_MESH_METRICS_CSV_PATH", str(tmp_path / "metrics.csv"))
+    monkeypatch.setattr(logger, "MESH_METRICS_HISTORY_CHUNK_ROWS", 3)
+    monkeypatch.setattr(logger.bpy.context.scene, "objects", [
+        _fake_scene_object("Cube", _fake_evaluated_mesh()),
+    ])
+
+    save_ids = [logger.save_scene_mesh_metrics()["save_id"] for _ in range(7)]
+
+    text = logger.bpy.data.texts[logger.MESH_METRICS_HISTORY_TEXTBLOCK].as_string()
+    payload = json.loads(text)
+    rows = history.parse_mesh_metrics_history(text)
+    assert [chunk["rows"] for chunk in payload["chunks"]] == [3, 3]
+    assert payload["tail_rows"] == 1
+    assert [row["SaveID"] for row in rows] == save_ids
+    assert set(history.history_by_session(rows)) == {logger.SESSION_ID}
+    assert rows[0]["N_faces"] == "1"
+    assert len(_metrics_rows(logger)) == 1
+    assert history.load_mesh_metrics_history(tmp_path / "history.csv") == rows
+
+
+def test_temporary_history_is_sealed_on_header_change_and_tagged_by_blend(scene_metrics, monkeypatch, tmp_path):
+    logger, _ = scene_metrics
+    history = load_project_module("mesh_metrics_history", "mesh_metrics_history.py", preferred_roots=("core",))
+    monkeypatch.setattr(logger, "TEMP_MESH_METRICS_CSV_PATH", str(tmp_path / "metrics.csv"))
+    (tmp_path / "history.csv").write_text("SessionID,SaveID\nold,1\n", encoding="utf-8")
+
+    logger.write_mesh_metrics_csv(logger._scene_metrics_objects({"N_faces": 1}), 1.0, "first")
+    monkeypatch.setattr(logger.bpy.data, "filepath", "/home/student/other_scene.blend")
+    logger.write_mesh_metrics_csv(logger._scene_metrics_objects({"N_faces": 2}), 2.0, "second")
+
+    assert history.load_mesh_metrics_history(tmp_path / "history.1.csv.gz") == [{"SessionID": "old", "SaveID": "1"}]
+    rows = history.load_mesh_metrics_history(tmp_path / "history.csv")
+    assert list(rows[0]) == logger.MESH_METRICS_HISTORY_FIELDS
+    assert "student" not in (tmp_path / "history.csv").read_text(encoding="utf-8")
+    by_blend = history.history_by_blend(rows)
+    assert [row["SaveID"] for row in by_blend[logger.blend_file_tag("/tmp/test_scene.blend")]] == ["first"]
+    assert [row["SaveID"] for row in by_blend[logger.blend_file_tag("/home/student/other_scene.blend")]] == ["second"]
+    assert len(by_blend) == 2 and "" not in by_blend
+
+
+def test_temporary_history_is_sealed_when_it_grows(scene_metrics, monkeypatch, tmp_path):
+    logger, _ = scene_metrics
+    history = load_project_module("mesh_metrics_history", "mesh_metrics_history.py", preferred_roots=("core",))
+    monkeypatch.setattr(logger, "TEMP_MESH_METRICS_CSV_PATH", str(tmp_path / "metrics.csv"))
+    monkeypatch.setattr(logger, "TEMP_CSV_PATH", str(tmp_path / "log.csv"))
+    monkeypatch.setattr(logger, "MESH_METRICS_HISTORY_TEMP_MAX_BYTES", 1)
+
+    for save in ("first", "second", "third"):
+        logger.write_mesh_metrics_csv(logger._scene_metrics_objects({"N_faces": 1}), 1.0, save)
+
+    sealed = [history.load_mesh_metrics_history(tmp_path / f"history.{number}.csv.gz") for number in (1, 2)]
+    assert [rows[0]["SaveID"] for rows in sealed] == ["first", "second"]
+    assert [row["SaveID"] for row in history.load_mesh_metrics_history(tmp_path / "history.csv")] == ["third"]
+
+    logger.clear_logged_data()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["history.salt", "metrics.csv"]
+
+
+def test_clear_logged_data_removes_the_mesh_metrics_history(scene_metrics, monkeypatch, tmp_path):
+    logger, _ = scene_metrics
+    monkeypatch.setattr(logger, "TEMP_MESH_METRICS_CSV_PATH", str(tmp_path / "metrics.csv"))
+    monkeypatch.setattr(logger, "TEMP_CSV_PATH", str(tmp_path / "log.csv"))
+    logger.write_mesh_metrics_csv(logger._scene_metrics_objects({"N_faces": 1}), 1.0, "save")
+
+    logger.clear_logged_data()
+
+    assert logger.MESH_METRICS_HISTORY_TEXTBLOCK not in logger.bpy.data.texts
+    assert not (tmp_path / "history.csv").exists()
+
+
+def test_history_is_not_overwritten_when_unreadable(scene_metrics, monkeypatch, tmp_path):
+    logger, _ = scene_metrics
+    monkeypatch.setattr(logger, "TEMP_MESH_METRICS_CSV_PATH", str(tmp_path / "metrics.csv"))
+    logger.get_or_create_textblock(logger.MESH_METRICS_HISTORY_TEXTBLOCK).write("{broken")
+
+    logger.write_mesh_metrics_csv(logger._scene_metrics_objects({"N_faces": 1}), 1.0, "save")
+
+    assert logger.bpy.data.texts[logger.MESH_METRICS_HISTORY_TEXTBLOCK].as_string() == "{broken"
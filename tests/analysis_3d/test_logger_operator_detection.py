@@ -2,6 +2,8 @@
 # Copyright (C) 2026 María Molina Goyena
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import types
+
 import pytest
 
 from ._logger_test_utils import load_logger_module
@@ -82,3 +84,150 @@ def test_detect_uv_marks_pending_without_forcing_log(clean_logger_state):
         "alt_d": 0,
         "merge": 0,
     }
+
+
+def test_classify_operator_compiles_rules_once_per_name(clean_logger_state):
+    first = clean_logger_state.classify_operator("MESH_OT_duplicate_move")
+    second = clean_logger_state.classify_operator("MESH_OT_duplicate_move")
+
+    assert first is second
+    assert first[0] == "mesh.duplicate_move"
+    assert first[1] == clean_logger_state.OP_CATEGORY_SHIFT_D
+
+
+def test_classify_operator_matches_uv_prefix_and_transform_set(clean_logger_state):
+    _, uv_mask = clean_logger_state.classify_operator("UV_OT_select_all")
+    _, transform_mask = clean_logger_state.classify_operator("TRANSFORM_OT_translate")
+
+    assert uv_mask == clean_logger_state.OP_CATEGORY_UV
+    assert transform_mask == clean_logger_state.OP_CATEGORY_UV_TRANSFORM
+
+
+def test_process_new_operators_probes_uv_editor_once_per_batch(
+    clean_logger_state, monkeypatch
+):
+    logger = clean_logger_state
+    probes = []
+    operators = [
+        types.SimpleNamespace(bl_idname="TRANSFORM_OT_translate")
+        for _ in range(20)
+    ]
+    monkeypatch.setattr(
+        logger.bpy,
+        "context",
+        types.SimpleNamespace(
+            window_manager=types.SimpleNamespace(operators=operators),
+            edit_object=None,
+            object=None,
+        ),
+        raising=False,
+    )
+    monkeypatch.setattr(logger, "_last_operator_tail", (), raising=False)
+    monkeypatch.setattr(
+        logger, "is_uv_editor_open", lambda: probes.append(1) or False
+    )
+
+    logger.process_new_operators()
+
+    assert len(probes) == 1
+
+
+class _FakeOperator:
+    def __init__(self, pointer, bl_idname):
+        self._pointer = pointer
+        self.bl_idname = bl_idname
+
+    def as_pointer(self):
+        return self._pointer
+
+
+class _RingHistory:
+    """Historial acotado como ``wm.operators``: descarta el más antiguo."""
+
+    def __init__(self, size):
+        self.size = size
+        self.items = []
+        self._next_pointer = 1000
+
+    def push(self, bl_idname):
+        self.items.append(_FakeOperator(self._next_pointer, bl_idname))
+        self._next_pointer += 8
+        del self.items[:-self.size]
+
+
+@pytest.fixture
+def ring_history(clean_logger_state, monkeypatch):
+    logger = clean_logger_state
+    history = _RingHistory(size=32)
+    seen = []
+    monkeypatch.setattr(
+        logger.bpy,
+        "context",
+        types.SimpleNamespace(
+            window_manager=types.SimpleNamespace(operators=history.items),
+            edit_object=None,
+            object=None,
+        ),
+        raising=False,
+    )
+    monkeypatch.setattr(logger, "_last_operator_tail", (), raising=False)
+    monkeypatch.setattr(
+        logger,
+        "detect_flags_from_operator",
+        lambda bl_id, uv_editor_open=None: seen.append(bl_id) or False,
+    )
+    return logger, history, seen
+
+
+def test_saturated_history_keeps_reporting_new_operators(ring_history):
+    logger, history, seen = ring_history
+    for index in range(history.size):
+        history.push(f"OLD_OT_{index}")
+    logger.process_new_operators()
+    seen.clear()
+
+    # El historial está lleno: cada operador nuevo expulsa al más antiguo y la
+    # longitud no cambia, pero ningún operador debe perderse.
+    for tick in range(50):
+        batch = [f"MESH_OT_op_{tick}_{i}" for i in range(tick % 7 + 1)]
+        for name in batch:
+            history.push(name)
+        logger.process_new_operators()
+        assert len(history.items) == history.size
+        assert seen[-len(batch):] == batch
+
+    assert len(seen) == sum(tick % 7 + 1 for tick in range(50))
+
+
+def test_burst_larger_than_history_processes_every_visible_entry(ring_history):
+    logger, history, seen = ring_history
+    for index in range(history.size):
+        history.push(f"OLD_OT_{index}")
+    logger.process_new_operators()
+    seen.clear()
+
+    for index in range(history.size * 3):
+        history.push(f"MESH_OT_burst_{index}")
+    logger.process_new_operators()
+
+    assert seen == [op.bl_idname for op in history.items]
+
+
+def test_unchanged_history_reports_nothing(ring_history):
+    logger, history, seen = ring_history
+    for index in range(history.size):
+        history.push(f"OLD_OT_{index}")
+    logger.process_new_operators()
+    seen.clear()
+
+    assert logger.process_new_operators() is False
+    assert seen == []
+
+
+def test_find_new_operator_start_tolerates_evicted_tail_entries(clean_logger_state):
+    tail = (("a", "A"), ("b", "B"), ("c", "C"))
+    identities = [("c", "C"), ("d", "D"), ("e", "E")]
+
+    assert clean_logger_state.find_new_operator_start(identities, tail) == 1
+    assert clean_logger_state.find_new_operator_start(identities, ()) == 0
+    assert clean_logger_state.find_new_operator_start([("x", "X")], tail) == 0
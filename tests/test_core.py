@@ -65,3 +65,24 @@ def test_repeated_operator_not_changed_twice():
     state, second_changed = detect_flags_from_operator_name("MESH_OT_merge", state)
     assert first_changed is True
     assert second_changed is False
+
+
+classify_operator_name = core_module.classify_operator_name
+
+
+def test_classify_operator_name_builds_category_mask():
+    op, mask = classify_operator_name("OBJECT_OT_duplicate_move_linked")
+    assert op == "object.duplicate_move_linked"
+    assert mask & core_module.OP_CATEGORY_ALT_D
+    assert not mask & core_module.OP_CATEGORY_SHIFT_D
+
+
+def test_classify_operator_name_is_memoized():
+    first = classify_operator_name("MESH_OT_remove_doubles")
+    second = classify_operator_name("MESH_OT_remove_doubles")
+    assert first is second
+    assert first[1] == core_module.OP_CATEGORY_MERGE
+
+
+def test_classify_unrelated_operator_has_no_category():
+    assert classify_operator_name("TRANSFORM_OT_translate")[1] == 0
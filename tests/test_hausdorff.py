@@ -0,0 +1,86 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import math
+import time
+
+import numpy as np
+import pytest
+
+from core import hausdorff
+from core.hausdorff import directed_hausdorff, hausdorff_distance
+
+
+def _brute_force(first, second):
+    distances = np.linalg.norm(first[:, None, :] - second[None, :, :], axis=2)
+    return max(distances.min(axis=1).max(), distances.min(axis=0).max())
+
+
+def _cases():
+    rng = np.random.default_rng(7)
+    near = rng.random((800, 3))
+    yield near, near + rng.normal(0.0, 0.01, near.shape)
+    flat_a, flat_b = rng.random((500, 3)), rng.random((700, 3))
+    flat_a[:, 2] = flat_b[:, 2] = 0.0
+    yield flat_a, flat_b
+    yield rng.random((600, 3)), rng.random((400, 3)) + [50.0, 0.0, 0.0]
+    yield rng.random((600, 3)), np.vstack([rng.random((400, 3)), [[5.0, 5.0, 5.0]]])
+    yield rng.random((300, 3)) * 1e-3 + 1e6, rng.random((300, 3)) * 1e-3 + 1e6
+    yield np.repeat(rng.random((3, 3)), 100, axis=0), rng.random((50, 3))
+
+
+@pytest.mark.parametrize("first, second", list(_cases()))
+def test_matches_brute_force(first, second):
+    assert hausdorff_distance(first, second) == pytest.approx(_brute_force(first, second), rel=1e-12)
+
+
+def test_brute_force_fallback_is_exact(monkeypatch):
+    # Sin anillos, todas las consultas pasan por la búsqueda con salida temprana.
+    monkeypatch.setattr(hausdorff, "RING_LIMIT", 0)
+    monkeypatch.setattr(hausdorff, "BRUTE_TARGET_BLOCK", 64)
+    rng = np.random.default_rng(11)
+    first, second = rng.random((700, 3)), rng.random((900, 3)) * 2.0
+
+    assert hausdorff_distance(first, second) == pytest.approx(_brute_force(first, second), rel=1e-12)
+
+
+@pytest.mark.parametrize("first, second", list(_cases()))
+def test_tree_path_matches_brute_force(monkeypatch, first, second):
+    # Toda nube se trata como sobrecargada y el frente se parte enseguida.
+    monkeypatch.setattr(hausdorff, "CELL_OVERLOAD", 0)
+    monkeypatch.setattr(hausdorff, "FRONTIER_LIMIT", 64)
+
+    assert hausdorff_distance(first, second) == pytest.approx(_brute_force(first, second), rel=1e-12)
+
+
+def _clustered(rng, count):
+    # Casi toda la nube en una celda diminuta y unos pocos puntos muy lejos.
+    return np.vstack([rng.random((count, 3)) * 0.01, rng.random((50, 3)) * 100.0])
+
+
+def test_clustered_input_is_exact_and_bounded():
+    rng = np.random.default_rng(5)
+    first, second = _clustered(rng, 2_000), _clustered(rng, 2_000)
+    assert hausdorff_distance(first, second) == pytest.approx(_brute_force(first, second), rel=1e-12)
+
+    first, second = _clustered(rng, 20_000), _clustered(rng, 20_000)
+    start = time.perf_counter()
+    hausdorff_distance(first, second)
+    assert time.perf_counter() - start < 10.0
+
+
+def test_known_distances_and_vector_like_input():
+    triangle = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)]
+    assert hausdorff_distance(triangle, list(reversed(triangle))) == 0.0
+
+    segment = [(x / 10, 0.0, 0.0) for x in range(11)]
+    shifted = [(x, 1.0, 0.0) for x, _, _ in segment]
+    assert hausdorff_distance(segment, shifted) == pytest.approx(1.0)
+    assert directed_hausdorff(segment[:1], segment) == 0.0
+
+
+def test_empty_sets():
+    assert hausdorff_distance([], []) == 0.0
+    assert directed_hausdorff([], [(0.0, 0.0, 0.0)]) == 0.0
+    assert math.isinf(hausdorff_distance([(0.0, 0.0, 0.0)], []))
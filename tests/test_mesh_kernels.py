@@ -0,0 +1,63 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pytest
+
+from tests._project_loader import load_project_module
+
+kernels = load_project_module(
+    "mesh_kernels",
+    "mesh_kernels.py",
+    preferred_roots=("core",),
+)
+
+CUBE_COORDS = [
+    (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+    (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),
+]
+CUBE_FACES = [
+    (0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4),
+    (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7),
+]
+
+
+def flat(faces):
+    loop_verts = [v for face in faces for v in face]
+    loop_total = [len(face) for face in faces]
+    loop_start = [sum(loop_total[:i]) for i in range(len(loop_total))]
+    return loop_verts, loop_start, loop_total
+
+
+def test_cube_has_twelve_right_angles():
+    stats = kernels.mesh_dihedral_statistics(CUBE_COORDS, *flat(CUBE_FACES))
+
+    assert stats.count == 12
+    assert stats.mean == pytest.approx(90.0)
+    assert stats.median == pytest.approx(90.0)
+    assert stats.histogram[-1] == 12
+    assert sum(stats.histogram) == 12
+
+
+def test_folded_angles_share_mean_and_median():
+    # Dos caras con ángulo de 30 grados y dos aristas coplanarias.
+    coords = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 2, 0),
+              (1, 2, 0), (-1, 0.5, 0.57735027), (-1, -0.5, 0.57735027)]
+    faces = [(0, 1, 2, 3), (3, 2, 5, 4), (0, 3, 6, 7)]
+    stats = kernels.mesh_dihedral_statistics(coords, *flat(faces))
+
+    assert stats.count == 2
+    assert stats.total == pytest.approx(30.0, abs=1e-5)
+    assert stats.mean == pytest.approx(15.0, abs=1e-5)
+    assert stats.median == pytest.approx(15.0, abs=1e-5)
+    assert stats.histogram[0] == 1
+    assert stats.histogram[6] == 1
+
+
+def test_degenerate_faces_and_empty_input():
+    normals = [(0.0, 0.0, 1.0), (0.0, 0.0, 0.0)]
+
+    stats = kernels.dihedral_angle_statistics(normals, [0], [1])
+    assert stats.count == 0
+    assert stats.mean == 0.0
+    assert len(stats.bin_edges) == kernels.ANGLE_HISTOGRAM_BINS + 1
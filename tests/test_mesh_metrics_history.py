@@ -0,0 +1,46 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import base64
+import json
+import zlib
+
+import pytest
+
+from tests._project_loader import load_project_module
+
+history = load_project_module(
+    "mesh_metrics_history",
+    "mesh_metrics_history.py",
+    preferred_roots=("core",),
+)
+
+
+def _sealed(text):
+    return base64.b64encode(zlib.compress(text.encode("utf-8"))).decode("ascii")
+
+
+def test_chunks_keep_their_own_header():
+    payload = {
+        "format": 1,
+        "chunks": [{"rows": 1, "data": _sealed("SessionID,SaveID\na,1\n")}],
+        "tail": "SessionID,SaveID,Sampled\nb,2,False\n",
+        "tail_rows": 1,
+    }
+
+    rows = history.parse_mesh_metrics_history(json.dumps(payload))
+
+    assert rows == [
+        {"SessionID": "a", "SaveID": "1"},
+        {"SessionID": "b", "SaveID": "2", "Sampled": "False"},
+    ]
+    assert list(history.history_by_session(rows)) == ["a", "b"]
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps({"format": 99, "chunks": []}), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        history.load_mesh_metrics_history(path)
@@ -0,0 +1,101 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+from core.reference_library import ReferenceLibrary
+from core.surface_distance import fan_triangles, surface_similarity
+
+
+def _plane(size, height=0.0):
+    xs, ys = np.meshgrid(np.linspace(0.0, 1.0, size), np.linspace(0.0, 1.0, size))
+    vertices = np.column_stack([xs.ravel(), ys.ravel(), np.full(xs.size, height)])
+    index = np.arange(size * size).reshape(size, size)
+    quads = np.column_stack([index[:-1, :-1].ravel(), index[:-1, 1:].ravel(),
+                             index[1:, 1:].ravel(), index[1:, :-1].ravel()])
+    return vertices, fan_triangles(quads.tolist())
+
+
+def test_batched_similarities_match_single_comparisons():
+    library = ReferenceLibrary()
+    library.add("flat", *_plane(5))
+    library.add("raised", *_plane(8, height=0.2))
+    models = {"student-1": _plane(4, height=0.05), "student-2": _plane(6)}
+
+    results = library.similarities(models, samples=500)
+
+    assert set(results) == set(models)
+    for model, mesh in models.items():
+        assert results[model]["flat"]["Similarity"] == surface_similarity(*mesh, *_plane(5), samples=500)
+        assert results[model]["raised"]["Similarity"] == surface_similarity(
+            *mesh, *_plane(8, height=0.2), samples=500)
+    assert results["student-2"]["flat"]["Similarity"] == 100.0
+
+
+def test_cache_is_bounded_and_rebuilds_evicted_references():
+    library = ReferenceLibrary()
+    library.add("a", *_plane(10))
+    library.memory_limit = int(library.cached_bytes * 1.5)
+    library.add("b", *_plane(10, height=1.0))
+
+    assert library.stats["evictions"] == 1
+    assert library.cached_bytes <= library.memory_limit
+
+    library.index("b")
+    library.index("a")
+    assert library.stats["hits"] == 1
+    assert library.stats["builds"] == 3
+    assert library.index("a").distances([(0.5, 0.5, 2.0)]) == pytest.approx([2.0])
+
+
+def test_library_persists_between_sessions(tmp_path):
+    first = ReferenceLibrary(tmp_path)
+    digest = first.add("flat", *_plane(5))
+    first.add("copy", *_plane(5))
+    first.add("gone", *_plane(3, height=1.0))
+    first.remove("gone")
+    model = {"model": _plane(4, height=0.1)}
+    expected = first.similarities(model, samples=300)
+
+    second = ReferenceLibrary(tmp_path)
+    results = second.similarities(model, names=["flat"], samples=300)
+
+    assert sorted(second.references) == ["copy", "flat"]
+    assert second.references["copy"] == digest
+    assert second.stats == {"hits": 0, "loads": 1, "builds": 0, "evictions": 0}
+    assert isinstance(second.index("flat").lower, np.memmap)
+    assert results == {"model": {"flat": expected["model"]["flat"]}}
+
+
+def test_top_k_only_compares_the_closest_signatures(tmp_path):
+    library = ReferenceLibrary(tmp_path)
+    library.add("flat", *_plane(5))
+    library.add("raised", *_plane(3, height=0.2))
+    tilted, triangles = _plane(4)
+    tilted[:, 2] = tilted[:, 0]
+    library.add("tilted", tilted, triangles)
+    (tmp_path / library.references["flat"] / "signature.json").unlink()
+
+    reopened = ReferenceLibrary(tmp_path)
+    results = reopened.similarities({"model": _plane(6, height=0.1)}, samples=200, top_k=2)
+
+    assert sorted(results["model"]) == ["flat", "raised"]
+    assert results["model"]["flat"]["SignatureDistance"] < 0.1
+    assert (tmp_path / library.references["flat"] / "signature.json").exists()
+
+
+def test_signatures_are_read_once_for_every_model(monkeypatch):
+    library = ReferenceLibrary()
+    library.add("flat", *_plane(5))
+    library.add("raised", *_plane(3, height=0.2))
+    read = []
+    signature = library.signature
+    monkeypatch.setattr(library, "signature", lambda name: read.append(name) or signature(name))
+
+    models = {f"model-{index}": _plane(4, height=0.1 * index) for index in range(3)}
+    results = library.similarities(models, samples=100, top_k=1)
+
+    assert sorted(read) == ["flat", "raised"]
+    assert all(len(result) == 1 for result in results.values())
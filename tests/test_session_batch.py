@@ -0,0 +1,97 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import csv
+import os
+from pathlib import Path
+import threading
+
+import pytest
+
+# Importación normal del paquete: los procesos del pool deben poder
+# localizar ``summarise_session`` por su nombre de módulo.
+from core import session_batch
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "datos_analisis"
+pytestmark = pytest.mark.skipif(not DATA_DIR.is_dir(), reason="Sin datos de ejemplo.")
+_ANALYSE_SESSION = session_batch._analyse_session
+
+
+def _crash_on_missing(path, max_reasonable_speed, cache_dir):
+    """Sustituto de ``_analyse_session`` que mata su proceso con un archivo inexistente."""
+    if not Path(path).exists():
+        os._exit(1)
+    return _ANALYSE_SESSION(path, max_reasonable_speed, cache_dir)
+
+
+def test_process_pool_matches_sequential_run():
+    paths = session_batch.find_session_files(DATA_DIR)[:4]
+    reported = []
+
+    parallel = session_batch.run_batch(paths, workers=2, progress=lambda *args: reported.append(args))
+    sequential = session_batch.run_batch(paths, workers=0)
+
+    assert not parallel.cancelled
+    assert parallel.rows == sequential.rows
+    assert [row["File"] for row in parallel.rows] == [str(path) for path in paths]
+    assert sorted(done for done, _, _ in reported) == [1, 2, 3, 4]
+    assert all(row["Rows"] > 0 and row["Error"] == "" for row in parallel.rows)
+    cohort = parallel.cohort_summary()
+    assert cohort.keys() == sequential.cohort_summary().keys()
+    assert cohort["A12"]["mean"] == pytest.approx(
+        sum(row["A12_mean"] * row["Rows"] for row in parallel.rows) / sum(row["Rows"] for row in parallel.rows)
+    )
+    assert cohort["A13"]["min"] <= cohort["A13"]["median"] <= cohort["A13"]["max"]
+
+
+def test_cancellation_stops_before_remaining_files():
+    paths = session_batch.find_session_files(DATA_DIR)[:3]
+    cancel = threading.Event()
+
+    result = session_batch.run_batch(paths, workers=0, progress=lambda *args: cancel.set(), cancel=cancel)
+
+    assert result.cancelled
+    assert len(result.rows) == 1
+
+
+def test_unreadable_file_is_reported_and_summary_is_written(tmp_path):
+    missing = tmp_path / "missing.csv"
+    output = tmp_path / "summary.csv"
+
+    result = session_batch.run_batch([missing], workers=0)
+    session_batch.write_summary_csv(result.rows, output)
+
+    rows = list(csv.DictReader(output.open(encoding="utf-8")))
+    assert rows[0]["File"] == str(missing)
+    assert rows[0]["Error"].startswith("FileNotFoundError")
+
+
+def test_unexpected_failure_does_not_abort_the_batch(monkeypatch):
+    paths = session_batch.find_session_files(DATA_DIR)[:2]
+    compute = session_batch.compute_metrics_for_columns
+    calls = []
+
+    def failing(columns, max_reasonable_speed):
+        calls.append(columns)
+        if len(calls) == 1:
+            raise RuntimeError("fallo inesperado")
+        return compute(columns, max_reasonable_speed)
+
+    monkeypatch.setattr(session_batch, "compute_metrics_for_columns", failing)
+    result = session_batch.run_batch(paths, workers=0)
+
+    assert result.rows[0]["Error"] == "RuntimeError: fallo inesperado"
+    assert result.rows[1]["Error"] == "" and result.rows[1]["Rows"] > 0
+
+
+def test_crashed_worker_only_fails_its_own_session(monkeypatch, tmp_path):
+    paths = session_batch.find_session_files(DATA_DIR)[:5]
+    paths.insert(2, tmp_path / "crash.csv")
+    monkeypatch.setattr(session_batch, "_analyse_session", _crash_on_missing)
+
+    result = session_batch.run_batch(paths, workers=2)
+
+    assert [row["File"] for row in result.rows] == [str(path) for path in paths]
+    assert result.rows[2]["Error"].startswith("BrokenProcessPool")
+    assert all(row["Error"] == "" and row["Rows"] > 0 for index, row in enumerate(result.rows) if index != 2)
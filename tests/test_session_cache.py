@@ -0,0 +1,73 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+
+import numpy as np
+
+from core import session_cache, session_columns
+
+CONTENT = (
+    "SchemaVersion,SessionID,UserID,TimeStamp,UserX,VertexDelta\n"
+    "2,s-1,u-1,0,0,1\n"
+    "2,s-1,u-1,1,2,bad\n"
+)
+
+
+def _columns_equal(first, second):
+    for name in session_columns.NUMERIC_COLUMNS:
+        np.testing.assert_array_equal(first[name], second[name])
+    for name in session_columns.TEXT_COLUMNS:
+        assert list(first[name]) == list(second[name])
+    assert first.invalid == second.invalid
+
+
+def test_second_load_is_memory_mapped_from_cache(tmp_path, monkeypatch):
+    path = tmp_path / "session.csv"
+    path.write_text(CONTENT, encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    first = session_cache.load_session_columns_cached(path, cache_dir)
+    monkeypatch.setattr(session_cache, "parse_session_csv", None)
+    second = session_cache.load_session_columns_cached(path, cache_dir)
+
+    _columns_equal(first, session_columns.parse_session_csv(CONTENT))
+    _columns_equal(second, first)
+    assert isinstance(second["TimeStamp"].base, np.memmap)
+
+
+def test_touched_file_reuses_entry_and_changed_file_replaces_it(tmp_path):
+    path = tmp_path / "session.csv"
+    path.write_text(CONTENT, encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    session_cache.load_session_columns_cached(path, cache_dir)
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    session_cache.load_session_columns_cached(path, cache_dir)
+    entries = [entry for entry in cache_dir.iterdir() if entry.is_dir()]
+    assert len(entries) == 1
+
+    # Una copia con el contenido anterior mantiene viva su entrada.
+    copy = tmp_path / "copy.csv"
+    copy.write_text(CONTENT, encoding="utf-8")
+    session_cache.load_session_columns_cached(copy, cache_dir)
+
+    for rows in ("2,s-1,u-1,2,5,0\n", "2,s-1,u-1,2,5,0\n2,s-1,u-1,3,6,0\n"):
+        path.write_text(CONTENT + rows, encoding="utf-8")
+        columns = session_cache.load_session_columns_cached(path, cache_dir)
+    assert columns["UserX"].tolist() == [0.0, 2.0, 5.0, 6.0]
+    assert sorted(entry.name for entry in cache_dir.iterdir() if entry.is_dir()) == sorted([
+        entries[0].name, session_cache.content_digest(path.read_bytes()),
+    ])
+
+
+def test_empty_session_round_trips(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("TimeStamp,UserX\n", encoding="utf-8")
+
+    session_cache.load_session_columns_cached(path, tmp_path / "cache")
+    columns = session_cache.load_session_columns_cached(path, tmp_path / "cache")
+
+    assert len(columns) == 0
@@ -0,0 +1,115 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import csv
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tests._project_loader import load_project_module
+
+session_columns = load_project_module(
+    "session_columns",
+    "session_columns.py",
+    preferred_roots=("core",),
+)
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "datos_analisis"
+
+
+def _row(timestamp, **values):
+    row = {"TimeStamp": str(timestamp), "UserX": "0", "UserY": "0", "UserZ": "0"}
+    row.update({key: str(value) for key, value in values.items()})
+    return row
+
+
+def test_pause_duration_and_speed_from_rows():
+    rows = [_row(timestamp, UserX=timestamp) for timestamp in [*range(10), 109]]
+
+    metrics = session_columns.compute_metrics_for_rows(rows, max_reasonable_speed=10_000.0)
+
+    assert metrics["A1"][-1] == pytest.approx(109 / 3600.0)
+    assert metrics["A2"][-1] == 100.0
+    assert metrics["A2"][:-1] == [0.0] * 10
+    assert metrics["A3"] == metrics["A2"]
+    assert metrics["A4"][1] == pytest.approx(3600.0)
+    assert metrics["A9"][-1] == pytest.approx(109.0)
+
+
+def test_edit_events_are_not_pauses_and_split_speeds():
+    rows = [_row(timestamp, UserX=timestamp) for timestamp in range(10)]
+    rows.append(_row(109, UserX=10, VertexDelta=4))
+
+    metrics = session_columns.compute_metrics_for_rows(rows)
+
+    assert metrics["A2"][-1] == 0.0
+    assert metrics["A7"][-1] == 0.0
+    assert metrics["A8"][-1] == pytest.approx(3600.0 / 100.0)
+    assert metrics["A7"][1] == pytest.approx(3600.0)
+
+
+def test_strategy_and_state_columns():
+    rows = [
+        _row(0),
+        _row(1, CtrlV=1, ShiftD=-2, AltD=3, ModifierDelta=4, ObjectDelta=5, UV=6,
+             NgonDelta=-1, TriDelta=2, NormalDelta=-3, VertexDelta=-7,
+             EditModeState=1, ObjModeState=0),
+        _row(2, ObjModeState=1),
+    ]
+
+    metrics = session_columns.compute_metrics_for_rows(rows)
+
+    assert metrics["A10"][1] == 6.0
+    assert metrics["A11"][1] == 4.0
+    assert metrics["A12"][1] == -7.0
+    assert metrics["A13"][1] == 6.0
+    assert metrics["A14"] == [0.0, 2.0, 1.0]
+    assert metrics["A15"][1] == 6.0
+    assert metrics["A16"][1] == 5.0
+    assert "A17" not in metrics
+
+
+def test_proximity_discounts_object_radius():
+    rows = [_row(0, UserX=5, ObjX=1, ObjRadius=1), _row(1, UserX=1.5, ObjX=1, ObjRadius=1)]
+
+    metrics = session_columns.compute_metrics_for_rows(rows)
+
+    assert metrics["A5"] == [3.0, 0.0]
+
+
+def test_empty_input_returns_every_metric():
+    metrics = session_columns.compute_metrics_for_rows([])
+
+    assert set(metrics) == set(session_columns.METRIC_IDS)
+    assert metrics["A1"] == []
+
+
+def test_invalid_values_become_zero_and_are_counted():
+    columns = session_columns.columns_from_rows([_row(0, VertexDelta="bad"), _row(1, VertexDelta="nan")])
+
+    assert columns["VertexDelta"].tolist() == [0.0, 0.0]
+    assert columns.invalid == {"VertexDelta": 2}
+
+
+def test_v1_header_is_mapped_to_v2_names():
+    columns = session_columns.parse_session_csv("USER_ID,TimeStamp,UserX\nabc,1.5,2\n")
+
+    assert columns["UserID"].tolist() == ["abc"]
+    assert columns["TimeStamp"].tolist() == [1.5]
+    assert columns["ObjRadius"].tolist() == [0.0]
+
+
+@pytest.mark.skipif(not DATA_DIR.is_dir(), reason="Sin datos de ejemplo.")
+def test_columnar_loader_matches_row_adapter_on_sample_session():
+    path = sorted(DATA_DIR.glob("*.csv"))[0]
+    with path.open(encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+
+    from_columns = session_columns.compute_metrics_for_columns(session_columns.load_session_columns(path))
+    from_rows = session_columns.compute_metrics_for_rows(rows)
+
+    assert len(from_columns["A1"]) == len(rows)
+    for metric in session_columns.METRIC_IDS:
+        np.testing.assert_allclose(from_columns[metric], from_rows[metric])
@@ -0,0 +1,81 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import types
+
+from core.session_live import LiveSessionTail, textblock_source
+
+HEADER = "TimeStamp,UserX,UserY,UserZ\n"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_file_tail_is_throttled_and_notifies_only_new_rows(tmp_path):
+    path = tmp_path / "blender_data_log.csv"
+    clock = _Clock()
+    tail = LiveSessionTail(path, min_interval=1.0, clock=clock)
+    updates = []
+    tail.add_listener(lambda summary, new_rows: updates.append((summary["Rows"], new_rows)))
+
+    assert tail.poll() == 0
+    path.write_text(HEADER + "0,0,0,0\n1,1,0,0\n", encoding="utf-8")
+    assert tail.poll() is None
+    clock.now = 1.0
+    assert tail.poll() == 2
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("2,3,0,0\n")
+    clock.now = 2.5
+    assert tail.poll() == 1
+    clock.now = 4.0
+    assert tail.poll() == 0
+
+    assert updates == [(2, 2), (3, 1)]
+    assert tail.accumulator.summary()["A9_max"] == 3.0
+
+
+def test_textblock_source_and_timer_callback():
+    text = types.SimpleNamespace(content=HEADER + "0,0,0,0\n")
+    texts = {"data_log_internal.csv": types.SimpleNamespace(as_string=lambda: text.content)}
+    tail = LiveSessionTail(textblock_source(texts), min_interval=0.5)
+
+    assert tail.timer() == 0.5
+    text.content += "1,2,0,0\n"
+    assert tail.timer() == 0.5
+    assert tail.accumulator.summary()["Rows"] == 2
+
+    tail.stop()
+    assert tail.timer() is None
+
+
+def test_rewritten_log_is_reread_from_the_start(tmp_path):
+    path = tmp_path / "blender_data_log.csv"
+    path.write_text(HEADER + "0,0,0,0\n1,1,0,0\n1,1,0,0\n2,2,0,0\n", encoding="utf-8")
+    tail = LiveSessionTail(path, min_interval=0.0)
+    tail.poll()
+
+    # El logger quita filas duplicadas reescribiendo el archivo.
+    path.write_text(HEADER + "0,0,0,0\n1,1,0,0\n2,2,0,0\n3,3,0,0\n", encoding="utf-8")
+
+    tail.poll()
+    assert tail.accumulator.summary()["Rows"] == 4
+
+
+def test_timer_keeps_running_after_a_failed_poll(caplog):
+    contents = [b"\xff\xfe not utf-8\n", HEADER + "0,0,0,0\n"]
+    tail = LiveSessionTail(lambda: contents[0])
+
+    assert tail.timer() == tail.min_interval
+    assert isinstance(tail.last_error, UnicodeDecodeError)
+    assert "UnicodeDecodeError" in caplog.text
+
+    contents.pop(0)
+    assert tail.timer() == tail.min_interval
+    assert tail.last_error is None
+    assert tail.accumulator.rows == 1
@@ -0,0 +1,68 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+from core.shape_signature import (
+    ShapeSignature,
+    compute_signature,
+    rank_candidates,
+    signature_distance,
+)
+from core.surface_distance import fan_triangles
+
+CUBE_FACES = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+
+
+def _box(x, y, z):
+    vertices = np.array([(i * x, j * y, k * z) for i in (0, 1) for j in (0, 1) for k in (0, 1)], dtype=float)
+    return vertices, fan_triangles(CUBE_FACES)
+
+
+def _plane():
+    return np.array([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], dtype=float), fan_triangles([(0, 1, 2, 3)])
+
+
+def test_signature_ignores_translation_and_scale():
+    vertices, triangles = _box(1.0, 2.0, 3.0)
+
+    original = compute_signature(vertices, triangles)
+    moved = compute_signature(vertices * 4.0 + [10.0, -3.0, 2.0], triangles)
+
+    assert signature_distance(original, moved) == pytest.approx(0.0, abs=1e-9)
+    assert original.extents == pytest.approx([1 / 3, 2 / 3, 1.0])
+
+
+def test_counts_use_original_polygons_when_given():
+    vertices, triangles = _box(1.0, 1.0, 1.0)
+
+    assert compute_signature(vertices, triangles, polygons=CUBE_FACES).counts.tolist() == [8, 12, 6]
+    assert compute_signature(vertices, triangles).counts.tolist() == [8, 18, 12]
+
+
+def test_ranking_puts_the_matching_shape_first():
+    signatures = {
+        "plane": compute_signature(*_plane()),
+        "cube": compute_signature(*_box(1.0, 1.0, 1.0)),
+        "tower": compute_signature(*_box(1.0, 1.0, 5.0)),
+    }
+    query = compute_signature(*_box(2.0, 2.1, 2.0), seed=1)
+
+    ranking = rank_candidates(query, signatures)
+
+    assert [name for name, _ in ranking] == ["cube", "tower", "plane"]
+    assert ranking[0][1] < 0.1 < ranking[-1][1] <= 1.0
+    assert rank_candidates(query, signatures, top_k=1) == ranking[:1]
+
+
+def test_signature_round_trip_and_empty_mesh():
+    signature = compute_signature(*_box(1.0, 2.0, 1.0))
+    restored = ShapeSignature.from_dict(signature.to_dict())
+
+    assert signature_distance(signature, restored) == 0.0
+    np.testing.assert_array_equal(restored.voxels, signature.voxels)
+    empty = compute_signature([], [])
+    assert empty.counts.tolist() == [0, 0, 0]
+    assert signature_distance(empty, signature) > 0.5
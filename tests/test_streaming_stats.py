@@ -0,0 +1,79 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+from core.streaming_stats import KLLSketch, LogHistogram, MetricStream, Moments
+
+
+def _max_rank_error(values, sketch, fractions):
+    ordered = np.sort(values)
+    ranks = np.searchsorted(ordered, sketch.quantiles(fractions), side="right") / ordered.size
+    return float(np.abs(ranks - fractions).max())
+
+
+def test_moments_in_blocks_and_merged_match_numpy():
+    values = np.random.default_rng(4).normal(1e6, 3.0, 10_000)
+    first, second = Moments(), Moments()
+    for block in np.array_split(values[:7_000], 13):
+        first.update(block)
+    second.update(values[7_000:])
+
+    first.merge(second)
+
+    assert first.count == values.size
+    assert first.mean == pytest.approx(values.mean(), rel=1e-12)
+    assert first.variance == pytest.approx(values.var(), rel=1e-9)
+    assert (first.minimum, first.maximum) == (values.min(), values.max())
+
+
+def test_kll_rank_error_stays_within_bound_and_memory_is_bounded():
+    values = np.random.default_rng(5).lognormal(size=200_000)
+    fractions = np.linspace(0.01, 0.99, 99)
+    sketch = KLLSketch(k=200)
+    sketch.update(values)
+
+    assert _max_rank_error(values, sketch, fractions) < 0.0165
+    assert sum(level.size for level in sketch.levels) < 3 * 200 + 2 * len(sketch.levels)
+
+
+def test_merged_sketches_summarise_a_cohort():
+    rng = np.random.default_rng(6)
+    sessions = [rng.exponential(scale, 20_000) for scale in (1.0, 2.0, 5.0)]
+    cohort = MetricStream()
+    for values in sessions:
+        stream = MetricStream()
+        stream.update(values)
+        cohort.merge(MetricStream.from_dict(stream.to_dict()))
+
+    values = np.concatenate(sessions)
+    summary = cohort.summary()
+    assert summary["mean"] == pytest.approx(values.mean())
+    assert summary["std"] == pytest.approx(values.std())
+    assert _max_rank_error(values, cohort.sketch, np.array([0.25, 0.5, 0.75])) < 0.0165
+    assert summary["q1"] <= summary["median"] <= summary["q3"]
+
+
+def test_log_histogram_tail_is_exact_outside_the_threshold_bucket():
+    values = np.random.default_rng(8).lognormal(size=50_000)
+    merged, second = LogHistogram(), LogHistogram()
+    merged.update(values[:20_000])
+    second.update(np.concatenate([values[20_000:], [0.0, -1.0, np.inf]]))
+    merged.merge(second)
+    restored = LogHistogram.from_dict(merged.to_dict())
+
+    assert restored.count == values.size
+    assert restored.keys.size < 16 * 40
+    for threshold in (0.0, float(np.quantile(values, 0.9)), 2.0 ** 1.5, 1e9):
+        counts, totals, squares, _, maxima = restored.above(threshold)
+        tail = values[values >= threshold]
+        bucket = np.floor(np.log2(threshold) * 16) / 16 if threshold > 0 else -np.inf
+        exact = threshold <= values.min() or threshold > values.max() or np.log2(threshold) == bucket
+        tolerance = 1e-12 if exact else 0.05
+        assert counts.sum() == pytest.approx(tail.size, rel=tolerance, abs=1)
+        assert totals.sum() == pytest.approx(tail.sum(), rel=tolerance)
+        assert squares.sum() == pytest.approx(np.square(tail).sum(), rel=tolerance)
+        if tail.size:
+            assert maxima[-1] == tail.max()
@@ -0,0 +1,122 @@
+# Herramientas para la monitorización y análisis de procesos de modelado 3D en Blender
+# Copyright (C) 2026 María Molina Goyena
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+from core import surface_distance
+from core.surface_distance import (
+    TriangleBVH,
+    closest_points_on_triangles,
+    fan_triangles,
+    sample_surface,
+    surface_distance_summary,
+    surface_similarity,
+)
+
+
+def _grid_plane(size, height=0.0):
+    xs, ys = np.meshgrid(np.linspace(0.0, 1.0, size), np.linspace(0.0, 1.0, size))
+    vertices = np.column_stack([xs.ravel(), ys.ravel(), np.full(xs.size, height)])
+    index = np.arange(size * size).reshape(size, size)
+    quads = np.column_stack([index[:-1, :-1].ravel(), index[:-1, 1:].ravel(),
+                             index[1:, 1:].ravel(), index[1:, :-1].ravel()])
+    return vertices, fan_triangles(quads.tolist())
+
+
+def _uv_sphere(rings, segments):
+    theta = np.linspace(0.0, np.pi, rings + 1)[1:-1]
+    phi = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False)
+    ring = np.column_stack([np.outer(np.sin(theta), np.cos(phi)).ravel(),
+                            np.outer(np.sin(theta), np.sin(phi)).ravel(),
+                            np.repeat(np.cos(theta), segments)])
+    vertices = np.vstack([[0.0, 0.0, 1.0], ring, [0.0, 0.0, -1.0]])
+    index = 1 + np.arange((rings - 1) * segments).reshape(rings - 1, segments)
+    following = np.roll(index, -1, axis=1)
+    south = len(vertices) - 1
+    triangles = np.vstack([
+        np.column_stack([np.zeros(segments, dtype=np.int64), index[0], following[0]]),
+        np.column_stack([index[:-1].ravel(), index[1:].ravel(), following[1:].ravel()]),
+        np.column_stack([index[:-1].ravel(), following[1:].ravel(), following[:-1].ravel()]),
+        np.column_stack([index[-1], np.full(segments, south), following[-1]]),
+    ])
+    return vertices, triangles
+
+
+def _all_triangles_distance(points, vertices, triangles):
+    count = triangles.shape[0]
+    repeated = np.repeat(points, count, axis=0)
+    corners = [np.tile(vertices[triangles[:, corner]], (points.shape[0], 1)) for corner in range(3)]
+    closest = closest_points_on_triangles(repeated, *corners)
+    return np.linalg.norm(closest - repeated, axis=1).reshape(-1, count).min(axis=1)
+
+
+def test_closest_point_regions():
+    a, b, c = np.array([[0.0, 0.0, 0.0]]), np.array([[1.0, 0.0, 0.0]]), np.array([[0.0, 1.0, 0.0]])
+    points = np.array([[0.2, 0.2, 1.0], [-1.0, -1.0, 0.0], [0.5, -2.0, 0.0], [1.0, 1.0, 0.0]])
+    expected = np.array([[0.2, 0.2, 0.0], [0.0, 0.0, 0.0], [0.5, 0.0, 0.0], [0.5, 0.5, 0.0]])
+    corners = [np.repeat(vertex, 4, axis=0) for vertex in (a, b, c)]
+
+    assert closest_points_on_triangles(points, *corners) == pytest.approx(expected)
+
+
+def test_bvh_matches_every_triangle_including_degenerate_ones():
+    rng = np.random.default_rng(5)
+    vertices = rng.random((200, 3))
+    triangles = rng.integers(0, 200, (300, 3))
+    triangles[:5, 1] = triangles[:5, 0]
+    vertices[triangles[5:10, 2]] = 0.5 * (vertices[triangles[5:10, 0]] + vertices[triangles[5:10, 1]])
+    points = rng.random((400, 3)) * 1.6 - 0.3
+
+    distances = TriangleBVH(vertices, triangles).distances(points)
+
+    assert distances == pytest.approx(_all_triangles_distance(points, vertices, triangles), abs=1e-12)
+
+
+def test_sampling_is_area_weighted_and_deterministic():
+    vertices = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (3.0, 0.0, 0.0), (3.0, 3.0, 0.0)]
+    triangles = [(0, 1, 2), (1, 3, 4)]
+
+    first = sample_surface(vertices, triangles, 20_000, seed=3)
+    again = sample_surface(vertices, triangles, 20_000, seed=3)
+
+    np.testing.assert_array_equal(first, again)
+    # Áreas 0,5 y 3: uno de cada siete puntos cae en el primer triángulo.
+    in_first = (first[:, 0] + first[:, 1] <= 1.0 + 1e-12) & (first[:, 0] <= 1.0)
+    assert in_first.mean() == pytest.approx(1 / 7, abs=0.01)
+    assert sample_surface(vertices, [], 10).shape == (0, 3)
+
+
+def test_similarity_ignores_tessellation_density():
+    coarse = _grid_plane(2)
+    fine = _grid_plane(11)
+
+    assert surface_similarity(*fine, *coarse, samples=2_000) == 100.0
+    summary = surface_distance_summary(*_grid_plane(6, height=0.1), *coarse, samples=2_000)
+    assert summary["Hausdorff"] == pytest.approx(0.1)
+    assert summary["mesh_to_reference_mean"] == pytest.approx(0.1)
+    assert 0.0 < surface_similarity(*_grid_plane(6, height=0.1), *coarse) < 100.0
+
+
+def test_similarity_without_area_is_zero():
+    assert surface_similarity([], [], *_grid_plane(2)) == 0.0
+
+
+def test_frontier_stays_bounded_inside_a_closed_sphere(monkeypatch):
+    # Desde cerca del centro casi ningún triángulo se puede descartar.
+    vertices, triangles = _uv_sphere(40, 64)
+    points = np.random.default_rng(2).normal(scale=0.01, size=(60, 3))
+    largest = []
+    box_distance = surface_distance._box_distance_squared
+
+    def recording(points, lower, upper):
+        largest.append(points.shape[0])
+        return box_distance(points, lower, upper)
+
+    monkeypatch.setattr(surface_distance, "FRONTIER_LIMIT", 256)
+    monkeypatch.setattr(surface_distance, "_box_distance_squared", recording)
+    distances = TriangleBVH(vertices, triangles).distances(points)
+
+    assert max(largest) <= 256
+    assert distances == pytest.approx(_all_triangles_distance(points, vertices, triangles), abs=1e-12)